@@ -0,0 +1,236 @@
+import json
+import math
+import sqlite3
+import urllib.request
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from change_events import SnapshotListener, calculate_ratio
+from enhanced_database_setup import create_alert_table
+
+
+class ProgramState:
+    """학과/전형별 롤링 상태 (EWMA 평균/분산과 마지막 관측값)."""
+
+    __slots__ = ('last_time', 'last_applicants', 'last_ratio', 'ewma_rate', 'ewma_var', 'samples')
+
+    def __init__(self, snapshot_time: datetime, applicants: int, ratio: float):
+        self.last_time = snapshot_time
+        self.last_applicants = applicants
+        self.last_ratio = ratio
+        self.ewma_rate = 0.0
+        self.ewma_var = 0.0
+        self.samples = 0
+
+
+class FileAlertSink:
+    """알림을 JSON Lines 파일에 추가합니다."""
+
+    def __init__(self, path='competition_alerts.jsonl'):
+        self.path = path
+
+    def send(self, alerts: List[Dict]):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for alert in alerts:
+                f.write(json.dumps(alert, ensure_ascii=False) + '\n')
+
+
+class WebhookAlertSink:
+    """알림 배치를 JSON으로 웹훅 URL에 POST합니다 (슬랙/이메일 연동 대체용)."""
+
+    def __init__(self, url: str, timeout=5):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, alerts: List[Dict]):
+        body = json.dumps({'alerts': alerts}, ensure_ascii=False).encode('utf-8')
+        request = urllib.request.Request(
+            self.url, data=body, headers={'Content-Type': 'application/json; charset=utf-8'}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class StreamingChangeDetector(SnapshotListener):
+    """스냅샷 저장 경로에서 동작하는 경쟁률 급변/임계값 감지기입니다.
+
+    프로그램별로 분당 지원자 증가율의 EWMA 평균과 분산을 유지하고,
+    최신 증가율의 z-score와 경쟁률 임계값 통과 여부를 행마다 O(1)로 계산합니다.
+    과거 스냅샷은 시작 시 seed_from_db()로 한 번만 읽습니다.
+
+    상태는 메모리에만 있으므로, seed_from_db()를 부르지 않으면 재시작 후 프로그램마다
+    min_samples + 1개의 스냅샷이 쌓일 때까지 급변 알림이 나오지 않습니다 (warm-up).
+    알림은 쓰기 스레드의 연결이 아닌 감지기 자신의 연결로 db_path에 저장합니다.
+    """
+
+    def __init__(self, db_path='competition_ratio_enhanced.db', sinks=None, alpha=0.3, z_threshold=3.0,
+                 min_samples=3, min_std=0.1, ratio_thresholds=(1.0,)):
+        self.db_path = db_path
+        self.sinks = list(sinks) if sinks else []
+        self.alpha = alpha
+        self.z_threshold = z_threshold
+        self.min_samples = min_samples
+        # 증가율이 일정한 구간에서 분산이 0이 되어 z-score가 정의되지 않는 것을 방지 (명/분)
+        self.min_std = min_std
+        self.ratio_thresholds = sorted(ratio_thresholds)
+        self.states: Dict[Tuple[str, str, str], ProgramState] = {}
+        self._table_ready = False
+
+    def seed_from_db(self, partition_dir: Optional[str] = None, samples=20) -> int:
+        """시작 시 한 번, 프로그램별 최근 스냅샷 samples개로 EWMA 상태를 채웁니다.
+
+        재생 중에 생기는 알림은 버립니다. partition_dir을 주면 최근 월별 파티션에서 읽습니다.
+        반환값은 상태를 채운 프로그램 수입니다.
+        """
+        if partition_dir:
+            from partitioned_store import PartitionRouter
+            conn = PartitionRouter(self.db_path, partition_dir).connect_latest(read_only=True)
+        else:
+            conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+
+        rows = conn.execute('''
+            WITH recent AS (
+                SELECT
+                    university_id, department_id, admission_type_id,
+                    recruitment_count, applicant_count, snapshot_time,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY university_id, department_id, admission_type_id
+                        ORDER BY snapshot_time DESC
+                    ) as rn
+                FROM competition_snapshots
+            )
+            SELECT u.code as university_code, d.name as department, at.name as admission_type,
+                   r.recruitment_count, r.applicant_count, r.snapshot_time
+            FROM recent r
+            JOIN universities u ON r.university_id = u.id
+            JOIN departments d ON r.department_id = d.id
+            JOIN admission_types at ON r.admission_type_id = at.id
+            WHERE r.rn <= ?
+            ORDER BY r.snapshot_time
+        ''', (samples,)).fetchall()
+        conn.close()
+
+        for row in rows:
+            self.observe(dict(row))
+
+        return len(self.states)
+
+    def on_snapshots(self, snapshots: List[Dict], conn: sqlite3.Connection = None):
+        """커밋된 스냅샷 배치를 처리하고 알림을 테이블과 싱크로 내보냅니다.
+
+        conn(쓰기 스레드의 연결)은 쓰지 않습니다. 그 연결의 트랜잭션은 쓰기 스레드가 관리합니다.
+        """
+        alerts = []
+        for snapshot in snapshots:
+            alerts.extend(self.observe(snapshot))
+
+        if not alerts:
+            return
+
+        self.save_alerts(alerts)
+
+        for sink in self.sinks:
+            try:
+                sink.send(alerts)
+            except Exception as e:
+                print(f"알림 전송 오류 ({type(sink).__name__}): {e}")
+
+    def observe(self, snapshot: Dict) -> List[Dict]:
+        """스냅샷 한 건으로 상태를 갱신하고 발생한 알림 목록을 반환합니다."""
+        key = (snapshot['university_code'], snapshot['department'], snapshot['admission_type'])
+        snapshot_time = datetime.strptime(snapshot['snapshot_time'], '%Y-%m-%d %H:%M:%S')
+        applicants = snapshot['applicant_count']
+        ratio = calculate_ratio(snapshot['recruitment_count'], applicants)
+
+        state = self.states.get(key)
+        if state is None:
+            self.states[key] = ProgramState(snapshot_time, applicants, ratio)
+            return []
+
+        alerts = []
+        elapsed_minutes = (snapshot_time - state.last_time).total_seconds() / 60
+        z_score = None
+
+        if elapsed_minutes > 0:
+            rate = (applicants - state.last_applicants) / elapsed_minutes
+
+            # 직전까지의 EWMA 기준으로 최신 증가율의 z-score 계산
+            if state.samples >= self.min_samples:
+                z_score = (rate - state.ewma_rate) / max(math.sqrt(state.ewma_var), self.min_std)
+                if abs(z_score) >= self.z_threshold:
+                    direction = '급증' if z_score > 0 else '급감'
+                    alerts.append(self.build_alert(
+                        snapshot, 'SPIKE', ratio, state.ewma_rate, z_score, None,
+                        f"지원자 {direction}: 분당 {rate:+.2f}명 (평균 {state.ewma_rate:+.2f}, z={z_score:+.1f})"
+                    ))
+
+            # EWMA 평균/분산 갱신
+            if state.samples == 0:
+                state.ewma_rate = rate
+            else:
+                diff = rate - state.ewma_rate
+                increment = self.alpha * diff
+                state.ewma_rate += increment
+                state.ewma_var = (1 - self.alpha) * (state.ewma_var + diff * increment)
+            state.samples += 1
+
+        for threshold in self.ratio_thresholds:
+            if state.last_ratio < threshold <= ratio:
+                alerts.append(self.build_alert(
+                    snapshot, 'THRESHOLD_UP', ratio, state.ewma_rate, z_score, threshold,
+                    f"경쟁률 {threshold:.2f}:1 돌파 ({state.last_ratio:.3f} → {ratio:.3f})"
+                ))
+            elif ratio < threshold <= state.last_ratio:
+                alerts.append(self.build_alert(
+                    snapshot, 'THRESHOLD_DOWN', ratio, state.ewma_rate, z_score, threshold,
+                    f"경쟁률 {threshold:.2f}:1 하회 ({state.last_ratio:.3f} → {ratio:.3f})"
+                ))
+
+        state.last_time = snapshot_time
+        state.last_applicants = applicants
+        state.last_ratio = ratio
+
+        return alerts
+
+    def build_alert(self, snapshot: Dict, alert_type: str, ratio: float, ewma_rate: float,
+                    z_score: Optional[float], threshold: Optional[float], message: str) -> Dict:
+        return {
+            'university_code': snapshot['university_code'],
+            'college': snapshot.get('college'),
+            'department': snapshot['department'],
+            'admission_type': snapshot['admission_type'],
+            'alert_type': alert_type,
+            'message': message,
+            'applicant_count': snapshot['applicant_count'],
+            'competition_ratio': ratio,
+            'ewma_rate': ewma_rate,
+            'z_score': z_score,
+            'threshold': threshold,
+            'snapshot_time': snapshot['snapshot_time'],
+            'crawl_session_id': snapshot.get('crawl_session_id')
+        }
+
+    def save_alerts(self, alerts: List[Dict]):
+        """알림을 감지기 자신의 연결로 competition_alerts 테이블에 저장합니다."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        cursor = conn.cursor()
+
+        if not self._table_ready:
+            create_alert_table(cursor)
+            self._table_ready = True
+
+        cursor.executemany('''
+            INSERT INTO competition_alerts
+            (university_code, college, department, admission_type, alert_type, message,
+             applicant_count, competition_ratio, ewma_rate, z_score, threshold,
+             snapshot_time, crawl_session_id)
+            VALUES (:university_code, :college, :department, :admission_type, :alert_type, :message,
+                    :applicant_count, :competition_ratio, :ewma_rate, :z_score, :threshold,
+                    :snapshot_time, :crawl_session_id)
+        ''', alerts)
+        conn.commit()
+        conn.close()
+
+        for alert in alerts:
+            print(f"🚨 [{alert['university_code']}] {alert['department']} ({alert['admission_type']}): {alert['message']}")
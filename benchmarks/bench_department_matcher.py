@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+대상 학과 매처 벤치마크
+사용법: python3 benchmarks/bench_department_matcher.py [--rows 20000] [--targets 3 30 300]
+
+기존 방식(any() 부분 문자열 검사 + 정규식 정리 + 규칙 순차 검사)과
+컴파일된 오토마톤(SiteAdapter.matcher)의 행 처리량을 비교하고 결과가 같은지 확인합니다.
+match()는 패턴 수에 따라 두 경로 중 하나를 고릅니다 (site_registry.MATCHER_MIN_PATTERNS).
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from site_registry import SiteAdapter
+
+WORDS = ['컴퓨터', '소프트웨어', 'AI', '빅데이터', '정보', '전자', '기계', '화학', '생명', '경영',
+         '게임', '모빌리티', '사이버보안', '데이터', '로봇', '반도체', '디자인', '미디어']
+DEFAULTS = {'strip_patterns': ['교직', 'RIS사업'], 'remove_tokens': ['[단과대학통합모집]']}
+
+
+def make_adapter(targets: int, match_mode: str) -> SiteAdapter:
+    """대상 학과 수가 targets개인 합성 어댑터를 생성합니다."""
+    names = set()
+    while len(names) < targets:
+        names.add(''.join(random.sample(WORDS, 3)) + '학과')
+    names = sorted(names)
+    return SiteAdapter({
+        'code': f'T{targets}',
+        'name': f'합성대학교{targets}',
+        'family': 'jinhakapply',
+        'url': 'https://example.com/ratio.html',
+        'target_college': '공과대학',
+        'target_departments': names,
+        'match_mode': match_mode,
+        'normalize': [[name[:-2], name] for name in names]
+    }, DEFAULTS)
+
+
+def make_rows(adapter: SiteAdapter, count: int):
+    """대상/비대상 학과가 섞인 (단과대학, 학과명) 행을 생성합니다."""
+    others = ['국어국문학과', '경영학과 교직', '[단과대학통합모집] 공과대학', '간호학과RIS사업', '체육학과']
+    rows = []
+    for _ in range(count):
+        if random.random() < 0.3:
+            department = random.choice(adapter.target_departments)
+            department += random.choice(['', ' 교직', '(야간)', 'RIS사업'])
+        else:
+            department = random.choice(others)
+        rows.append((random.choice(['공과대학', '인문대학']), department))
+    return rows
+
+
+def timed(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='대상 학과 매처 벤치마크')
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--targets', type=int, nargs='+', default=[3, 30, 300], help='대학교당 대상 학과 수')
+    parser.add_argument('--mode', default='college_or_department',
+                        choices=['college_and_department', 'college_or_department', 'college_else_department'])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    print(f"=== 대상 학과 매처 벤치마크 ({args.rows:,}행, {args.mode}) ===")
+    print(f"{'대상 학과 수':>10} {'기존 (행/초)':>14} {'오토마톤 (행/초)':>16} {'배율':>6} {'match() (행/초)':>16}")
+
+    for targets in args.targets:
+        adapter = make_adapter(targets, args.mode)
+        rows = make_rows(adapter, args.rows)
+
+        def baseline():
+            return [adapter.normalize(department) if adapter.is_target(college, department) else None
+                    for college, department in rows]
+
+        compiled_adapter = copy.copy(adapter)
+        compiled_adapter.use_matcher = True
+
+        def compiled():
+            return [compiled_adapter.match(college, department) for college, department in rows]
+
+        def selected():
+            return [adapter.match(college, department) for college, department in rows]
+
+        if not baseline() == compiled() == selected():
+            raise SystemExit(f"결과 불일치 (대상 학과 {targets}개)")
+
+        baseline_time = timed(baseline, args.repeat)
+        compiled_time = timed(compiled, args.repeat)
+        selected_time = timed(selected, args.repeat)
+        print(f"{targets:>10} {args.rows / baseline_time:>14,.0f} {args.rows / compiled_time:>16,.0f} "
+              f"{baseline_time / compiled_time:>5.1f}x {args.rows / selected_time:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+HTTP 전송 계층 벤치마크
+사용법: python3 benchmarks/bench_http_transport.py [--requests 20] [--rows 3000] [--latency-ms 30] [--bandwidth-kbps 4000]
+
+로컬 대역 서버(경쟁률 페이지 흉내)에 대해 기존 방식과 crawler_core.HttpFetcher를 비교합니다.
+  - 기존: 요청마다 새 세션(새 TCP 연결), response.text로 디코딩한 뒤 파싱
+  - 비압축: 기존 방식에서 Accept-Encoding: identity (압축 협상이 없을 때)
+  - 튜닝: 공유 세션의 keep-alive 연결, gzip 응답, bytes 그대로 파싱
+대역 서버는 새 연결마다 --latency-ms만큼 지연(핸드셰이크 왕복 흉내)하고
+--bandwidth-kbps로 전송 속도를 제한합니다.
+"""
+
+import argparse
+import gzip
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler_core import HttpFetcher, USER_AGENT, parse_jinhakapply_rows
+from site_registry import load_registry
+
+
+def make_page(rows: int) -> bytes:
+    """jinhakapply 형식의 합성 경쟁률 페이지를 생성합니다."""
+    colleges = ['소프트웨어융합대학', '인문대학', '공과대학', '사범대학']
+    departments = ['컴퓨터소프트웨어학부', 'AI빅데이터공학과', '소프트웨어융합학과', '국어국문학과', '경영학과 교직']
+    body = []
+    for section in ('학생부교과 교과전형', '학생부종합 종합전형'):
+        body.append(f'<h3>{section}</h3><table><tr><th>단과대학</th><th>모집단위</th>'
+                    f'<th>모집인원</th><th>지원인원</th><th>경쟁률</th></tr>')
+        for _ in range(rows // 2):
+            recruitment = random.randint(1, 80)
+            applicants = random.randint(0, 1500)
+            body.append(f'<tr><td>{random.choice(colleges)}</td><td>{random.choice(departments)}</td>'
+                        f'<td>{recruitment}</td><td>{applicants:,}</td><td>{applicants / recruitment:.2f} : 1</td></tr>')
+        body.append('</table>')
+    return ('<html><head><meta charset="utf-8"></head><body>' + ''.join(body) + '</body></html>').encode('utf-8')
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    page = b''
+    page_gzip = b''
+    latency = 0.0
+    bytes_per_second = 0
+    sent_bytes = 0
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with StandInHandler.lock:
+            StandInHandler.connections += 1
+        # 새 연결마다 핸드셰이크 왕복 지연
+        time.sleep(self.latency)
+
+    def do_GET(self):
+        use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = self.page_gzip if use_gzip else self.page
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+
+        chunk = 16384
+        for start in range(0, len(body), chunk):
+            self.wfile.write(body[start:start + chunk])
+            if self.bytes_per_second:
+                time.sleep(min(chunk, len(body) - start) / self.bytes_per_second)
+
+        with StandInHandler.lock:
+            StandInHandler.sent_bytes += len(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_scenario(label, fetch_once, parse, count):
+    StandInHandler.sent_bytes = 0
+    StandInHandler.connections = 0
+
+    fetch_time = 0.0
+    parse_time = 0.0
+    rows = 0
+    for _ in range(count):
+        start = time.perf_counter()
+        content = fetch_once()
+        fetch_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        rows = len(parse(content))
+        parse_time += time.perf_counter() - start
+
+    print(f"{label:<6} 가져오기 {fetch_time / count * 1000:8.1f} ms/회  파싱 {parse_time / count * 1000:7.1f} ms/회  "
+          f"전송 {StandInHandler.sent_bytes / count / 1024:7.1f} KiB/회  연결 {StandInHandler.connections:3d}개  "
+          f"(행 {rows})")
+    return fetch_time, parse_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTTP 전송 계층 벤치마크')
+    parser.add_argument('--requests', type=int, default=20)
+    parser.add_argument('--rows', type=int, default=3000, help='페이지 표의 행 수')
+    parser.add_argument('--latency-ms', type=float, default=30, help='새 연결당 지연')
+    parser.add_argument('--bandwidth-kbps', type=int, default=4000, help='전송 속도 제한 (0이면 제한 없음)')
+    args = parser.parse_args()
+
+    random.seed(0)
+    page = make_page(args.rows)
+    StandInHandler.page = page
+    StandInHandler.page_gzip = gzip.compress(page)
+    StandInHandler.latency = args.latency_ms / 1000
+    StandInHandler.bytes_per_second = args.bandwidth_kbps * 1000 // 8
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/Ratio.html"
+
+    adapter = load_registry().get('CKU')
+    devnull = open(os.devnull, 'w')
+
+    def parse(content):
+        stdout = sys.stdout
+        sys.stdout = devnull
+        try:
+            return parse_jinhakapply_rows(content, adapter)
+        finally:
+            sys.stdout = stdout
+
+    def legacy_fetch(headers):
+        session = requests.Session()
+        session.headers.update(headers)
+        response = session.get(url, timeout=30)
+        response.encoding = 'utf-8'
+        text = response.text
+        session.close()
+        return text
+
+    fetcher = HttpFetcher()
+
+    print(f"=== HTTP 전송 계층 벤치마크 ({args.requests}회, 페이지 {len(page) / 1024:.0f} KiB, "
+          f"gzip {len(StandInHandler.page_gzip) / 1024:.0f} KiB, 연결 지연 {args.latency_ms:g} ms, "
+          f"대역폭 {f'{args.bandwidth_kbps} kbps' if args.bandwidth_kbps else '무제한'}) ===")
+    legacy_fetch_time, legacy_parse_time = run_scenario('기존', lambda: legacy_fetch({'User-Agent': USER_AGENT}), parse, args.requests)
+    run_scenario('비압축', lambda: legacy_fetch({'User-Agent': USER_AGENT, 'Accept-Encoding': 'identity'}),
+                 parse, args.requests)
+    tuned_fetch_time, tuned_parse_time = run_scenario('튜닝', lambda: fetcher.fetch_bytes(url), parse, args.requests)
+    print(f"기존 대비: 가져오기 {legacy_fetch_time / tuned_fetch_time:.1f}배, "
+          f"가져오기+파싱 {(legacy_fetch_time + legacy_parse_time) / (tuned_fetch_time + tuned_parse_time):.2f}배")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
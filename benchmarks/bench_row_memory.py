@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+경쟁률 행 메모리 벤치마크
+사용법: python3 benchmarks/bench_row_memory.py [--rows 100000]
+
+파서가 만드는 행을 기존 dict 방식과 ParsedRow/CompetitionRecord 방식으로 각각 rows개 만들어
+tracemalloc으로 행당 메모리와 생성 시간을 비교합니다.
+표의 칸 텍스트는 get_text()처럼 행마다 새 문자열 객체로 만듭니다.
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from competition_record import CompetitionRecord, parsed_row
+
+COLLEGES = ['공과대학', '인문대학', 'IT공과대학', '소프트웨어융합대학', '자연과학대학']
+DEPARTMENTS = ['컴퓨터공학과', '소프트웨어학과', 'AI빅데이터공학과', '정보보안학과', '전자공학과', '기계공학과']
+ADMISSION_TYPES = ['교과전형', '종합전형', '지역교과전형', '기회균형전형', '일반전형']
+UNIVERSITIES = ['CKU', 'DGU', 'KNU', 'YU', 'KMU']
+
+
+def make_cells(count: int):
+    """(전형, 칸 텍스트) 행을 생성합니다. 문자열은 모두 새로 만든 객체입니다."""
+    rows = []
+    for _ in range(count):
+        recruitment = random.randint(1, 60)
+        cells = [''.join(list(random.choice(COLLEGES))), ''.join(list(random.choice(DEPARTMENTS))),
+                 str(recruitment), str(random.randint(0, recruitment * 15)), '']
+        rows.append((''.join(list(random.choice(ADMISSION_TYPES))), cells))
+    return rows
+
+
+def dict_rows(cell_rows):
+    """기존 방식: 파싱 단계 dict(칸 목록 보관) → 정리 단계 dict"""
+    parsed = [{'college': cells[0], 'department_raw': cells[1], 'admission_type': admission_type, 'cells': cells}
+              for admission_type, cells in cell_rows]
+    return [{
+        'university_code': UNIVERSITIES[index % len(UNIVERSITIES)],
+        'college': row['college'],
+        'department': row['department_raw'],
+        'admission_type': row['admission_type'],
+        'recruitment_count': int(row['cells'][2]),
+        'applicant_count': int(row['cells'][3])
+    } for index, row in enumerate(parsed)]
+
+
+def record_rows(cell_rows):
+    """새 방식: ParsedRow → CompetitionRecord"""
+    parsed = [parsed_row(cells, admission_type) for admission_type, cells in cell_rows]
+    return [CompetitionRecord(UNIVERSITIES[index % len(UNIVERSITIES)], row.college, row.department_raw,
+                              row.admission_type, int(row.recruitment_text), int(row.applicant_text))
+            for index, row in enumerate(parsed)]
+
+
+def measure(builder, count: int):
+    """행을 만들어 (유지 메모리, 최대 메모리, 소요 시간, 결과)를 반환합니다. 입력 칸 텍스트는 제외합니다."""
+    random.seed(0)
+    cell_rows = make_cells(count)
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = builder(cell_rows)
+    elapsed = time.perf_counter() - start
+    # 파서가 끝나면 원본 칸 목록은 버려지므로 결과 행이 붙잡고 있는 메모리만 남김
+    del cell_rows
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak, elapsed, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='경쟁률 행 메모리 벤치마크')
+    parser.add_argument('--rows', type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"=== 경쟁률 행 메모리 벤치마크 ({args.rows:,}행) ===")
+    print(f"{'방식':<20} {'유지 (바이트/행)':>16} {'최대 (MiB)':>12} {'생성 (행/초)':>14}")
+
+    results = {}
+    for name, builder in [('dict', dict_rows), ('CompetitionRecord', record_rows)]:
+        current, peak, elapsed, rows = measure(builder, args.rows)
+        results[name] = (current, rows)
+        print(f"{name:<20} {current / args.rows:>16,.0f} {peak / 1024 / 1024:>12,.1f} {args.rows / elapsed:>14,.0f}")
+
+    dict_result = results['dict'][1]
+    record_result = [record.as_dict() for record in results['CompetitionRecord'][1]]
+    if dict_result != record_result:
+        raise SystemExit("결과 불일치")
+    print(f"유지 메모리 {results['dict'][0] / results['CompetitionRecord'][0]:.1f}배 감소")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+사이트 어댑터 레지스트리 벤치마크
+사용법: python3 benchmarks/bench_site_registry.py [--schools 500] [--rows 20000]
+
+수백 개 대학교 설정의 로드/규칙 컴파일 시간과 행 판별/학과명 정리 처리량을 측정합니다.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from site_registry import build_registry, load_registry, read_registry_file
+
+WORDS = ['컴퓨터', '소프트웨어', 'AI', '빅데이터', '정보', '전자', '기계', '화학', '생명', '경영',
+         '게임', '모빌리티', '사이버보안', '데이터', '로봇', '반도체', '디자인', '미디어']
+
+
+def make_config(schools: int, targets_per_school: int) -> dict:
+    """합성 대학교 설정을 생성합니다."""
+    universities = []
+    for i in range(schools):
+        targets = [''.join(random.sample(WORDS, 2)) + '학과' for _ in range(targets_per_school)]
+        universities.append({
+            'code': f'U{i:04d}',
+            'name': f'합성대학교{i}',
+            'family': random.choice(['jinhakapply', 'uwayapply']),
+            'url': f'https://example.com/ratio/{i}.html',
+            'target_college': random.choice([None, '공과대학', 'IT대학']),
+            'target_departments': targets,
+            'match_mode': random.choice(['college_and_department', 'college_or_department',
+                                         'college_else_department']),
+            'normalize': [[t[:-2], t] for t in targets],
+            'seed_colleges': {'공과대학': targets}
+        })
+    return {'defaults': {'strip_patterns': ['교직', 'RIS사업'], 'remove_tokens': ['[단과대학통합모집]']},
+            'universities': universities}
+
+
+def timed(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사이트 어댑터 레지스트리 벤치마크')
+    parser.add_argument('--schools', type=int, default=500)
+    parser.add_argument('--targets', type=int, default=10, help='대학교별 대상 학과 수')
+    parser.add_argument('--rows', type=int, default=20000, help='판별할 행 수')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    config = make_config(args.schools, args.targets)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'site_adapters.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(config, f, ensure_ascii=False)
+
+        parse_time = timed(lambda: read_registry_file(path), args.repeat)
+        compile_time = timed(lambda: build_registry(config), args.repeat)
+        cold_time = timed(lambda: build_registry(read_registry_file(path)), args.repeat)
+
+        load_registry(path)
+        cached_time = timed(lambda: load_registry(path), args.repeat)
+        registry = load_registry(path)
+
+    adapters = list(registry)
+    rows = []
+    for _ in range(args.rows):
+        adapter = random.choice(adapters)
+        department = random.choice(adapter.target_departments + ('국어국문학과', '경영학과 교직'))
+        rows.append((adapter, random.choice(['공과대학', 'IT대학', '인문대학']), department))
+
+    def match_rows():
+        for adapter, college, department in rows:
+            if adapter.is_target(college, department):
+                adapter.normalize(department)
+
+    match_time = timed(match_rows, args.repeat)
+
+    print(f"=== 사이트 어댑터 레지스트리 벤치마크 ({args.schools}개 대학교, 대학교당 {args.targets}개 학과) ===")
+    print(f"설정 파일 파싱:        {parse_time * 1000:8.2f} ms")
+    print(f"규칙 컴파일:           {compile_time * 1000:8.2f} ms ({compile_time / args.schools * 1e6:.1f} µs/대학교)")
+    print(f"로드 전체 (캐시 없음): {cold_time * 1000:8.2f} ms")
+    print(f"로드 (캐시 재사용):    {cached_time * 1000:8.3f} ms")
+    print(f"행 판별 + 학과명 정리: {match_time * 1000:8.2f} ms ({args.rows / match_time:,.0f} 행/초)")
+
+
+if __name__ == "__main__":
+    main()
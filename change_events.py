@@ -0,0 +1,209 @@
+import json
+import queue
+import sqlite3
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+
+class SnapshotListener:
+    """스냅샷 저장 경로에 연결되는 리스너의 기본 클래스입니다.
+
+    크롤러는 스냅샷 배치를 커밋한 직후 `on_snapshots`를 호출합니다.
+    각 스냅샷은 파서가 만든 행에 `snapshot_time`, `crawl_session_id`가 추가된 딕셔너리입니다.
+    """
+
+    def on_snapshots(self, snapshots: List[Dict], conn: sqlite3.Connection):
+        pass
+
+
+def calculate_ratio(recruitment_count: Optional[int], applicant_count: Optional[int]) -> Optional[float]:
+    """DB의 competition_ratio 생성 컬럼과 같은 방식으로 경쟁률을 계산합니다."""
+    if recruitment_count is None or applicant_count is None:
+        return None
+    return applicant_count / recruitment_count if recruitment_count > 0 else 0.0
+
+
+class ChangeSubscription:
+    """필터 조건과 전용 큐를 가진 변경 이벤트 구독입니다."""
+
+    def __init__(self, bus, university_code=None, department_name=None,
+                 admission_type=None, max_queue=256):
+        self.bus = bus
+        self.university_code = university_code
+        self.department_name = department_name
+        self.admission_type = admission_type
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def matches(self, event: Dict) -> bool:
+        """이벤트가 구독 필터 조건에 맞는지 확인합니다."""
+        if self.university_code and event['university_code'] != self.university_code:
+            return False
+        if self.department_name and event['department'] != self.department_name:
+            return False
+        if self.admission_type and event['admission_type'] != self.admission_type:
+            return False
+        return True
+
+    def deliver(self, frame: bytes):
+        """이벤트를 큐에 넣습니다. 느린 구독자는 가장 오래된 이벤트를 버립니다."""
+        try:
+            self.queue.put_nowait(frame)
+        except queue.Full:
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.dropped += 1
+            try:
+                self.queue.put_nowait(frame)
+            except queue.Full:
+                pass
+
+    def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """다음 이벤트 프레임을 가져옵니다. 시간 초과 시 None을 반환합니다."""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ChangeEventBus(SnapshotListener):
+    """학과/전형별 경쟁률 변경 이벤트를 발행하는 프로세스 내 pub/sub 버스입니다.
+
+    프로그램별 마지막 값을 메모리에 유지하므로 이벤트 생성과 구독자 전달에
+    DB 재조회가 필요하지 않습니다. 이벤트는 한 번만 직렬화되어 모든 구독자에게 공유됩니다.
+    """
+
+    def __init__(self, history_size=1000, max_queue=256):
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._subscribers: List[ChangeSubscription] = []
+        self._last_values: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+        self._history = deque(maxlen=history_size)
+        self._next_id = 1
+
+    def seed_from_db(self, db_path: str, partition_dir: Optional[str] = None):
+        """시작 시 한 번, 프로그램별 최신 스냅샷 값으로 기준값을 채웁니다.
+
+        partition_dir을 주면 최근 월별 파티션에서 최신 값을 읽습니다.
+        """
+        if partition_dir:
+            from partitioned_store import PartitionRouter
+            conn = PartitionRouter(db_path, partition_dir).connect_latest()
+        else:
+            conn = sqlite3.connect(db_path)
+        cursor = conn.cursor()
+
+        cursor.execute('''
+            WITH latest_snapshots AS (
+                SELECT
+                    university_id, department_id, admission_type_id,
+                    MAX(snapshot_time) as latest_time
+                FROM competition_snapshots
+                GROUP BY university_id, department_id, admission_type_id
+            )
+            SELECT u.code, d.name, at.name, cs.recruitment_count, cs.applicant_count
+            FROM competition_snapshots cs
+            JOIN latest_snapshots ls ON (
+                cs.university_id = ls.university_id
+                AND cs.department_id = ls.department_id
+                AND cs.admission_type_id = ls.admission_type_id
+                AND cs.snapshot_time = ls.latest_time
+            )
+            JOIN universities u ON cs.university_id = u.id
+            JOIN departments d ON cs.department_id = d.id
+            JOIN admission_types at ON cs.admission_type_id = at.id
+        ''')
+        rows = cursor.fetchall()
+        conn.close()
+
+        with self._lock:
+            for code, department, admission_type, recruitment, applicants in rows:
+                self._last_values[(code, department, admission_type)] = (recruitment, applicants)
+
+        return len(rows)
+
+    def on_snapshots(self, snapshots: List[Dict], conn: sqlite3.Connection = None):
+        """커밋된 스냅샷 배치에서 값이 바뀐 프로그램만 이벤트로 발행합니다."""
+        for snapshot in snapshots:
+            key = (snapshot['university_code'], snapshot['department'], snapshot['admission_type'])
+            new_values = (snapshot['recruitment_count'], snapshot['applicant_count'])
+
+            with self._lock:
+                old_values = self._last_values.get(key)
+                if old_values == new_values:
+                    continue
+                self._last_values[key] = new_values
+
+            old_recruitment, old_applicants = old_values if old_values else (None, None)
+            self.publish({
+                'university_code': snapshot['university_code'],
+                'college': snapshot['college'],
+                'department': snapshot['department'],
+                'admission_type': snapshot['admission_type'],
+                'old_recruitment_count': old_recruitment,
+                'old_applicant_count': old_applicants,
+                'old_competition_ratio': calculate_ratio(old_recruitment, old_applicants),
+                'new_recruitment_count': new_values[0],
+                'new_applicant_count': new_values[1],
+                'new_competition_ratio': calculate_ratio(*new_values),
+                'snapshot_time': snapshot['snapshot_time'],
+            })
+
+    def publish(self, event: Dict) -> int:
+        """이벤트에 ID를 부여하고 조건에 맞는 구독자에게 전달합니다."""
+        with self._lock:
+            event_id = self._next_id
+            self._next_id += 1
+            event = dict(event, id=event_id)
+            frame = self.format_sse(event)
+            self._history.append((event, frame))
+            subscribers = list(self._subscribers)
+
+        for subscription in subscribers:
+            if subscription.matches(event):
+                subscription.deliver(frame)
+
+        return event_id
+
+    @staticmethod
+    def format_sse(event: Dict) -> bytes:
+        """이벤트를 Server-Sent Events 프레임으로 직렬화합니다."""
+        data = json.dumps(event, ensure_ascii=False)
+        return f"id: {event['id']}\nevent: ratio_change\ndata: {data}\n\n".encode('utf-8')
+
+    def subscribe(self, university_code=None, department_name=None, admission_type=None,
+                  last_event_id: Optional[int] = None) -> ChangeSubscription:
+        """필터 조건으로 구독을 등록합니다. last_event_id 이후의 이벤트는 재전송합니다."""
+        subscription = ChangeSubscription(
+            self, university_code, department_name, admission_type, self.max_queue
+        )
+
+        with self._lock:
+            if last_event_id is not None:
+                for event, frame in self._history:
+                    if event['id'] > last_event_id and subscription.matches(event):
+                        subscription.deliver(frame)
+            self._subscribers.append(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription: ChangeSubscription):
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
@@ -0,0 +1,104 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from change_events import ChangeEventBus
+
+
+class ChangeStreamHandler(BaseHTTPRequestHandler):
+    """경쟁률 변경 이벤트를 SSE로 내보내는 요청 핸들러입니다.
+
+    GET /events?university=CKU&department=...&admission_type=...
+    GET /health
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+
+        if parsed.path == '/events':
+            self.stream_events(parse_qs(parsed.query))
+        elif parsed.path == '/health':
+            body = json.dumps({
+                'status': 'ok',
+                'subscribers': self.server.bus.subscriber_count()
+            }).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_error(404)
+
+    def stream_events(self, params):
+        """구독을 등록하고 연결이 끊길 때까지 이벤트를 전송합니다."""
+        def param(name):
+            values = params.get(name)
+            return values[0] if values else None
+
+        last_event_id = self.headers.get('Last-Event-ID')
+        try:
+            last_event_id = int(last_event_id) if last_event_id else None
+        except ValueError:
+            last_event_id = None
+
+        subscription = self.server.bus.subscribe(
+            university_code=param('university'),
+            department_name=param('department'),
+            admission_type=param('admission_type'),
+            last_event_id=last_event_id
+        )
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'keep-alive')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+        try:
+            self.wfile.write(b'retry: 5000\n\n')
+            self.wfile.flush()
+
+            while not self.server.closing:
+                frame = subscription.get(timeout=self.server.heartbeat_seconds)
+                # 이벤트가 없으면 프록시 타임아웃 방지를 위한 주석 프레임 전송
+                self.wfile.write(frame if frame is not None else b': keep-alive\n\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            subscription.close()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class ChangeStreamServer(ThreadingHTTPServer):
+    """연결마다 스레드를 사용하는 SSE 서버입니다."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, bus: ChangeEventBus, host='0.0.0.0', port=8765, heartbeat_seconds=15):
+        super().__init__((host, port), ChangeStreamHandler)
+        self.bus = bus
+        self.heartbeat_seconds = heartbeat_seconds
+        self.closing = False
+        self._thread = None
+
+    def start(self):
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        host, port = self.server_address[:2]
+        print(f"경쟁률 변경 스트림 서버 시작: http://{host}:{port}/events")
+
+    def stop(self):
+        """서버를 중지합니다."""
+        self.closing = True
+        self.shutdown()
+        self.server_close()
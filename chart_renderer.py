@@ -0,0 +1,183 @@
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional
+
+
+def _init_headless_worker():
+    """워커 프로세스에서 GUI 없는 Agg 백엔드를 사용하도록 설정합니다."""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    import matplotlib.pyplot as plt
+    plt.switch_backend('Agg')
+
+
+def render_chart_job(db_path: str, job: Dict, partition_dir: Optional[str] = None) -> str:
+    """워커 프로세스에서 차트 하나를 렌더링하고 저장 경로를 반환합니다."""
+    _init_headless_worker()
+    from trend_analyzer import TrendAnalyzer
+
+    analyzer = TrendAnalyzer(db_path, partition_dir=partition_dir)
+    kind = job['kind']
+
+    if kind == 'competition':
+        analyzer.plot_competition_trend(university_code=job['university_code'],
+                                        hours_back=job['hours_back'],
+                                        save_path=job['path'], show=False)
+    elif kind == 'applicant':
+        analyzer.plot_applicant_trend(university_code=job['university_code'],
+                                      hours_back=job['hours_back'],
+                                      save_path=job['path'], show=False)
+    elif kind == 'dashboard':
+        analyzer.create_interactive_dashboard(hours_back=job['hours_back'],
+                                              save_html=job['path'], show=False)
+    else:
+        raise ValueError(f"알 수 없는 차트 종류: {kind}")
+
+    return job['path']
+
+
+class HeadlessChartRenderer:
+    """서버 환경용 차트 일괄 렌더러입니다.
+
+    차트와 대학교별 변형을 워커 프로세스에서 병렬로 렌더링하고,
+    차트의 기반 데이터 버전이 마지막 렌더링 이후 바뀌지 않았으면 건너뜁니다.
+    partition_dir을 주면 조회와 워커의 TrendAnalyzer 모두 PartitionRouter로 파티션을 읽습니다.
+    """
+
+    MANIFEST_NAME = '.render_manifest.json'
+
+    def __init__(self, db_path='competition_ratio_enhanced.db', output_dir='.', workers=None,
+                 partition_dir=None):
+        self.db_path = db_path
+        self.output_dir = output_dir
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.manifest_path = os.path.join(output_dir, self.MANIFEST_NAME)
+        self.partition_dir = partition_dir
+        self.router = None
+        if partition_dir:
+            from partitioned_store import PartitionRouter
+            self.router = PartitionRouter(db_path, partition_dir)
+
+    def connections(self, hours_back=None) -> Iterator[sqlite3.Connection]:
+        """조회용 연결을 반환합니다. 파티션 DB면 hours_back 구간의 파티션을 하나씩 연결합니다 (결과는 호출자가 합침)."""
+        if self.router:
+            yield from self.router.connect_each(hours_back=hours_back)
+        else:
+            yield sqlite3.connect(self.db_path)
+
+    def get_university_codes(self, hours_back=None) -> List[str]:
+        """스냅샷이 있는 대학교 코드 목록을 조회합니다. (파티션 DB면 hours_back 구간의 파티션에서)"""
+        codes = set()
+        for conn in self.connections(hours_back):
+            try:
+                codes.update(row[0] for row in conn.execute('''
+                    SELECT DISTINCT u.code
+                    FROM universities u
+                    JOIN competition_snapshots cs ON cs.university_id = u.id
+                '''))
+            finally:
+                conn.close()
+        return sorted(codes)
+
+    def build_jobs(self, hours_back=24, per_university=True) -> List[Dict]:
+        """전체 차트와 대학교별 차트 작업 목록을 만듭니다."""
+        jobs = [
+            {'kind': 'competition', 'university_code': None, 'hours_back': hours_back,
+             'path': os.path.join(self.output_dir, 'competition_trend.png')},
+            {'kind': 'applicant', 'university_code': None, 'hours_back': hours_back,
+             'path': os.path.join(self.output_dir, 'applicant_trend.png')},
+            {'kind': 'dashboard', 'university_code': None, 'hours_back': hours_back,
+             'path': os.path.join(self.output_dir, 'dashboard.html')},
+        ]
+
+        if per_university:
+            for code in self.get_university_codes(hours_back):
+                jobs.append({'kind': 'competition', 'university_code': code, 'hours_back': hours_back,
+                             'path': os.path.join(self.output_dir, f'competition_trend_{code}.png')})
+                jobs.append({'kind': 'applicant', 'university_code': code, 'hours_back': hours_back,
+                             'path': os.path.join(self.output_dir, f'applicant_trend_{code}.png')})
+
+        return jobs
+
+    def get_data_versions(self, jobs: List[Dict]) -> Dict[str, str]:
+        """작업별 기반 데이터 버전(분석 구간의 스냅샷 수와 최대 ID)을 조회합니다."""
+        keys = list(dict.fromkeys((job['university_code'], job['hours_back']) for job in jobs))
+        totals = {key: (0, None) for key in keys}
+        for conn in self.connections(max((job['hours_back'] for job in jobs), default=None)):
+            try:
+                for key in keys:
+                    code, hours_back = key
+                    query = '''
+                        SELECT COUNT(*), MAX(cs.id)
+                        FROM competition_snapshots cs
+                        JOIN universities u ON cs.university_id = u.id
+                        WHERE cs.snapshot_time >= datetime('now', ?)
+                    '''
+                    params = [f"-{int(hours_back)} hours"]
+                    if code:
+                        query += ' AND u.code = ?'
+                        params.append(code)
+                    count, max_id = conn.execute(query, params).fetchone()
+                    total, total_max = totals[key]
+                    totals[key] = (total + count, max((v for v in (total_max, max_id) if v is not None), default=None))
+            finally:
+                conn.close()
+
+        return {job['path']: "{}:{}".format(*totals[(job['university_code'], job['hours_back'])]) for job in jobs}
+
+    def load_manifest(self) -> Dict[str, str]:
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_manifest(self, manifest: Dict[str, str]):
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def render(self, jobs: Optional[List[Dict]] = None, hours_back=24, force=False) -> Dict[str, List[str]]:
+        """변경된 차트만 병렬로 렌더링합니다."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        if jobs is None:
+            jobs = self.build_jobs(hours_back)
+
+        manifest = self.load_manifest()
+        versions = self.get_data_versions(jobs)
+
+        pending = []
+        skipped = []
+        for job in jobs:
+            path = job['path']
+            if not force and manifest.get(path) == versions[path] and os.path.exists(path):
+                skipped.append(path)
+            else:
+                pending.append(job)
+
+        rendered = []
+        failed = []
+        if pending:
+            with ProcessPoolExecutor(max_workers=self.workers,
+                                     initializer=_init_headless_worker) as executor:
+                futures = {executor.submit(render_chart_job, self.db_path, job, self.partition_dir): job
+                           for job in pending}
+                for future in as_completed(futures):
+                    job = futures[future]
+                    try:
+                        future.result()
+                        manifest[job['path']] = versions[job['path']]
+                        rendered.append(job['path'])
+                    except Exception as e:
+                        failed.append(job['path'])
+                        print(f"차트 렌더링 실패 ({job['path']}): {e}")
+
+        self.save_manifest(manifest)
+
+        print(f"차트 렌더링 완료: {len(rendered)}개 생성, {len(skipped)}개 변경 없음, {len(failed)}개 실패")
+        return {'rendered': rendered, 'skipped': skipped, 'failed': failed}
@@ -0,0 +1,69 @@
+from sys import intern
+from typing import Dict, NamedTuple, Optional
+
+
+class ParsedRow(NamedTuple):
+    """파싱 단계의 정리 전 행입니다 (표 한 줄에서 정리 단계가 쓰는 칸만 보관)."""
+    college: str
+    department_raw: str
+    admission_type: str
+    recruitment_text: str
+    applicant_text: str
+
+
+def parsed_row(cell_texts, admission_type: str) -> ParsedRow:
+    """표의 칸 텍스트로 ParsedRow를 만듭니다. 반복되는 단과대학/전형 문자열은 intern합니다."""
+    return ParsedRow(intern(cell_texts[0]), cell_texts[1], intern(admission_type),
+                     cell_texts[2], cell_texts[3])
+
+
+class CompetitionRecord:
+    """파서에서 저장 단계까지 흐르는 경쟁률 행 하나입니다.
+
+    dict 대신 __slots__를 써 행당 메모리를 줄이고, 대학교/단과대학/학과/전형 문자열은 intern해
+    같은 이름을 한 객체로 공유합니다. 기존 코드와의 호환을 위해 record['college']처럼 키로도 읽을 수 있습니다.
+    snapshot_time과 crawl_session_id는 저장 단계에서 채워집니다.
+    """
+
+    __slots__ = ('university_code', 'college', 'department', 'admission_type',
+                 'recruitment_count', 'applicant_count', 'snapshot_time', 'crawl_session_id')
+
+    def __init__(self, university_code: Optional[str], college: str, department: str, admission_type: str,
+                 recruitment_count: int, applicant_count: int):
+        self.university_code = intern(university_code) if university_code else university_code
+        self.college = intern(college) if college else college
+        self.department = intern(department) if department else department
+        self.admission_type = intern(admission_type) if admission_type else admission_type
+        self.recruitment_count = recruitment_count
+        self.applicant_count = applicant_count
+        self.snapshot_time = None
+        self.crawl_session_id = None
+
+    @property
+    def competition_ratio(self) -> float:
+        """DB의 competition_ratio 생성 컬럼과 같은 방식으로 계산한 경쟁률"""
+        if self.recruitment_count > 0:
+            return self.applicant_count / self.recruitment_count
+        return 0.0
+
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def as_dict(self) -> Dict:
+        """값이 있는 필드만 담은 dict를 반환합니다."""
+        return {name: getattr(self, name) for name in self.__slots__ if getattr(self, name) is not None}
+
+    def __eq__(self, other):
+        if not isinstance(other, CompetitionRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__[:6])
+        return f"CompetitionRecord({fields})"
@@ -1,18 +1,53 @@
+import os
 import sqlite3
+import sys
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import chain, groupby
 import argparse
-from tabulate import tabulate
+
+from enhanced_database_setup import connect_read_only
+from report_document import FORMATS, ReportDocument, ReportSection, ReportTable, format_for_filename
+from stream_table import StreamingTable, display_width, pager_output
+
+def table_records(df):
+    """DataFrame 행을 JSON 출력용 dict 목록으로 바꿉니다 (NaN → None)."""
+    return df.astype(object).where(df.notna(), None).to_dict('records')
 
 class ComprehensiveDataViewer:
-    def __init__(self, db_path='competition_ratio_enhanced.db'):
+    # 종합 리포트 섹션 조회를 동시에 실행할 스레드 수
+    report_workers = 6
+    
+    def __init__(self, db_path='competition_ratio_enhanced.db', partition_dir=None, out=None):
         self.db_path = db_path
+        # print_* 메서드의 출력 대상 (페이저 등, 기본값은 표준 출력)
+        self.out = out or sys.stdout
+        # 월별 파티션 DB를 쓰는 경우 조회 구간과 겹치는 파티션만 연결
+        self.router = None
+        if partition_dir:
+            from partitioned_store import PartitionRouter
+            self.router = PartitionRouter(db_path, partition_dir)
+    
+    def connect(self, hours_back=None):
+        """조회 전용 연결을 엽니다. hours_back이 있으면 그 구간의 파티션만 연결합니다."""
+        if self.router:
+            return self.router.connect(hours_back=hours_back, read_only=True)
+        return connect_read_only(self.db_path)
+    
+    def connect_latest(self):
+        """프로그램별 최신 값 조회용 연결을 엽니다. 파티션 DB면 최근 파티션만 연결합니다."""
+        if self.router:
+            return self.router.connect_latest(read_only=True)
+        return connect_read_only(self.db_path)
+    
+    def connect_shared(self):
+        """스냅샷을 읽지 않는 조회(세션, 이름 테이블)용으로 공유 DB만 엽니다."""
+        return connect_read_only(self.db_path)
         
-    def get_all_universities_overview(self):
-        """전체 대학교 개요를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
-        
-        query = """
+    def overview_query(self):
+        """대학교 개요 조회 SQL을 반환합니다."""
+        return """
         SELECT 
             u.name as university_name,
             u.code as university_code,
@@ -27,16 +62,35 @@ class ComprehensiveDataViewer:
         GROUP BY u.id, u.name, u.code
         ORDER BY u.name
         """
-        
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        return df
     
-    def get_latest_competition_data(self, hours_back=24):
-        """최신 경쟁률 데이터를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
+    def get_all_universities_overview(self):
+        """전체 대학교 개요를 조회합니다.
         
-        query = """
+        파티션 DB면 전체 이력을 한 연결에 ATTACH하지 않고 파티션을 하나씩 조회한 뒤 대학교별로 합칩니다.
+        """
+        if not self.router:
+            conn = self.connect()
+            df = pd.read_sql_query(self.overview_query(), conn)
+            conn.close()
+            return df
+        
+        frames = []
+        for conn in self.router.connect_each(read_only=True):
+            try:
+                frames.append(pd.read_sql_query(self.overview_query(), conn))
+            finally:
+                conn.close()
+        df = pd.concat(frames, ignore_index=True)
+        return (df.groupby(['university_name', 'university_code'], sort=False, as_index=False)
+                .agg(college_count=('college_count', 'max'),
+                     department_count=('department_count', 'max'),
+                     total_snapshots=('total_snapshots', 'sum'),
+                     latest_crawl=('latest_crawl', 'max'))
+                .sort_values('university_name', ignore_index=True))
+    
+    def latest_competition_query(self, hours_back=24):
+        """최신 경쟁률 조회 SQL을 반환합니다."""
+        return """
         WITH latest_snapshots AS (
             SELECT 
                 university_id, department_id, admission_type_id,
@@ -74,8 +128,11 @@ class ComprehensiveDataViewer:
         JOIN admission_types at ON cs.admission_type_id = at.id
         ORDER BY u.name, d.name, at.name
         """.format(hours_back)
-        
-        df = pd.read_sql_query(query, conn)
+    
+    def get_latest_competition_data(self, hours_back=24):
+        """최신 경쟁률 데이터를 조회합니다."""
+        conn = self.connect(hours_back)
+        df = pd.read_sql_query(self.latest_competition_query(hours_back), conn)
         conn.close()
         
         if not df.empty:
@@ -83,11 +140,9 @@ class ComprehensiveDataViewer:
         
         return df
     
-    def get_university_summary_stats(self):
-        """대학교별 요약 통계를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
-        
-        query = """
+    def summary_stats_query(self):
+        """대학교별 요약 통계 조회 SQL을 반환합니다."""
+        return """
         WITH latest_data AS (
             SELECT 
                 cs.university_id,
@@ -117,16 +172,17 @@ class ComprehensiveDataViewer:
         GROUP BY u.id, u.name, u.code
         ORDER BY total_applicants DESC
         """
-        
-        df = pd.read_sql_query(query, conn)
+    
+    def get_university_summary_stats(self):
+        """대학교별 요약 통계를 조회합니다."""
+        conn = self.connect_latest()
+        df = pd.read_sql_query(self.summary_stats_query(), conn)
         conn.close()
         return df
     
-    def get_top_competitive_programs(self, limit=10):
-        """가장 경쟁이 치열한 프로그램들을 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
-        
-        query = """
+    def top_programs_query(self, limit=10):
+        """경쟁률 상위 프로그램 조회 SQL을 반환합니다."""
+        return """
         WITH latest_data AS (
             SELECT 
                 cs.university_id,
@@ -164,8 +220,11 @@ class ComprehensiveDataViewer:
         ORDER BY ld.competition_ratio DESC
         LIMIT {}
         """.format(limit)
-        
-        df = pd.read_sql_query(query, conn)
+    
+    def get_top_competitive_programs(self, limit=10):
+        """가장 경쟁이 치열한 프로그램들을 조회합니다."""
+        conn = self.connect_latest()
+        df = pd.read_sql_query(self.top_programs_query(limit), conn)
         conn.close()
         
         if not df.empty:
@@ -173,11 +232,9 @@ class ComprehensiveDataViewer:
         
         return df
     
-    def get_crawling_session_status(self, limit=20):
-        """최근 크롤링 세션 상태를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
-        
-        query = """
+    def session_status_query(self, limit=20):
+        """크롤링 세션 상태 조회 SQL을 반환합니다."""
+        return """
         SELECT 
             u.name as university_name,
             cs.start_time,
@@ -189,6 +246,11 @@ class ComprehensiveDataViewer:
                 WHEN cs.status = 'COMPLETED' THEN '✅'
                 WHEN cs.status = 'FAILED' THEN '❌'
                 WHEN cs.status = 'RUNNING' THEN '🔄'
+                WHEN cs.status = 'SKIPPED' THEN '⏭'
+                WHEN cs.status = 'CANCELLED' THEN '⏱'
+                WHEN cs.status = 'ABORTED' THEN '🛑'
+                WHEN cs.status = 'QUARANTINED' THEN '🚧'
+                WHEN cs.status LIKE 'CIRCUIT_%' THEN '⚡'
                 ELSE '❓'
             END as status_icon,
             ROUND(
@@ -199,17 +261,18 @@ class ComprehensiveDataViewer:
         ORDER BY cs.start_time DESC
         LIMIT {}
         """.format(limit)
-        
-        df = pd.read_sql_query(query, conn)
+    
+    def get_crawling_session_status(self, limit=20):
+        """최근 크롤링 세션 상태를 조회합니다."""
+        conn = self.connect_shared()
+        df = pd.read_sql_query(self.session_status_query(limit), conn)
         conn.close()
         
         return df
     
-    def get_trend_data(self, hours_back=24):
-        """시간별 추세 데이터를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
-        
-        query = """
+    def trend_query(self, hours_back=24):
+        """시간별 추세 조회 SQL을 반환합니다."""
+        return """
         SELECT 
             u.name as university_name,
             d.name as department_name,
@@ -223,8 +286,11 @@ class ComprehensiveDataViewer:
         GROUP BY u.name, d.name, cs.snapshot_time
         ORDER BY cs.snapshot_time DESC, u.name, d.name
         """.format(hours_back)
-        
-        df = pd.read_sql_query(query, conn)
+    
+    def get_trend_data(self, hours_back=24):
+        """시간별 추세 데이터를 조회합니다."""
+        conn = self.connect(hours_back)
+        df = pd.read_sql_query(self.trend_query(hours_back), conn)
         conn.close()
         
         if not df.empty:
@@ -232,161 +298,141 @@ class ComprehensiveDataViewer:
         
         return df
     
-    def print_universities_overview(self):
-        """대학교 개요를 출력합니다."""
-        df = self.get_all_universities_overview()
-        
-        print("🏛️  대학교 전체 개요")
-        print("=" * 80)
-        
+    # 표 머리글과 행 서식 (DataFrame 행과 sqlite3.Row 모두 받음)
+    OVERVIEW_HEADERS = ["대학교명", "코드", "단과대학", "학과", "총 스냅샷", "최근 크롤링"]
+    LATEST_HEADERS = ["상태", "학과", "전형", "모집", "지원", "경쟁률", "업데이트"]
+    SUMMARY_HEADERS = ["대학교", "프로그램수", "총모집", "총지원", "평균경쟁률", "최고경쟁률"]
+    TOP_HEADERS = ["순위", "열기", "대학교", "학과", "전형", "모집", "지원", "경쟁률"]
+    SESSION_HEADERS = ["상태", "대학교", "시작시간", "소요시간(분)", "수집건수", "에러"]
+    TREND_HEADERS = ["대학교", "추세", "지원자변화", "경쟁률변화", "현재지원자", "현재경쟁률"]
+    
+    @staticmethod
+    def overview_row(row):
+        latest_crawl = "없음" if pd.isna(row['latest_crawl']) else row['latest_crawl']
+        return [
+            row['university_name'],
+            row['university_code'],
+            f"{row['college_count']}개",
+            f"{row['department_count']}개", 
+            f"{row['total_snapshots']:,}개",
+            latest_crawl
+        ]
+    
+    @staticmethod
+    def latest_row(row):
+        return [
+            row['status_icon'],
+            row['department_name'],
+            row['admission_type'],
+            f"{row['recruitment_count']}명",
+            f"{row['applicant_count']}명",
+            f"{row['competition_ratio']:.3f}:1",
+            pd.Timestamp(row['snapshot_time']).strftime('%m-%d %H:%M')
+        ]
+    
+    @staticmethod
+    def summary_row(row):
+        return [
+            f"{row['university_name']}\n({row['university_code']})",
+            f"{row['programs_count']}개",
+            f"{int(row['total_recruitment']):,}명",
+            f"{int(row['total_applicants']):,}명",
+            f"{row['avg_competition_ratio']:.3f}:1",
+            f"{row['max_competition_ratio']:.3f}:1"
+        ]
+    
+    @staticmethod
+    def top_row(idx, row):
+        return [
+            f"#{idx}",
+            row['heat_level'],
+            row['university_name'],
+            row['department_name'],
+            row['admission_type'],
+            f"{row['recruitment_count']}명",
+            f"{row['applicant_count']}명",
+            f"{row['competition_ratio']:.3f}:1"
+        ]
+    
+    @staticmethod
+    def session_row(row):
+        # error_message가 NULL인 행은 DataFrame에서 NaN, sqlite3.Row에서 None으로 읽힘
+        error_message = row['error_message'] if isinstance(row['error_message'], str) else ""
+        error_msg = error_message[:30] + "..." if len(error_message) > 30 else error_message
+        duration = row['duration_minutes']
+        return [
+            row['status_icon'],
+            row['university_name'],
+            row['start_time'],
+            f"{duration:.1f}분" if duration and not pd.isna(duration) else "진행중",
+            f"{row['records_collected']}건",
+            error_msg
+        ]
+    
+    def universities_overview_section(self, df) -> ReportSection:
+        """대학교 개요 섹션을 만듭니다."""
+        section = ReportSection("🏛️  대학교 전체 개요", 80)
         if df.empty:
-            print("등록된 대학교가 없습니다.")
-            return
-        
-        headers = ["대학교명", "코드", "단과대학", "학과", "총 스냅샷", "최근 크롤링"]
-        table_data = []
+            section.message = "등록된 대학교가 없습니다."
+            return section
         
-        for _, row in df.iterrows():
-            latest_crawl = "없음" if pd.isna(row['latest_crawl']) else row['latest_crawl']
-            table_data.append([
-                row['university_name'],
-                row['university_code'],
-                f"{row['college_count']}개",
-                f"{row['department_count']}개", 
-                f"{row['total_snapshots']:,}개",
-                latest_crawl
-            ])
-        
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
-        print()
+        table_data = [self.overview_row(row) for _, row in df.iterrows()]
+        section.tables.append(ReportTable(self.OVERVIEW_HEADERS, table_data, "grid", records=table_records(df)))
+        return section
     
-    def print_latest_competition_data(self, hours_back=24):
-        """최신 경쟁률 데이터를 출력합니다."""
-        df = self.get_latest_competition_data(hours_back)
-        
-        print(f"📊 최신 경쟁률 현황 (최근 {hours_back}시간)")
-        print("=" * 100)
-        
+    def latest_competition_data_section(self, df, hours_back=24) -> ReportSection:
+        """최신 경쟁률 섹션을 만듭니다 (대학교마다 표 하나)."""
+        section = ReportSection(f"📊 최신 경쟁률 현황 (최근 {hours_back}시간)", 100)
         if df.empty:
-            print("최신 경쟁률 데이터가 없습니다.")
-            return
+            section.message = "최신 경쟁률 데이터가 없습니다."
+            return section
         
         for univ_name in df['university_name'].unique():
             univ_data = df[df['university_name'] == univ_name]
-            print(f"\n🎓 {univ_name}")
-            print("-" * 60)
-            
-            headers = ["상태", "학과", "전형", "모집", "지원", "경쟁률", "업데이트"]
-            table_data = []
-            
-            for _, row in univ_data.iterrows():
-                table_data.append([
-                    row['status_icon'],
-                    row['department_name'],
-                    row['admission_type'],
-                    f"{row['recruitment_count']}명",
-                    f"{row['applicant_count']}명",
-                    f"{row['competition_ratio']:.3f}:1",
-                    row['snapshot_time'].strftime('%m-%d %H:%M')
-                ])
-            
-            print(tabulate(table_data, headers=headers, tablefmt="simple"))
+            table_data = [self.latest_row(row) for _, row in univ_data.iterrows()]
+            section.tables.append(ReportTable(self.LATEST_HEADERS, table_data, "simple", title=f"🎓 {univ_name}",
+                                              records=table_records(univ_data)))
+        return section
     
-    def print_university_summary_stats(self):
-        """대학교별 요약 통계를 출력합니다."""
-        df = self.get_university_summary_stats()
-        
-        print("📈 대학교별 요약 통계")
-        print("=" * 80)
-        
+    def university_summary_stats_section(self, df) -> ReportSection:
+        """대학교별 요약 통계 섹션을 만듭니다."""
+        section = ReportSection("📈 대학교별 요약 통계", 80)
         if df.empty:
-            print("통계 데이터가 없습니다.")
-            return
-        
-        headers = ["대학교", "프로그램수", "총모집", "총지원", "평균경쟁률", "최고경쟁률"]
-        table_data = []
+            section.message = "통계 데이터가 없습니다."
+            return section
         
-        for _, row in df.iterrows():
-            table_data.append([
-                f"{row['university_name']}\n({row['university_code']})",
-                f"{row['programs_count']}개",
-                f"{int(row['total_recruitment']):,}명",
-                f"{int(row['total_applicants']):,}명",
-                f"{row['avg_competition_ratio']:.3f}:1",
-                f"{row['max_competition_ratio']:.3f}:1"
-            ])
-        
-        print(tabulate(table_data, headers=headers, tablefmt="grid"))
-        print()
+        table_data = [self.summary_row(row) for _, row in df.iterrows()]
+        section.tables.append(ReportTable(self.SUMMARY_HEADERS, table_data, "grid", records=table_records(df)))
+        return section
     
-    def print_top_competitive_programs(self, limit=10):
-        """가장 경쟁이 치열한 프로그램들을 출력합니다."""
-        df = self.get_top_competitive_programs(limit)
-        
-        print(f"🔥 TOP {limit} 경쟁률 높은 프로그램")
-        print("=" * 80)
-        
+    def top_competitive_programs_section(self, df, limit=10) -> ReportSection:
+        """경쟁률 상위 프로그램 섹션을 만듭니다."""
+        section = ReportSection(f"🔥 TOP {limit} 경쟁률 높은 프로그램", 80)
         if df.empty:
-            print("경쟁률 데이터가 없습니다.")
-            return
-        
-        headers = ["순위", "열기", "대학교", "학과", "전형", "모집", "지원", "경쟁률"]
-        table_data = []
+            section.message = "경쟁률 데이터가 없습니다."
+            return section
         
-        for idx, (_, row) in enumerate(df.iterrows(), 1):
-            table_data.append([
-                f"#{idx}",
-                row['heat_level'],
-                row['university_name'],
-                row['department_name'],
-                row['admission_type'],
-                f"{row['recruitment_count']}명",
-                f"{row['applicant_count']}명",
-                f"{row['competition_ratio']:.3f}:1"
-            ])
-        
-        print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
-        print()
+        table_data = [self.top_row(idx, row) for idx, (_, row) in enumerate(df.iterrows(), 1)]
+        section.tables.append(ReportTable(self.TOP_HEADERS, table_data, "box", records=table_records(df)))
+        return section
     
-    def print_crawling_status(self, limit=10):
-        """크롤링 세션 상태를 출력합니다."""
-        df = self.get_crawling_session_status(limit)
-        
-        print(f"🔄 최근 {limit}개 크롤링 세션 상태")
-        print("=" * 80)
-        
+    def crawling_status_section(self, df, limit=10) -> ReportSection:
+        """크롤링 세션 상태 섹션을 만듭니다."""
+        section = ReportSection(f"🔄 최근 {limit}개 크롤링 세션 상태", 80)
         if df.empty:
-            print("크롤링 세션 데이터가 없습니다.")
-            return
-        
-        headers = ["상태", "대학교", "시작시간", "소요시간(분)", "수집건수", "에러"]
-        table_data = []
-        
-        for _, row in df.iterrows():
-            error_msg = row['error_message'][:30] + "..." if row['error_message'] and len(row['error_message']) > 30 else (row['error_message'] or "")
-            
-            table_data.append([
-                row['status_icon'],
-                row['university_name'],
-                row['start_time'],
-                f"{row['duration_minutes']:.1f}분" if row['duration_minutes'] else "진행중",
-                f"{row['records_collected']}건",
-                error_msg
-            ])
+            section.message = "크롤링 세션 데이터가 없습니다."
+            return section
         
-        print(tabulate(table_data, headers=headers, tablefmt="simple"))
-        print()
+        table_data = [self.session_row(row) for _, row in df.iterrows()]
+        section.tables.append(ReportTable(self.SESSION_HEADERS, table_data, "simple", records=table_records(df)))
+        return section
     
-    def print_trend_summary(self, hours_back=24):
-        """추세 요약을 출력합니다."""
-        df = self.get_trend_data(hours_back)
-        
-        print(f"📊 추세 요약 (최근 {hours_back}시간)")
-        print("=" * 80)
-        
+    def trend_summary_section(self, df, hours_back=24) -> ReportSection:
+        """추세 요약 섹션을 만듭니다."""
+        section = ReportSection(f"📊 추세 요약 (최근 {hours_back}시간)", 80)
         if df.empty:
-            print("추세 데이터가 없습니다.")
-            return
+            section.message = "추세 데이터가 없습니다."
+            return section
         
         # 대학교별 최신 vs 이전 비교
         summary_data = []
@@ -406,14 +452,13 @@ class ComprehensiveDataViewer:
                 summary_data.append({
                     'university': univ_name,
                     'trend': trend_icon,
-                    'applicant_change': applicant_change,
-                    'ratio_change': ratio_change,
-                    'latest_applicants': latest['total_applicants'],
-                    'latest_ratio': latest['avg_competition_ratio']
+                    'applicant_change': float(applicant_change),
+                    'ratio_change': float(ratio_change),
+                    'latest_applicants': float(latest['total_applicants']),
+                    'latest_ratio': float(latest['avg_competition_ratio'])
                 })
         
         if summary_data:
-            headers = ["대학교", "추세", "지원자변화", "경쟁률변화", "현재지원자", "현재경쟁률"]
             table_data = []
             
             for data in summary_data:
@@ -426,60 +471,152 @@ class ComprehensiveDataViewer:
                     f"{data['latest_ratio']:.3f}:1"
                 ])
             
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
+            section.tables.append(ReportTable(self.TREND_HEADERS, table_data, "grid", records=summary_data))
+        
+        return section
+    
+    def stream_query(self, query, hours_back=None, conn=None):
+        """쿼리 결과를 커서에서 한 행씩(sqlite3.Row) 반환합니다. conn을 주면 그 연결에서 실행하고 닫습니다."""
+        conn = conn or self.connect(hours_back)
+        try:
+            conn.row_factory = sqlite3.Row
+            yield from conn.execute(query)
+        finally:
+            conn.close()
+    
+    def name_width(self, table):
+        """dimension 테이블에서 가장 긴 이름들의 표시 너비를 SQL로 구합니다 (스냅샷 행은 읽지 않음)."""
+        conn = self.connect_shared()
+        try:
+            names = conn.execute(f"SELECT name FROM {table} ORDER BY length(name) DESC LIMIT 20").fetchall()
+        finally:
+            conn.close()
+        return max((display_width(name) for name, in names), default=None)
+    
+    def print_stream(self, title, width, empty_message, headers, rows, style, widths=None):
+        """제목과 표를 출력합니다. 행은 이터레이터에서 받는 대로 출력합니다."""
+        print(title, file=self.out)
+        print("=" * width, file=self.out)
+        first = next(rows, None)
+        if first is None:
+            print(empty_message, file=self.out)
+        else:
+            StreamingTable(headers, style, widths, out=self.out).write(chain([first], rows))
+        print(file=self.out)
+    
+    def print_universities_overview(self):
+        """대학교 개요를 출력합니다."""
+        if self.router:
+            rows = (row for _, row in self.get_all_universities_overview().iterrows())
+        else:
+            rows = self.stream_query(self.overview_query())
+        rows = map(self.overview_row, rows)
+        self.print_stream("🏛️  대학교 전체 개요", 80, "등록된 대학교가 없습니다.",
+                          self.OVERVIEW_HEADERS, rows, "grid")
+    
+    def print_latest_competition_data(self, hours_back=24):
+        """최신 경쟁률 데이터를 출력합니다 (대학교 순서로 커서에서 바로 출력)."""
+        print(f"📊 최신 경쟁률 현황 (최근 {hours_back}시간)", file=self.out)
+        print("=" * 100, file=self.out)
+        
+        # 모든 대학교 표의 학과/전형 열 너비를 이름 테이블로 미리 정해 대학교 사이에서 맞춤
+        widths = [None, self.name_width('departments'), self.name_width('admission_types')]
+        rows = self.stream_query(self.latest_competition_query(hours_back), hours_back)
+        empty = True
+        for univ_name, univ_rows in groupby(rows, key=lambda row: row['university_name']):
+            empty = False
+            print(f"\n🎓 {univ_name}", file=self.out)
+            print("-" * 60, file=self.out)
+            StreamingTable(self.LATEST_HEADERS, "simple", widths, out=self.out).write(map(self.latest_row, univ_rows))
+        if empty:
+            print("최신 경쟁률 데이터가 없습니다.", file=self.out)
+        print(file=self.out)
+    
+    def print_university_summary_stats(self):
+        """대학교별 요약 통계를 출력합니다."""
+        rows = map(self.summary_row, self.stream_query(self.summary_stats_query(), conn=self.connect_latest()))
+        self.print_stream("📈 대학교별 요약 통계", 80, "통계 데이터가 없습니다.", self.SUMMARY_HEADERS, rows, "grid")
+    
+    def print_top_competitive_programs(self, limit=10):
+        """가장 경쟁이 치열한 프로그램들을 출력합니다."""
+        rows = (self.top_row(idx, row)
+                for idx, row in enumerate(self.stream_query(self.top_programs_query(limit), conn=self.connect_latest()), 1))
+        self.print_stream(f"🔥 TOP {limit} 경쟁률 높은 프로그램", 80, "경쟁률 데이터가 없습니다.",
+                          self.TOP_HEADERS, rows, "box")
+    
+    def print_crawling_status(self, limit=10):
+        """크롤링 세션 상태를 출력합니다."""
+        rows = map(self.session_row, self.stream_query(self.session_status_query(limit), conn=self.connect_shared()))
+        self.print_stream(f"🔄 최근 {limit}개 크롤링 세션 상태", 80, "크롤링 세션 데이터가 없습니다.",
+                          self.SESSION_HEADERS, rows, "simple")
+    
+    def print_trend_summary(self, hours_back=24):
+        """추세 요약을 출력합니다 (대학교별로 집계한 작은 표)."""
+        print(self.trend_summary_section(self.get_trend_data(hours_back), hours_back).to_text(), file=self.out)
+    
+    def build_report(self, hours_back=24, top_programs=10, session_limit=10) -> ReportDocument:
+        """종합 리포트 문서를 만듭니다.
         
-        print()
-    
-    def generate_comprehensive_report(self, hours_back=24, top_programs=10):
-        """종합 리포트를 생성합니다."""
-        print("🎓 대학교 경쟁률 종합 현황 리포트")
-        print("=" * 100)
-        print(f"리포트 생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"데이터 기준: 최근 {hours_back}시간")
-        print()
+        여섯 섹션의 조회를 작업 스레드에서 동시에 실행하고(스레드마다 조회 전용 연결),
+        결과가 모두 모이면 섹션을 순서대로 만듭니다. 출력은 하지 않으므로 여러 리포트를 동시에 만들 수 있습니다.
+        """
+        generated_at = datetime.now()
+        with ThreadPoolExecutor(max_workers=self.report_workers) as executor:
+            overview = executor.submit(self.get_all_universities_overview)
+            summary = executor.submit(self.get_university_summary_stats)
+            top = executor.submit(self.get_top_competitive_programs, top_programs)
+            latest = executor.submit(self.get_latest_competition_data, hours_back)
+            trend = executor.submit(self.get_trend_data, hours_back)
+            sessions = executor.submit(self.get_crawling_session_status, session_limit)
+            
+            sections = [
+                self.universities_overview_section(overview.result()),
+                self.university_summary_stats_section(summary.result()),
+                self.top_competitive_programs_section(top.result(), top_programs),
+                self.latest_competition_data_section(latest.result(), hours_back),
+                self.trend_summary_section(trend.result(), hours_back),
+                self.crawling_status_section(sessions.result(), session_limit)
+            ]
+        
+        meta = [
+            ("리포트 생성 시간", generated_at.strftime('%Y-%m-%d %H:%M:%S')),
+            ("데이터 기준", f"최근 {hours_back}시간")
+        ]
+        return ReportDocument("🎓 대학교 경쟁률 종합 현황 리포트", meta, sections)
+    
+    def generate_comprehensive_report(self, hours_back=24, top_programs=10, fmt='text'):
+        """종합 리포트를 fmt(text, markdown, json) 형식으로 출력하고 문서를 반환합니다."""
+        document = self.build_report(hours_back, top_programs)
+        print(document.render(fmt), file=self.out)
+        return document
+    
+    def print_comprehensive_report(self, hours_back=24, top_programs=10):
+        """종합 리포트를 섹션 순서대로 커서에서 바로 출력합니다 (터미널/페이저용, 첫 출력이 바로 나옴)."""
+        print("🎓 대학교 경쟁률 종합 현황 리포트", file=self.out)
+        print("=" * 100, file=self.out)
+        print(f"리포트 생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", file=self.out)
+        print(f"데이터 기준: 최근 {hours_back}시간", file=self.out)
+        print(file=self.out)
         
-        # 1. 대학교 개요
         self.print_universities_overview()
-        
-        # 2. 대학교별 요약 통계
         self.print_university_summary_stats()
-        
-        # 3. TOP 경쟁 프로그램
         self.print_top_competitive_programs(top_programs)
-        
-        # 4. 최신 경쟁률 현황
         self.print_latest_competition_data(hours_back)
-        
-        # 5. 추세 요약
         self.print_trend_summary(hours_back)
-        
-        # 6. 크롤링 상태
         self.print_crawling_status()
     
-    def save_report_to_file(self, filename=None, hours_back=24, top_programs=10):
-        """리포트를 파일로 저장합니다."""
+    def save_report_to_file(self, filename=None, hours_back=24, top_programs=10, fmt=None):
+        """리포트를 파일로 저장합니다. fmt가 없으면 파일 확장자(.md, .json)로 형식을 정합니다."""
         if filename is None:
-            filename = f"comprehensive_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            extension = {'markdown': 'md', 'json': 'json'}.get(fmt, 'txt')
+            filename = f"comprehensive_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+        fmt = fmt or format_for_filename(filename)
         
-        import sys
-        from io import StringIO
-        
-        # stdout을 임시로 리디렉트
-        old_stdout = sys.stdout
-        sys.stdout = captured_output = StringIO()
-        
-        try:
-            self.generate_comprehensive_report(hours_back, top_programs)
-            report_content = captured_output.getvalue()
-            
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(report_content)
-            
-            print(f"리포트가 {filename}에 저장되었습니다.", file=old_stdout)
-            
-        finally:
-            sys.stdout = old_stdout
+        document = self.build_report(hours_back, top_programs)
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(document.render(fmt))
         
+        print(f"리포트가 {filename}에 저장되었습니다.")
         return filename
 
 def main():
@@ -487,17 +624,30 @@ def main():
     parser = argparse.ArgumentParser(description='전체 대학교 데이터 종합 조회')
     parser.add_argument('--hours', type=int, default=24, help='조회할 시간 범위 (시간)')
     parser.add_argument('--top', type=int, default=10, help='TOP 경쟁 프로그램 수')
-    parser.add_argument('--save', help='리포트 저장 파일명')
+    parser.add_argument('--save', help='리포트 저장 파일명 (.md, .json이면 해당 형식)')
+    parser.add_argument('--format', choices=FORMATS, help='출력 형식 (기본값: text, 저장 시 파일 확장자)')
     parser.add_argument('--db', default='competition_ratio_enhanced.db', help='데이터베이스 파일 경로')
+    parser.add_argument('--partition-dir', help='월별 스냅샷 파티션 디렉토리 (파티션 DB 사용 시)')
+    parser.add_argument('--pager', action='store_true', help='텍스트 리포트를 페이저($PAGER 또는 less)로 출력')
     
     args = parser.parse_args()
     
-    viewer = ComprehensiveDataViewer(args.db)
+    viewer = ComprehensiveDataViewer(args.db, args.partition_dir)
     
     if args.save:
-        viewer.save_report_to_file(args.save, args.hours, args.top)
+        viewer.save_report_to_file(args.save, args.hours, args.top, args.format)
+    elif args.format in ('markdown', 'json'):
+        viewer.generate_comprehensive_report(args.hours, args.top, args.format)
+    elif args.pager:
+        with pager_output() as out:
+            viewer.out = out
+            viewer.print_comprehensive_report(args.hours, args.top)
     else:
-        viewer.generate_comprehensive_report(args.hours, args.top)
+        try:
+            viewer.print_comprehensive_report(args.hours, args.top)
+        except BrokenPipeError:
+            # head 등 파이프를 먼저 닫은 경우, 종료 시 flush 오류가 나지 않도록 표준 출력을 버림
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+리스 기반 분산 크롤링 워커
+사용법: python3 scheduler.py --mode worker [--worker-id ID] [--lease-seconds 120]
+        python3 crawl_leases.py --status
+
+여러 프로세스(또는 여러 서버)가 같은 DB를 보면서 크롤링을 나눠 맡습니다.
+  - 크롤링 간격에 맞춘 주기(DB 시계 기준 UTC 'YYYY-MM-DD HH:MM')마다 대학교당 작업 한 행을 crawl_work_items에 만듭니다.
+    어느 워커든 주기 시작 시 INSERT OR IGNORE로 만들므로, 워커가 하나라도 살아 있으면 주기가 빠지지 않습니다.
+  - 워커는 BEGIN IMMEDIATE 안에서 작업을 하나 골라 리스(lease_expires_at)를 잡고, 크롤링하는 동안
+    별도 스레드가 리스를 연장합니다. 워커가 죽어 리스가 만료되면 다른 워커가 다시 가져갑니다.
+  - 크롤링이 실패(FAILED)하거나 취소(CANCELLED)된 작업은 다시 대기시키고, 리스를 max_attempts번 잡은
+    작업만 FAILED로 끝냅니다. 완료/격리/생략(서킷 열림)된 작업은 DONE입니다.
+  - 작업 완료 표시는 SnapshotWriter가 세션 스냅샷을 기록하는 트랜잭션 안에서, 리스를 아직 가진 경우에만 합니다.
+    리스를 잃은 워커의 스냅샷은 되돌려지므로 같은 주기가 두 번 저장되지 않습니다.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from crawler_core import SnapshotWriter, remaining_time
+from enhanced_database_setup import create_work_queue_table
+
+
+class LeaseLost(Exception):
+    """작업의 리스가 만료되어 다른 워커에게 넘어갔을 때 발생합니다."""
+
+    def __init__(self, item: 'WorkItem'):
+        super().__init__(f"{item.university_code} ({item.cycle}) 작업 리스를 잃었습니다")
+        self.item = item
+
+
+class WorkItem:
+    """워커가 리스를 잡은 작업 하나입니다. attempts는 리스를 잡을 때마다 늘어나 리스 토큰으로 쓰입니다."""
+
+    __slots__ = ('cycle', 'university_code', 'worker_id', 'attempts')
+
+    def __init__(self, cycle: str, university_code: str, worker_id: str, attempts: int):
+        self.cycle = cycle
+        self.university_code = university_code
+        self.worker_id = worker_id
+        self.attempts = attempts
+
+
+class LeaseQueue:
+    """crawl_work_items 테이블을 작업 큐로 쓰는 SQLite 구현입니다.
+
+    다른 큐(예: Redis)로 바꾸려면 enqueue_cycle/claim/heartbeat/complete/release를 같은 의미로 구현합니다.
+    complete()는 스냅샷과 같은 트랜잭션에서 호출되므로, 스냅샷과 다른 저장소를 쓰는 구현은
+    완료 표시와 스냅샷 커밋 사이에 리스가 넘어가지 않도록 보장해야 합니다.
+    """
+
+    def __init__(self, db_path='competition_ratio_enhanced.db', lease_seconds=120, max_attempts=3):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        conn = sqlite3.connect(db_path)
+        try:
+            create_work_queue_table(conn.cursor())
+            conn.commit()
+        finally:
+            conn.close()
+
+    def connect(self) -> sqlite3.Connection:
+        # 트랜잭션은 직접 시작함 (BEGIN IMMEDIATE)
+        return sqlite3.connect(self.db_path, isolation_level=None)
+
+    def enqueue_cycle(self, university_codes: Iterable[str], interval_minutes: int) -> Tuple[str, float]:
+        """DB 시계로 현재 주기를 정해 작업을 만들고(이미 있으면 그대로) 지난 주기의 남은 작업을 EXPIRED로 정리합니다.
+
+        주기는 SQLite의 'now'를 간격 배수로 내린 UTC 'YYYY-MM-DD HH:MM'입니다. 리스 만료와 같은 시계를 쓰므로
+        워커 서버들의 시계가 어긋나도 모두 같은 주기를 얻습니다.
+        (주기, 주기 시작 후 지난 초)를 반환합니다.
+        """
+        conn = self.connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            interval = int(interval_minutes * 60)
+            cycle, elapsed = conn.execute('''
+                SELECT strftime('%Y-%m-%d %H:%M', now / ? * ?, 'unixepoch'), now % ?
+                FROM (SELECT CAST(strftime('%s', 'now') AS INTEGER) AS now)
+            ''', (interval, interval, interval)).fetchone()
+            conn.executemany('''
+                INSERT OR IGNORE INTO crawl_work_items (cycle, university_code) VALUES (?, ?)
+            ''', [(cycle, code) for code in university_codes])
+            # 다음 주기가 시작된 뒤 지난 주기를 크롤링하면 새 주기와 같은 시점을 두 번 저장하게 됨
+            conn.execute('''
+                UPDATE crawl_work_items
+                SET status = 'EXPIRED', finished_at = CURRENT_TIMESTAMP
+                WHERE cycle < ?
+                  AND (status = 'PENDING' OR (status = 'LEASED' AND lease_expires_at < datetime('now')))
+            ''', (cycle,))
+            conn.execute('COMMIT')
+            return cycle, float(elapsed)
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+    def claim(self, worker_id: str, cycle: str) -> Optional[WorkItem]:
+        """주기에서 대기 중이거나 리스가 만료된 작업 하나의 리스를 잡습니다 (없으면 None)."""
+        conn = self.connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            # 리스를 max_attempts번 잡고도 끝나지 않은 작업은 더 시도하지 않음
+            conn.execute('''
+                UPDATE crawl_work_items
+                SET status = 'FAILED', result_status = 'LEASE_EXPIRED', finished_at = CURRENT_TIMESTAMP
+                WHERE cycle = ? AND status = 'LEASED' AND lease_expires_at < datetime('now') AND attempts >= ?
+            ''', (cycle, self.max_attempts))
+            row = conn.execute('''
+                SELECT university_code, attempts FROM crawl_work_items
+                WHERE cycle = ?
+                  AND (status = 'PENDING' OR (status = 'LEASED' AND lease_expires_at < datetime('now')))
+                ORDER BY attempts, university_code
+                LIMIT 1
+            ''', (cycle,)).fetchone()
+            if not row:
+                conn.execute('COMMIT')
+                return None
+            university_code, attempts = row[0], row[1] + 1
+            conn.execute('''
+                UPDATE crawl_work_items
+                SET status = 'LEASED', worker_id = ?, attempts = ?,
+                    lease_expires_at = datetime('now', ?)
+                WHERE cycle = ? AND university_code = ?
+            ''', (worker_id, attempts, f'+{self.lease_seconds} seconds', cycle, university_code))
+            conn.execute('COMMIT')
+            return WorkItem(cycle, university_code, worker_id, attempts)
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+    @staticmethod
+    def owned_clause() -> str:
+        return ('cycle = ? AND university_code = ? AND worker_id = ? AND attempts = ? '
+                "AND status = 'LEASED'")
+
+    @staticmethod
+    def owned_params(item: WorkItem) -> tuple:
+        return item.cycle, item.university_code, item.worker_id, item.attempts
+
+    def heartbeat(self, item: WorkItem, conn: sqlite3.Connection = None) -> bool:
+        """리스를 연장합니다. 다른 워커가 이미 가져갔으면 False를 반환합니다."""
+        own = conn is None
+        conn = conn or self.connect()
+        try:
+            cursor = conn.execute(f'''
+                UPDATE crawl_work_items SET lease_expires_at = datetime('now', ?)
+                WHERE {self.owned_clause()}
+            ''', (f'+{self.lease_seconds} seconds',) + self.owned_params(item))
+            return cursor.rowcount == 1
+        finally:
+            if own:
+                conn.close()
+
+    def complete(self, conn: sqlite3.Connection, item: WorkItem, result_status: str, session_id: str = None) -> bool:
+        """호출자의 트랜잭션 안에서 작업을 DONE으로 표시합니다 (커밋하지 않음).
+
+        다른 워커가 리스를 가져갔으면 표시하지 않고 False를 반환합니다. 리스가 만료되었어도
+        아직 아무도 가져가지 않았다면 이 워커의 결과로 끝냅니다.
+        """
+        cursor = conn.execute(f'''
+            UPDATE crawl_work_items
+            SET status = 'DONE', result_status = ?, session_id = ?, lease_expires_at = NULL,
+                finished_at = CURRENT_TIMESTAMP
+            WHERE {self.owned_clause()}
+        ''', (result_status, session_id) + self.owned_params(item))
+        return cursor.rowcount == 1
+
+    def retry(self, conn: sqlite3.Connection, item: WorkItem, result_status: str, session_id: str = None) -> bool:
+        """실패하거나 취소된 작업을 다시 대기시킵니다 (커밋하지 않음).
+
+        리스를 max_attempts번 잡은 작업은 더 시도하지 않고 FAILED로 끝냅니다.
+        다른 워커가 리스를 가져갔으면 아무것도 바꾸지 않고 False를 반환합니다.
+        """
+        if item.attempts >= self.max_attempts:
+            cursor = conn.execute(f'''
+                UPDATE crawl_work_items
+                SET status = 'FAILED', result_status = ?, session_id = ?, lease_expires_at = NULL,
+                    finished_at = CURRENT_TIMESTAMP
+                WHERE {self.owned_clause()}
+            ''', (result_status, session_id) + self.owned_params(item))
+        else:
+            cursor = conn.execute(f'''
+                UPDATE crawl_work_items
+                SET status = 'PENDING', result_status = ?, session_id = ?, worker_id = NULL, lease_expires_at = NULL
+                WHERE {self.owned_clause()}
+            ''', (result_status, session_id) + self.owned_params(item))
+        return cursor.rowcount == 1
+
+    def release(self, conn: sqlite3.Connection, item: WorkItem) -> bool:
+        """작업을 끝내지 못한 채 리스를 내려놓아 다른 워커가 바로 가져가게 합니다 (커밋하지 않음)."""
+        cursor = conn.execute(f'''
+            UPDATE crawl_work_items SET status = 'PENDING', worker_id = NULL, lease_expires_at = NULL
+            WHERE {self.owned_clause()}
+        ''', self.owned_params(item))
+        return cursor.rowcount == 1
+
+    def summary(self, limit=5) -> List[tuple]:
+        """최근 limit개 주기의 (주기, 상태, 결과, 작업 수, 워커 수)를 반환합니다."""
+        conn = self.connect()
+        try:
+            return conn.execute('''
+                SELECT cycle, status, COALESCE(result_status, ''), COUNT(*), COUNT(DISTINCT worker_id)
+                FROM crawl_work_items
+                WHERE cycle IN (SELECT DISTINCT cycle FROM crawl_work_items ORDER BY cycle DESC LIMIT ?)
+                GROUP BY cycle, status, result_status
+                ORDER BY cycle DESC, status
+            ''', (limit,)).fetchall()
+        finally:
+            conn.close()
+
+
+class LeaseHeartbeat:
+    """작업을 처리하는 동안 리스를 주기적으로 연장하는 스레드입니다."""
+
+    def __init__(self, queue: LeaseQueue, item: WorkItem, interval: float = None):
+        self.queue = queue
+        self.item = item
+        self.interval = interval or max(1.0, queue.lease_seconds / 3)
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f'lease-{item.university_code}', daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stopped.set()
+        self.thread.join()
+        return False
+
+    def run(self):
+        conn = self.queue.connect()
+        try:
+            while not self.stopped.wait(self.interval):
+                try:
+                    if not self.queue.heartbeat(self.item, conn):
+                        # 작업이 이미 끝났거나, 다른 워커가 가져가 이 워커의 스냅샷은 완료 표시 단계에서 되돌려짐
+                        return
+                except sqlite3.Error as e:
+                    print(f"리스 연장 오류 ({self.item.university_code}): {e}")
+        finally:
+            conn.close()
+
+
+class CrawlWorker:
+    """작업 큐에서 대학교를 하나씩 받아 크롤링하는 워커입니다.
+
+    워커 수만큼 대학교를 동시에 크롤링하며, 워커마다 SnapshotWriter 하나로 스냅샷을 기록합니다.
+    """
+
+    def __init__(self, crawler, queue: LeaseQueue = None, worker_id: str = None, interval_minutes=10,
+                 cycle_budget=0.8, poll_seconds=5):
+        self.crawler = crawler
+        self.queue = queue or LeaseQueue(crawler.db_path)
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.interval_minutes = interval_minutes
+        self.cycle_budget = cycle_budget
+        self.poll_seconds = poll_seconds
+        self.running = True
+
+    def finish_item(self, item: WorkItem, conn: sqlite3.Connection, session, status: str):
+        """SnapshotWriter가 세션을 끝낼 때 같은 트랜잭션에서 작업 상태를 기록합니다.
+
+        SKIPPED(서킷 열림)는 이번 주기에 다시 시도해도 생략되므로 DONE으로 끝냅니다.
+        """
+        if status == 'ABORTED':
+            self.queue.release(conn, item)
+        elif status in ('FAILED', 'CANCELLED'):
+            self.queue.retry(conn, item, status, session.id)
+        elif not self.queue.complete(conn, item, status, session.id) and status in ('COMPLETED', 'QUARANTINED'):
+            # 다른 워커가 이 작업을 가져갔으므로 이 세션의 스냅샷은 되돌림 (SnapshotWriter가 FAILED로 기록)
+            raise LeaseLost(item)
+
+    def process(self, item: WorkItem, writer: SnapshotWriter, deadline: float) -> Optional[str]:
+        """작업 하나를 크롤링하고 커밋까지 기다린 뒤 세션 상태를 반환합니다.
+
+        종료 신호(SystemExit)나 Ctrl+C로 중단되면 리스를 바로 내려놓고 다시 발생시킵니다.
+        그 뒤에 쓰기 스레드가 이 세션을 끝내면 완료 표시가 실패하므로 스냅샷은 되돌려집니다.
+        """
+        try:
+            with LeaseHeartbeat(self.queue, item):
+                session = self.crawler.stream_university(
+                    item.university_code, writer, deadline,
+                    on_end=lambda conn, session, status: self.finish_item(item, conn, session, status))
+                if session is None:
+                    conn = self.queue.connect()
+                    try:
+                        self.queue.retry(conn, item, 'FAILED')
+                    finally:
+                        conn.close()
+                    return None
+                # 커밋될 때까지 리스를 유지해야 하므로 기다린 뒤 연장을 멈춤
+                session.wait()
+        except (SystemExit, KeyboardInterrupt):
+            self.release(item)
+            raise
+        return session.status
+
+    def release(self, item: WorkItem):
+        """중단된 작업의 리스를 별도 연결로 내려놓아 다른 워커가 기다리지 않고 가져가게 합니다."""
+        conn = self.queue.connect()
+        try:
+            if self.queue.release(conn, item):
+                print(f"[{self.worker_id}] {item.university_code} 작업 리스를 내려놓았습니다.")
+        except sqlite3.Error as e:
+            print(f"[{self.worker_id}] {item.university_code} 리스 해제 오류: {e}")
+        finally:
+            conn.close()
+
+    def run_cycle(self) -> Dict[str, Optional[str]]:
+        """현재 주기의 작업을 더 가져갈 것이 없거나 시간 예산이 끝날 때까지 처리합니다."""
+        cycle, elapsed = self.queue.enqueue_cycle(self.crawler.university_configs.keys(), self.interval_minutes)
+
+        # 시간 예산도 워커 시계가 아닌 DB 시계 기준 주기 시작에서 계산
+        deadline = time.monotonic() + self.interval_minutes * 60 * self.cycle_budget - elapsed
+        results = {}
+        with SnapshotWriter(self.crawler.store, self.crawler.writer_queue_size, self.crawler.writer_chunk_size,
+                            self.crawler.writer_group_size) as writer:
+            while self.running and remaining_time(deadline) > 0:
+                item = self.queue.claim(self.worker_id, cycle)
+                if item is None:
+                    break
+                print(f"[{self.worker_id}] {item.university_code} 작업 시작 (주기 {cycle}, {item.attempts}번째 리스)")
+                results[item.university_code] = self.process(item, writer, deadline)
+        return results
+
+    def run(self):
+        """중지될 때까지 주기마다 작업을 가져가 처리합니다.
+
+        작업이 없을 때도 poll_seconds마다 다시 확인해, 다른 워커가 죽어 만료된 리스를 가져갑니다.
+        """
+        print(f"=== 크롤링 워커 시작: {self.worker_id} (리스 {self.queue.lease_seconds}초) ===")
+        while self.running:
+            try:
+                results = self.run_cycle()
+                if results:
+                    summary = ', '.join(f"{code}: {status or 'FAILED'}" for code, status in results.items())
+                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [{self.worker_id}] 처리 완료 - {summary}")
+            except sqlite3.Error as e:
+                print(f"[{self.worker_id}] 작업 큐 오류: {e}")
+            time.sleep(self.poll_seconds)
+
+    def stop(self):
+        self.running = False
+
+
+def print_status(db_path='competition_ratio_enhanced.db', cycles=5):
+    """최근 주기의 작업 상태를 출력합니다."""
+    rows = LeaseQueue(db_path).summary(cycles)
+    if not rows:
+        print("작업 큐가 비어 있습니다.")
+        return
+    print("=== 최근 크롤링 주기 작업 상태 ===")
+    for cycle, status, result_status, count, workers in rows:
+        result = f" ({result_status})" if result_status else ''
+        print(f"{cycle} UTC  {status}{result}: {count}개 작업, 워커 {workers}개")
+
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='분산 크롤링 작업 큐 상태 조회')
+    parser.add_argument('--db', default='competition_ratio_enhanced.db', help='데이터베이스 파일 경로')
+    parser.add_argument('--status', action='store_true', help='최근 주기의 작업 상태 출력 (기본 동작)')
+    parser.add_argument('--cycles', type=int, default=5, help='출력할 최근 주기 수')
+    args = parser.parse_args()
+
+    print_status(args.db, args.cycles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1162 @@
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
+from urllib.parse import urlsplit
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from competition_record import CompetitionRecord, ParsedRow, parsed_row
+from name_normalizer import NameNormalizer
+from resilience import BreakerRegistry, CircuitOpenError, RetryPolicy
+
+try:
+    import brotli  # noqa: F401  urllib3이 br 응답을 풀 수 있을 때만 요청
+    ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'br, gzip, deflate'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+
+# sqlite3.connect 기본 잠금 대기 시간 (5초)
+BUSY_TIMEOUT_MS = 5000
+
+# 페이지에서 전형을 찾지 못한 행의 전형
+DEFAULT_ADMISSION_TYPE = '일반전형'
+
+ADMISSION_PATTERNS = {
+    '학생부교과(교과전형)': ['교과전형'],
+    '학생부교과(지역교과전형)': ['지역교과전형'],
+    '학생부교과(가톨릭지도자추천전형)': ['가톨릭지도자추천전형'],
+    '학생부교과(특성화고전형)': ['특성화고전형'],
+    '학생부교과(기회균형전형)': ['기회균형전형'],
+    '학생부교과(지역기회균형전형)': ['지역기회균형전형'],
+    '학생부종합(종합전형)': ['종합전형'],
+    '학생부종합(지역종합전형)': ['지역종합전형'],
+    '학생부종합(SW전형)': ['SW전형'],
+    '학생부교과(농어촌)': ['농어촌'],
+    '학생부교과(기회균형선발전형)': ['기회균형선발전형'],
+    '학생부교과(성인학습자)': ['성인학습자'],
+    '학생부교과(특성화고졸재직자)': ['특성화고졸재직자']
+}
+
+
+class DeadlineExceeded(Exception):
+    """크롤링 주기의 시간 예산을 넘겨 남은 단계를 취소할 때 발생합니다."""
+
+    def __init__(self, stage: str):
+        super().__init__(f"주기 시간 예산 초과 ({stage} 단계)")
+        self.stage = stage
+
+
+def remaining_time(deadline: Optional[float]) -> Optional[float]:
+    """deadline(time.monotonic() 기준)까지 남은 초를 반환합니다. 기한이 없으면 None."""
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def check_deadline(deadline: Optional[float], stage: str):
+    """기한이 지났으면 DeadlineExceeded를 발생시킵니다."""
+    if deadline is not None and time.monotonic() >= deadline:
+        raise DeadlineExceeded(stage)
+
+
+class HttpFetcher:
+    """페이지 가져오기 단계입니다.
+
+    하나의 세션에서 호스트별 keep-alive 연결 풀을 재사용하고, 압축 응답(gzip, brotli 모듈이
+    있으면 br)을 받으며, 연결/읽기 제한 시간을 따로 둡니다. 응답 본문은 bytes 그대로
+    파서에 넘겨 중간 문자열 사본을 만들지 않습니다.
+    """
+
+    def __init__(self, connect_timeout=5, read_timeout=25, pool_connections=8, pool_maxsize=4,
+                 retry_policy: RetryPolicy = None, breakers: BreakerRegistry = None):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breakers = breakers or BreakerRegistry()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive'
+        })
+
+    @staticmethod
+    def is_retriable(error: Exception) -> bool:
+        """연결 실패, 시간 초과, 5xx/429 응답만 재시도합니다."""
+        if isinstance(error, requests.HTTPError):
+            status = error.response.status_code if error.response is not None else 0
+            return status >= 500 or status == 429
+        return isinstance(error, (requests.ConnectionError, requests.Timeout,
+                                  requests.exceptions.ChunkedEncodingError))
+
+    def request_timeout(self, deadline: Optional[float]) -> Optional[Tuple[float, float]]:
+        """(연결, 읽기) 제한 시간을 남은 예산에 맞춰 줄입니다. 예산이 없으면 None."""
+        remaining = remaining_time(deadline)
+        if remaining is None:
+            return self.connect_timeout, self.read_timeout
+        if remaining <= 0:
+            return None
+        return min(self.connect_timeout, remaining), min(self.read_timeout, remaining)
+
+    def fetch_bytes(self, url: str, deadline: float = None, on_breaker_change=None) -> Optional[bytes]:
+        """웹페이지 본문을 bytes로 가져옵니다 (압축 해제 후).
+
+        일시적 오류는 retry_policy의 간격으로 재시도하되 deadline(time.monotonic() 기준)을
+        넘기는 대기는 하지 않고, 본문을 받는 중에 기한이 지나면 연결을 끊습니다. 호스트의 회로 차단기가 열려 있으면 CircuitOpenError를
+        발생시키고, 시험 요청(HALF_OPEN)은 재시도 없이 한 번만 보냅니다.
+        on_breaker_change(host, 이전 상태, 새 상태, 사유)는 차단기 상태 변화를 받습니다.
+        """
+        if self.request_timeout(deadline) is None:
+            print(f"페이지 요청 생략 ({url}): 시간 예산 소진")
+            return None
+
+        breaker = self.breakers.get(urlsplit(url).netloc)
+        probe = breaker.before_request(on_breaker_change)
+        delays = iter(()) if probe else self.retry_policy.delays()
+
+        attempt = 1
+        host_responded = False
+        while True:
+            timeout = self.request_timeout(deadline)
+            if timeout is None:
+                error = "시간 예산 소진"
+                break
+            try:
+                response = self.session.get(url, timeout=timeout, stream=deadline is not None)
+                response.raise_for_status()
+                content = response.content if deadline is None else self.read_body(response, deadline)
+                breaker.record_success(on_breaker_change)
+                return content
+            except Exception as e:
+                error = str(e)
+                if not self.is_retriable(e):
+                    host_responded = isinstance(e, requests.HTTPError)
+                    break
+                delay = next(delays, None)
+                if delay is None or (deadline is not None and time.monotonic() + delay >= deadline):
+                    break
+                print(f"페이지 요청 실패 ({url}), {delay:.1f}초 후 재시도 ({attempt}/{self.retry_policy.max_attempts}): {e}")
+                time.sleep(delay)
+                attempt += 1
+
+        # 시간 예산 때문에 끊긴 요청은 호스트 상태 판단에서 제외
+        if deadline is not None and time.monotonic() >= deadline:
+            breaker.release_probe()
+            print(f"페이지 요청 중단 ({url}): 시간 예산 소진")
+            return None
+
+        # 서버가 응답한 4xx는 호스트 장애로 보지 않음
+        if host_responded:
+            breaker.record_success(on_breaker_change)
+        else:
+            breaker.record_failure(error, on_breaker_change)
+        print(f"페이지 요청 중 오류 발생 ({url}): {error}")
+        return None
+
+    @staticmethod
+    def read_body(response, deadline: float, chunk_size=65536) -> bytes:
+        """본문을 나눠 받으며 기한이 지나면 연결을 닫고 Timeout을 발생시킵니다."""
+        chunks = []
+        try:
+            for chunk in response.iter_content(chunk_size):
+                if time.monotonic() >= deadline:
+                    raise requests.Timeout("시간 예산 내에 본문을 받지 못함")
+                chunks.append(chunk)
+        finally:
+            response.close()
+        return b''.join(chunks)
+
+    def fetch(self, url: str) -> Optional[str]:
+        """웹페이지를 UTF-8 문자열로 가져옵니다."""
+        try:
+            content = self.fetch_bytes(url)
+        except CircuitOpenError as e:
+            print(f"페이지 요청 생략 ({url}): {e}")
+            return None
+        return content.decode('utf-8', errors='replace') if content is not None else None
+
+
+class ConnectionPool:
+    """DB 경로별로 스레드당 하나의 SQLite 연결을 재사용합니다."""
+
+    def __init__(self):
+        self.local = threading.local()
+
+    def get(self, db_path: str) -> sqlite3.Connection:
+        connections = getattr(self.local, 'connections', None)
+        if connections is None:
+            connections = self.local.connections = {}
+
+        conn = connections.get(db_path)
+        if conn is None:
+            conn = connections[db_path] = sqlite3.connect(db_path)
+        return conn
+
+    def close_all(self):
+        """현재 스레드의 연결을 모두 닫습니다."""
+        for conn in getattr(self.local, 'connections', {}).values():
+            conn.close()
+        self.local.connections = {}
+
+
+# 모든 크롤러가 공유하는 HTTP/DB 자원
+shared_fetcher = HttpFetcher()
+shared_pool = ConnectionPool()
+
+
+class SnapshotStore:
+    """영속화 단계입니다. 확장 스키마(competition_snapshots, crawl_sessions)에 기록합니다.
+
+    대학교/단과대학/학과/전형 ID는 한 번 조회하면 메모리에 보관해 재사용합니다.
+    """
+
+    def __init__(self, db_path='competition_ratio_enhanced.db', listeners=None, pool: ConnectionPool = None):
+        self.db_path = db_path
+        # 스냅샷 저장 후 호출되는 리스너 (변경 이벤트 발행 등)
+        self.listeners = list(listeners) if listeners else []
+        self.pool = pool or shared_pool
+        self.id_cache = {}
+        # 커밋 전에 세션 스냅샷을 직전 세션과 비교하는 검증 단계 (ingest_validator.IngestValidator, 선택)
+        self.validator = None
+        # 스냅샷을 커밋하기 전에 같은 트랜잭션에서 fencing token을 확인하는 리더 잠금 (leader_lock.LeaderLock, 선택)
+        self.fence = None
+
+    def connection(self) -> sqlite3.Connection:
+        return self.pool.get(self.db_path)
+
+    def lookup_id(self, cursor, key: Tuple, select_sql: str, select_params: Tuple,
+                  insert_sql: str = None, insert_params: Tuple = None) -> Optional[int]:
+        """ID를 캐시에서 찾고, 없으면 조회하거나 생성합니다."""
+        cached = self.id_cache.get(key)
+        if cached is not None:
+            return cached
+
+        cursor.execute(select_sql, select_params)
+        result = cursor.fetchone()
+        if result:
+            row_id = result[0]
+        elif insert_sql:
+            cursor.execute(insert_sql, insert_params)
+            row_id = cursor.lastrowid
+        else:
+            return None
+
+        self.id_cache[key] = row_id
+        return row_id
+
+    def get_or_create_ids(self, cursor, university_code: str, college_name: str,
+                          department_name: str, admission_type: str) -> Tuple[int, int, int, int]:
+        """대학교, 단과대학, 학과, 전형 ID를 조회하거나 생성합니다."""
+        university_id = self.university_id(cursor, university_code)
+        if not university_id:
+            print(f"대학교 코드 '{university_code}'를 찾을 수 없습니다.")
+            return None, None, None, None
+
+        college_id = self.lookup_id(
+            cursor, ('college', university_id, college_name),
+            'SELECT id FROM colleges WHERE university_id = ? AND name = ?', (university_id, college_name),
+            'INSERT INTO colleges (university_id, name) VALUES (?, ?)', (university_id, college_name)
+        )
+        department_id = self.lookup_id(
+            cursor, ('department', college_id, department_name),
+            'SELECT id FROM departments WHERE college_id = ? AND name = ?', (college_id, department_name),
+            'INSERT INTO departments (college_id, name, target_department) VALUES (?, ?, TRUE)',
+            (college_id, department_name)
+        )
+        admission_type_id = self.lookup_id(
+            cursor, ('admission_type', admission_type),
+            'SELECT id FROM admission_types WHERE name = ?', (admission_type,),
+            'INSERT INTO admission_types (name, category) VALUES (?, ?)', (admission_type, '미분류')
+        )
+
+        return university_id, college_id, department_id, admission_type_id
+
+    def university_id(self, cursor, university_code: str) -> Optional[int]:
+        return self.lookup_id(cursor, ('university', university_code),
+                              'SELECT id FROM universities WHERE code = ?', (university_code,))
+
+    def start_session(self, university_code: str) -> Optional[str]:
+        """RUNNING 상태의 크롤링 세션을 기록하고 세션 ID를 반환합니다."""
+        conn = self.connection()
+        cursor = conn.cursor()
+
+        university_id = self.university_id(cursor, university_code)
+        if not university_id:
+            print(f"대학교 코드 '{university_code}'를 찾을 수 없습니다.")
+            return None
+
+        session_id = str(uuid.uuid4())
+        self.insert_session(conn, session_id, university_id)
+        conn.commit()
+        return session_id
+
+    def insert_session(self, conn: sqlite3.Connection, session_id: str, university_id: int):
+        """RUNNING 세션 행을 현재 트랜잭션에 추가합니다 (커밋하지 않음)."""
+        conn.execute('''
+            INSERT INTO crawl_sessions (id, university_id, status)
+            VALUES (?, ?, 'RUNNING')
+        ''', (session_id, university_id))
+
+    def open_session(self, university_code: str) -> Optional['CrawlSession']:
+        """RUNNING 세션을 기록하고 with 블록에서 쓸 CrawlSession을 반환합니다."""
+        session_id = self.start_session(university_code)
+        if not session_id:
+            return None
+        return CrawlSession(self, self.connection(), session_id, university_code)
+
+    def set_session_status(self, conn: sqlite3.Connection, session_id: str, status: str,
+                           error_message: str = None, records_collected: int = 0):
+        """세션 상태를 현재 트랜잭션에 기록합니다 (커밋하지 않음)."""
+        conn.execute('''
+            UPDATE crawl_sessions
+            SET end_time = CURRENT_TIMESTAMP, status = ?,
+                error_message = ?, records_collected = ?
+            WHERE id = ?
+        ''', (status, error_message, records_collected, session_id))
+
+    def update_session_status(self, session_id: str, status: str, error_message: str = None,
+                              records_collected: int = 0):
+        """크롤링 세션 상태를 업데이트합니다."""
+        conn = self.connection()
+        self.set_session_status(conn, session_id, status, error_message, records_collected)
+        conn.commit()
+
+    def reap_stale_sessions(self, stale_after_minutes=30) -> int:
+        """프로세스가 죽어 RUNNING으로 남은 세션을 ABORTED로 정리합니다.
+
+        한 주기는 시간 예산 안에서 끝나므로 stale_after_minutes보다 오래된 RUNNING 세션은
+        주인이 없는 세션으로 봅니다. 정리한 세션 수를 반환합니다.
+        """
+        conn = self.connection()
+        cursor = conn.execute('''
+            UPDATE crawl_sessions
+            SET end_time = CURRENT_TIMESTAMP, status = 'ABORTED',
+                error_message = '프로세스 종료로 중단된 세션 (시작 시 정리)'
+            WHERE status = 'RUNNING' AND start_time < datetime('now', ?)
+        ''', (f'-{int(stale_after_minutes)} minutes',))
+        conn.commit()
+        if cursor.rowcount:
+            print(f"중단된 크롤링 세션 {cursor.rowcount}개를 ABORTED로 정리했습니다.")
+        return cursor.rowcount
+
+    def log_breaker_change(self, university_code: str, host: str, old_state: str, new_state: str, reason: str):
+        """회로 차단기 상태 변화를 CIRCUIT_<상태> 세션으로 crawl_sessions에 기록합니다."""
+        print(f"회로 차단기 {host}: {old_state} → {new_state} ({reason})")
+        conn = self.connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO crawl_sessions (id, university_id, end_time, status, error_message)
+            VALUES (?, ?, CURRENT_TIMESTAMP, ?, ?)
+        ''', (str(uuid.uuid4()), self.university_id(cursor, university_code), f'CIRCUIT_{new_state}',
+              f"{host}: {old_state} → {new_state} ({reason})"))
+        conn.commit()
+
+    @contextmanager
+    def lock_wait(self, conn: sqlite3.Connection, deadline: Optional[float]):
+        """블록 안에서 SQLite 잠금 대기를 deadline까지 남은 시간으로 제한합니다."""
+        remaining = remaining_time(deadline)
+        if remaining is None:
+            yield
+            return
+        conn.execute(f'PRAGMA busy_timeout = {max(0, int(remaining * 1000))}')
+        try:
+            yield
+        finally:
+            conn.execute(f'PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}')
+
+    def rollback(self, conn: sqlite3.Connection):
+        """트랜잭션을 되돌리고, 그 안에서 만든 ID가 남지 않도록 ID 캐시를 비웁니다."""
+        conn.rollback()
+        self.id_cache.clear()
+
+    def snapshot_table(self, conn: sqlite3.Connection, snapshot_time: str) -> str:
+        """snapshot_time의 스냅샷을 저장할 테이블 이름을 반환합니다 (파티션 저장소에서 재정의)."""
+        return 'competition_snapshots'
+
+    def insert_snapshots(self, cursor, competition_data: Iterable[CompetitionRecord], session_id: str,
+                         deadline: float = None, snapshot_time: str = None) -> List[CompetitionRecord]:
+        """스냅샷 행을 현재 트랜잭션에 추가하고 저장된 행을 반환합니다 (커밋하지 않음).
+
+        snapshot_time을 주면 여러 번 나눠 저장하는 세션의 행도 같은 시각으로 기록됩니다.
+        저장 중에 deadline이 지나면 DeadlineExceeded를 발생시킵니다.
+        """
+        saved_snapshots = []
+        snapshot_time = snapshot_time or datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        table = self.snapshot_table(cursor.connection, snapshot_time)
+
+        for data in competition_data:
+            check_deadline(deadline, '저장')
+
+            ids = self.get_or_create_ids(
+                cursor,
+                data.university_code,
+                data.college,
+                data.department,
+                data.admission_type
+            )
+
+            if any(id is None for id in ids):
+                continue
+
+            university_id, college_id, department_id, admission_type_id = ids
+
+            try:
+                cursor.execute(f'''
+                    INSERT INTO {table}
+                    (university_id, college_id, department_id, admission_type_id,
+                     recruitment_count, applicant_count, crawl_session_id, snapshot_time)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    university_id, college_id, department_id, admission_type_id,
+                    data.recruitment_count, data.applicant_count, session_id,
+                    snapshot_time
+                ))
+                data.snapshot_time = snapshot_time
+                data.crawl_session_id = session_id
+                saved_snapshots.append(data)
+
+            except sqlite3.Error as e:
+                print(f"데이터 저장 오류: {e}")
+
+        return saved_snapshots
+
+    def quarantine_suspect(self, conn: sqlite3.Connection, session_id: str, university_id: int,
+                           snapshot_time: str) -> Optional[str]:
+        """현재 트랜잭션에 기록된 세션 스냅샷을 검증하고, 의심스러우면 격리 테이블로 옮긴 뒤 사유를 반환합니다."""
+        if self.validator is None:
+            return None
+        table = self.snapshot_table(conn, snapshot_time)
+        reasons = self.validator.validate(conn, table, session_id, university_id)
+        if not reasons:
+            return None
+        reason = '; '.join(reasons)
+        quarantined = self.validator.quarantine(conn, table, session_id, reason)
+        print(f"스냅샷 {quarantined}개 격리: {reason}")
+        return reason
+
+    def fence_schema(self, snapshot_time: Optional[str]) -> Optional[str]:
+        """snapshot_time의 스냅샷이 공유 DB가 아닌 파일에 저장되면 그 스키마 이름을 반환합니다 (파티션 저장소에서 재정의)."""
+        return None
+
+    def check_fence(self, conn: sqlite3.Connection, snapshot_time: str = None):
+        """리더 잠금을 쓰는 경우, 이 프로세스가 가진 fencing token이 아직 최신인지 현재 트랜잭션에서 확인합니다.
+
+        snapshot_time의 스냅샷이 다른 파일에 저장되면 그 파일의 펜스 행도 함께 확인합니다.
+        다른 스케줄러가 리더를 넘겨받았으면 예외를 발생시키며, 호출자는 트랜잭션을 되돌립니다.
+        """
+        if self.fence is not None:
+            self.fence.check(conn, self.fence_schema(snapshot_time))
+
+    def notify(self, saved_snapshots: List[CompetitionRecord], conn: sqlite3.Connection):
+        """커밋된 스냅샷을 리스너에게 전달합니다."""
+        for listener in self.listeners:
+            try:
+                listener.on_snapshots(saved_snapshots, conn)
+            except Exception as e:
+                print(f"스냅샷 리스너 오류 ({type(listener).__name__}): {e}")
+
+    def save_competition_data(self, competition_data: List[CompetitionRecord], session_id: str,
+                              deadline: float = None) -> int:
+        """경쟁률 데이터를 데이터베이스에 저장합니다.
+
+        deadline이 있으면 잠금 대기를 남은 시간으로 제한하고, 저장 중에 기한이 지나면
+        이 대학교의 저장분을 되돌린 뒤 DeadlineExceeded를 발생시킵니다.
+        """
+        conn = self.connection()
+        with self.lock_wait(conn, deadline):
+            try:
+                saved_snapshots = self.insert_snapshots(conn.cursor(), competition_data, session_id, deadline)
+                self.check_fence(conn, saved_snapshots[0].snapshot_time if saved_snapshots else None)
+                conn.commit()
+            except Exception:
+                self.rollback(conn)
+                raise
+
+        self.notify(saved_snapshots, conn)
+        return len(saved_snapshots)
+
+
+class CrawlSession:
+    """크롤링 세션 하나의 수명 주기를 관리합니다 (SnapshotStore.open_session()으로 생성).
+
+    세션의 모든 기록은 스토어의 풀 연결 하나로 합니다. 상태를 정하지 않은 채 예외로 with 블록을
+    빠져나가면 FAILED, 인터럽트나 종료 신호로 빠져나가면 ABORTED로 기록합니다.
+    """
+
+    def __init__(self, store: SnapshotStore, conn: sqlite3.Connection, session_id: str, university_code: str):
+        self.store = store
+        self.conn = conn
+        self.id = session_id
+        self.university_code = university_code
+        self.status = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.status is None:
+            if exc_type is None:
+                self.finish('COMPLETED')
+            else:
+                self.store.rollback(self.conn)
+                status = 'FAILED' if issubclass(exc_type, Exception) else 'ABORTED'
+                self.finish(status, str(exc) or exc_type.__name__)
+        return False
+
+    def save(self, competition_data: List[CompetitionRecord], deadline: float = None) -> int:
+        """스냅샷 행과 세션의 COMPLETED 기록을 한 트랜잭션으로 저장합니다.
+
+        검증에서 의심스러운 묶음으로 판정되면 스냅샷은 격리 테이블로 옮기고 세션을 QUARANTINED로 기록한 뒤 0을 반환합니다.
+        """
+        with self.store.lock_wait(self.conn, deadline):
+            try:
+                cursor = self.conn.cursor()
+                saved_snapshots = self.store.insert_snapshots(cursor, competition_data, self.id, deadline)
+                snapshot_time = saved_snapshots[0].snapshot_time if saved_snapshots else None
+                reason = None
+                if saved_snapshots:
+                    reason = self.store.quarantine_suspect(
+                        self.conn, self.id, self.store.university_id(cursor, self.university_code), snapshot_time)
+                if reason:
+                    status, saved_snapshots = 'QUARANTINED', []
+                else:
+                    status = 'COMPLETED'
+                self.store.check_fence(self.conn, snapshot_time)
+                self.store.set_session_status(self.conn, self.id, status, reason,
+                                              records_collected=len(saved_snapshots))
+                self.conn.commit()
+            except Exception:
+                self.store.rollback(self.conn)
+                raise
+
+        self.status = status
+        self.store.notify(saved_snapshots, self.conn)
+        return len(saved_snapshots)
+
+    def finish(self, status: str, error_message: str = None, records_collected: int = 0):
+        """세션을 주어진 상태로 끝냅니다."""
+        self.store.set_session_status(self.conn, self.id, status, error_message, records_collected)
+        self.conn.commit()
+        self.status = status
+
+
+class StreamSession:
+    """SnapshotWriter로 스냅샷을 나눠 보내는 크롤링 세션입니다 (SnapshotWriter.open_session()으로 생성).
+
+    가져오기/파싱 스레드는 write()와 finish()만 호출하고, 실제 기록과 최종 상태(status, saved)는
+    쓰기 스레드가 커밋한 뒤 채웁니다. wait()로 커밋을 기다릴 수 있습니다.
+    """
+
+    def __init__(self, writer: 'SnapshotWriter', session_id: str, university_id: int, university_code: str,
+                 name: str = None, on_end: Callable = None):
+        self.writer = writer
+        self.id = session_id
+        self.university_id = university_id
+        self.university_code = university_code
+        self.name = name or university_code
+        self.snapshot_time = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+        self.status = None
+        self.error_message = None
+        self.saved = 0
+        self.saved_snapshots = []
+        # 쓰기 스레드가 세션을 끝낼 때 같은 트랜잭션에서 호출하는 함수 (conn, session, status), 예외를 내면 세션이 실패함
+        self.on_end = on_end
+        self.started = False  # 쓰기 스레드가 세션 기록과 SAVEPOINT를 열었는지
+        self.done = threading.Event()
+
+    def write(self, competition_data: Iterable[CompetitionRecord], deadline: float = None) -> int:
+        """행을 chunk_size개씩 쓰기 큐에 넣고 보낸 행 수를 반환합니다.
+
+        큐가 가득 차면 쓰기 스레드가 따라잡을 때까지 기다리며, 그 사이 deadline이 지나면
+        DeadlineExceeded를 발생시킵니다.
+        """
+        sent = 0
+        chunk = []
+        for record in competition_data:
+            chunk.append(record)
+            if len(chunk) >= self.writer.chunk_size:
+                self.writer.put(('rows', self, chunk, deadline), deadline)
+                sent += len(chunk)
+                chunk = []
+                if self.status is not None:
+                    return sent  # 쓰기 스레드가 이미 세션을 취소함
+        if chunk:
+            self.writer.put(('rows', self, chunk, deadline), deadline)
+            sent += len(chunk)
+        return sent
+
+    def finish(self, status: str, error_message: str = None):
+        """세션을 끝냅니다. 실패 상태면 쓰기 스레드가 이 세션의 저장분을 되돌립니다."""
+        self.writer.put(('finish', self, status, error_message))
+
+    def wait(self, timeout: float = None) -> bool:
+        """쓰기 스레드가 이 세션을 커밋(또는 취소)할 때까지 기다립니다."""
+        return self.done.wait(timeout)
+
+
+class SnapshotWriter:
+    """전용 스레드에서 여러 대학교의 스냅샷을 모아 커밋하는 쓰기 단계입니다.
+
+    큐 크기가 queue_size로 제한되어 있어 쓰기가 밀리면 가져오기/파싱 스레드가 put()에서 기다립니다.
+    한 세션의 스냅샷은 SAVEPOINT로 묶어 실패하면 그 세션만 되돌리고, 세션 기록과 스냅샷은 같은 커밋에 들어갑니다.
+    커밋은 세션이 끝났을 때 큐가 비었거나 group_size개 세션이 쌓였으면 한 번에 합니다 (group commit).
+    """
+
+    def __init__(self, store: SnapshotStore, queue_size=8, chunk_size=200, group_size=8):
+        self.store = store
+        self.chunk_size = chunk_size
+        self.group_size = group_size
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.group = []  # 커밋을 기다리는 끝난 세션
+        self.thread = None
+
+    def start(self) -> 'SnapshotWriter':
+        self.thread = threading.Thread(target=self.run, name='snapshot-writer', daemon=True)
+        self.thread.start()
+        return self
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def put(self, item: Tuple, deadline: float = None):
+        """쓰기 큐에 넣습니다. 큐가 가득 찬 채 deadline이 지나면 DeadlineExceeded를 발생시킵니다."""
+        if deadline is None or item[0] != 'rows':
+            self.queue.put(item)
+            return
+        try:
+            self.queue.put(item, timeout=max(0, remaining_time(deadline)))
+        except queue.Full:
+            raise DeadlineExceeded('저장') from None
+
+    def open_session(self, university_code: str, name: str = None, on_end: Callable = None) -> Optional[StreamSession]:
+        """세션을 만들고 쓰기 스레드에 RUNNING 기록을 요청합니다."""
+        university_id = self.store.university_id(self.store.connection().cursor(), university_code)
+        if not university_id:
+            print(f"대학교 코드 '{university_code}'를 찾을 수 없습니다.")
+            return None
+        session = StreamSession(self, str(uuid.uuid4()), university_id, university_code, name, on_end)
+        self.put(('open', session))
+        return session
+
+    def close(self):
+        """남은 항목을 모두 기록하고 쓰기 스레드를 끝냅니다."""
+        if self.thread:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        conn = self.store.connection()
+        try:
+            while True:
+                item = self.queue.get()
+                if item is None:
+                    break
+                kind, session = item[0], item[1]
+                try:
+                    if kind == 'open':
+                        self.begin(conn, session)
+                    elif kind == 'rows':
+                        self.write_rows(conn, session, item[2], item[3])
+                    elif kind == 'finish':
+                        self.end(conn, session, item[2], item[3])
+                except Exception as e:
+                    # 쓰기 스레드가 멈추면 put()에서 기다리는 스레드도 멈추므로 세션만 실패 처리
+                    print(f"스냅샷 쓰기 오류 ({session.name}): {e}")
+                    try:
+                        self.end(conn, session, 'FAILED', str(e))
+                    except sqlite3.Error:
+                        self.discard(session, str(e))
+                if kind == 'finish' and (self.queue.empty() or len(self.group) >= self.group_size):
+                    self.commit(conn)
+            self.commit(conn)
+        finally:
+            self.store.pool.close_all()
+
+    def begin(self, conn: sqlite3.Connection, session: StreamSession):
+        try:
+            self.store.snapshot_table(conn, session.snapshot_time)
+        except sqlite3.OperationalError:
+            # 파티션 ATTACH는 트랜잭션 밖에서만 가능하므로 쌓인 세션을 먼저 커밋
+            self.commit(conn)
+            self.store.snapshot_table(conn, session.snapshot_time)
+
+    def savepoint(self, conn: sqlite3.Connection, session: StreamSession):
+        """세션의 첫 행(또는 종료)이 도착하면 세션을 기록하고 SAVEPOINT를 엽니다.
+
+        가져오는 동안에는 쓰기 트랜잭션을 시작하지 않으므로, 같은 DB를 쓰는 다른 프로세스를 막지 않습니다.
+        """
+        if not session.started:
+            self.store.insert_session(conn, session.id, session.university_id)
+            conn.execute(f'SAVEPOINT "{session.id}"')
+            session.started = True
+
+    def discard(self, session: StreamSession, error_message: str):
+        """기록하지 못한 세션을 FAILED로 끝냅니다 (DB에는 남기지 못함)."""
+        if session.status is None:
+            session.status = 'FAILED'
+            session.error_message = error_message
+            session.saved = 0
+            session.saved_snapshots = []
+            self.group.append(session)
+
+    def write_rows(self, conn: sqlite3.Connection, session: StreamSession,
+                   competition_data: List[CompetitionRecord], deadline: Optional[float]):
+        if session.status is not None:
+            return  # 이미 취소된 세션의 남은 행
+        try:
+            with self.store.lock_wait(conn, deadline):
+                self.savepoint(conn, session)
+                saved_snapshots = self.store.insert_snapshots(conn.cursor(), competition_data, session.id,
+                                                              deadline, session.snapshot_time)
+        except DeadlineExceeded as e:
+            self.end(conn, session, 'CANCELLED', str(e))
+            return
+        except sqlite3.Error as e:
+            self.end(conn, session, 'FAILED', str(e))
+            return
+
+        session.saved += len(saved_snapshots)
+        if self.store.listeners:
+            session.saved_snapshots.extend(saved_snapshots)
+
+    def end(self, conn: sqlite3.Connection, session: StreamSession, status: str, error_message: str = None):
+        if session.status is not None:
+            return  # 쓰기 스레드가 먼저 취소한 세션
+        self.savepoint(conn, session)
+        if status == 'COMPLETED' and session.saved:
+            reason = self.store.quarantine_suspect(conn, session.id, session.university_id, session.snapshot_time)
+            if reason:
+                status, error_message = 'QUARANTINED', reason
+                session.saved = 0
+                session.saved_snapshots = []
+        elif status != 'COMPLETED':
+            conn.execute(f'ROLLBACK TO "{session.id}"')
+            # 되돌린 구간에서 만든 ID가 남지 않도록 캐시를 비움
+            self.store.id_cache.clear()
+            session.saved = 0
+            session.saved_snapshots = []
+        if status in ('COMPLETED', 'QUARANTINED'):
+            self.store.check_fence(conn, session.snapshot_time)
+        if session.on_end:
+            session.on_end(conn, session, status)
+        conn.execute(f'RELEASE "{session.id}"')
+        self.store.set_session_status(conn, session.id, status, error_message, session.saved)
+        session.status = status
+        session.error_message = error_message
+        self.group.append(session)
+
+    def commit(self, conn: sqlite3.Connection):
+        """끝난 세션들을 한 번에 커밋하고 리스너에 알립니다."""
+        if not self.group:
+            return
+        group, self.group = self.group, []
+        try:
+            conn.commit()
+        except sqlite3.Error as e:
+            self.store.rollback(conn)
+            print(f"스냅샷 묶음 커밋 실패 ({len(group)}개 세션): {e}")
+            for session in group:
+                session.status = 'FAILED'
+                session.error_message = f"커밋 실패: {e}"
+                session.saved = 0
+                session.saved_snapshots = []
+            try:
+                for session in group:
+                    self.store.insert_session(conn, session.id, session.university_id)
+                    self.store.set_session_status(conn, session.id, 'FAILED', session.error_message)
+                conn.commit()
+            except sqlite3.Error:
+                self.store.rollback(conn)
+
+        saved_snapshots = []
+        for session in group:
+            if session.status == 'COMPLETED' and session.saved:
+                print(f"{session.name}: {session.saved}개 레코드 저장 완료")
+            elif session.status == 'QUARANTINED':
+                print(f"{session.name}: 검증 실패로 격리 ({session.error_message})")
+            saved_snapshots.extend(session.saved_snapshots)
+            session.saved_snapshots = []
+            session.done.set()
+        if saved_snapshots:
+            self.store.notify(saved_snapshots, conn)
+
+
+def save_legacy_competition_data(data: List[CompetitionRecord], db_path='competition_ratio.db', pool: ConnectionPool = None):
+    """단일 대학교 크롤러의 데이터를 기존 competition_data 테이블에 저장합니다."""
+    conn = (pool or shared_pool).get(db_path)
+    cursor = conn.cursor()
+
+    for item in data:
+        try:
+            cursor.execute('''
+                INSERT OR REPLACE INTO competition_data
+                (college, department, admission_type, recruitment_count,
+                 applicant_count, competition_ratio, crawl_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                item.college,
+                item.department,
+                item.admission_type,
+                item.recruitment_count,
+                item.applicant_count,
+                item.competition_ratio,
+                datetime.now()
+            ))
+        except sqlite3.Error as e:
+            print(f"데이터베이스 저장 오류: {e}")
+
+    conn.commit()
+    print(f"{len(data)}개의 레코드가 저장되었습니다.")
+
+
+def find_admission_type_in_context(element) -> str:
+    """요소의 컨텍스트(앞 형제 요소, 부모)에서 전형 타입을 찾습니다."""
+    context_text = ""
+    current = element
+    for _ in range(10):
+        current = current.find_previous_sibling()
+        if current:
+            context_text += " " + current.get_text()
+        else:
+            break
+
+    parent = element.parent
+    if parent:
+        context_text += " " + parent.get_text()
+
+    for admission_type, patterns in ADMISSION_PATTERNS.items():
+        if any(pattern in context_text for pattern in patterns):
+            return admission_type
+
+    return DEFAULT_ADMISSION_TYPE
+
+
+def make_soup(html_content: Union[str, bytes]) -> BeautifulSoup:
+    """HTML을 파싱합니다. bytes는 인코딩 추측 없이 UTF-8로 디코딩합니다."""
+    if isinstance(html_content, bytes):
+        return BeautifulSoup(html_content, 'html.parser', from_encoding='utf-8')
+    return BeautifulSoup(html_content, 'html.parser')
+
+
+def parse_jinhakapply_rows(html_content: Union[str, bytes], adapter) -> Iterator[ParsedRow]:
+    """addon.jinhakapply.com 표에서 정리 전 행을 하나씩 추출합니다."""
+    soup = make_soup(html_content)
+    tables = soup.find_all('table')
+    print(f"{adapter.name}: {len(tables)}개 테이블 발견")
+
+    for table in tables:
+        current_admission_type = find_admission_type_in_context(table)
+
+        for row in table.find_all('tr'):
+            cells = row.find_all(['td', 'th'])
+            if len(cells) >= 5:
+                cell_texts = [cell.get_text(strip=True) for cell in cells]
+                yield parsed_row(cell_texts, current_admission_type)
+
+
+def parse_uwayapply_rows(html_content: Union[str, bytes], adapter) -> Iterator[ParsedRow]:
+    """ratio.uwayapply.com 표에서 정리 전 행을 하나씩 추출합니다."""
+    soup = make_soup(html_content)
+    tables = soup.find_all('table')
+    print(f"{adapter.name}: {len(tables)}개 테이블 발견")
+
+    for table in tables:
+        for row in table.find_all('tr'):
+            cells = row.find_all(['td', 'th'])
+            if len(cells) >= 5:
+                cell_texts = [cell.get_text(strip=True) for cell in cells]
+                # uwayapply는 전형 구분이 명확하지 않음
+                yield parsed_row(cell_texts, DEFAULT_ADMISSION_TYPE)
+
+
+SITE_ROW_PARSERS = {
+    'jinhakapply': parse_jinhakapply_rows,
+    'uwayapply': parse_uwayapply_rows
+}
+
+
+def normalize_rows(rows: Iterable[ParsedRow], adapter, normalizer: NameNormalizer) -> Iterator[CompetitionRecord]:
+    """정리 단계: 사이트 어댑터 규칙으로 대상 행을 고르고 학과명과 인원을 정리합니다 (행 단위 스트리밍)."""
+    for row in rows:
+        college_name = row.college
+        clean_department = adapter.match(college_name, row.department_raw, normalizer)
+        if clean_department is None:
+            continue
+
+        # jinhakapply는 단과대학 칸이 비어 있으면 대상 단과대학으로 기록
+        if not college_name and adapter.family == 'jinhakapply':
+            college_name = adapter.target_college
+
+        yield CompetitionRecord(
+            adapter.code, college_name, clean_department, row.admission_type,
+            normalizer.number(row.recruitment_text), normalizer.number(row.applicant_text)
+        )
+
+
+class CrawlPipeline:
+    """fetch → parse → normalize → persist 단계로 구성된 다중 대학교 크롤링 파이프라인입니다.
+
+    university_configs의 각 항목은 'url', 'parser'(HTML bytes, 대학교 코드 → 행 이터러블)와
+    선택적으로 'name', 'normalize'(행 이터러블, 대학교 코드 → 정리된 행 이터러블)를 가집니다.
+    가져오기와 영속화 단계는 fetcher/store로 교체할 수 있습니다.
+    """
+
+    # 전체 크롤링의 쓰기 큐 크기(묶음 수), 묶음당 행 수, 한 번에 커밋할 최대 세션 수
+    writer_queue_size = 8
+    writer_chunk_size = 200
+    writer_group_size = 8
+
+    # 학과명/숫자 정규화 캐시 (인스턴스 간 공유, 규칙 집합이 다른 하위 클래스는 재정의)
+    normalizer = NameNormalizer()
+
+    def __init__(self, university_configs: Dict[str, Dict], db_path='competition_ratio_enhanced.db',
+                 listeners=None, fetcher: HttpFetcher = None, store: SnapshotStore = None,
+                 request_interval=2):
+        self.university_configs = university_configs
+        self.fetcher = fetcher or shared_fetcher
+        self.store = store or SnapshotStore(db_path, listeners)
+        self.request_interval = request_interval
+        self.cut_off = []  # 마지막 주기에서 시간 예산 초과로 취소된 대학교 코드
+
+    @property
+    def db_path(self) -> str:
+        return self.store.db_path
+
+    @property
+    def listeners(self) -> List:
+        return self.store.listeners
+
+    @property
+    def session(self) -> requests.Session:
+        return self.fetcher.session
+
+    def fetch_page(self, url: str) -> Optional[str]:
+        """웹페이지를 가져옵니다."""
+        return self.fetcher.fetch(url)
+
+    def extract_number(self, text: str) -> int:
+        """텍스트에서 숫자를 추출합니다."""
+        return self.normalizer.number(text)
+
+    def log_breaker_change(self, university_code: str, host: str, old_state: str, new_state: str, reason: str):
+        """회로 차단기 상태 변화를 crawl_sessions에 기록합니다."""
+        self.store.log_breaker_change(university_code, host, old_state, new_state, reason)
+
+    def save_competition_data(self, competition_data: List[CompetitionRecord], session_id: str,
+                              deadline: float = None) -> int:
+        """경쟁률 데이터를 데이터베이스에 저장합니다."""
+        return self.store.save_competition_data(competition_data, session_id, deadline)
+
+    def update_session_status(self, session_id: str, status: str, error_message: str = None,
+                              records_collected: int = 0):
+        """크롤링 세션 상태를 업데이트합니다."""
+        self.store.update_session_status(session_id, status, error_message, records_collected)
+
+    def crawl_university(self, university_code: str, deadline: float = None) -> bool:
+        """특정 대학교의 경쟁률 데이터를 크롤링합니다.
+
+        세션 기록과 스냅샷 저장은 CrawlSession 하나(풀 연결 하나)로 하고, 스냅샷과 완료 상태는
+        같은 트랜잭션으로 커밋합니다. deadline(time.monotonic() 기준)이 있으면 가져오기/파싱/저장
+        단계마다 남은 시간을 확인하고, 기한을 넘기면 세션을 CANCELLED로 기록한 뒤 False를 반환합니다.
+        """
+        config = self.university_configs.get(university_code)
+        if not config:
+            print(f"대학교 코드 '{university_code}' 설정을 찾을 수 없습니다.")
+            return False
+
+        name = config.get('name', university_code)
+        session = self.store.open_session(university_code)
+        if not session:
+            return False
+
+        with session:
+            try:
+                check_deadline(deadline, '시작')
+                print(f"\n=== {name} 크롤링 시작 ===")
+
+                html_content = self.fetcher.fetch_bytes(
+                    config['url'], deadline=deadline,
+                    on_breaker_change=partial(self.store.log_breaker_change, university_code))
+                if not html_content:
+                    check_deadline(deadline, '가져오기')
+                    session.finish('FAILED', '웹페이지 로드 실패')
+                    return False
+
+                check_deadline(deadline, '파싱')
+                competition_data = config['parser'](html_content, university_code)
+                normalize: Optional[Callable] = config.get('normalize')
+                if normalize:
+                    competition_data = normalize(competition_data, university_code)
+                competition_data = list(competition_data)
+
+                if not competition_data:
+                    session.finish('COMPLETED', '수집된 데이터 없음')
+                    print(f"{name}: 수집된 데이터가 없습니다.")
+                    return True
+
+                check_deadline(deadline, '저장')
+                saved_count = session.save(competition_data, deadline)
+                if session.status == 'QUARANTINED':
+                    print(f"{name}: 검증 실패로 격리되어 저장하지 않았습니다.")
+                    return False
+
+                print(f"{name}: {saved_count}개 레코드 저장 완료")
+                return True
+
+            except DeadlineExceeded as e:
+                session.finish('CANCELLED', str(e))
+                self.cut_off.append(university_code)
+                print(f"{name} 크롤링 취소: {e}")
+                return False
+
+            except CircuitOpenError as e:
+                session.finish('SKIPPED', str(e))
+                print(f"{name} 크롤링 생략: {e}")
+                return False
+
+            except Exception as e:
+                session.finish('FAILED', str(e))
+                print(f"{name} 크롤링 중 오류: {e}")
+                return False
+
+    def stream_university(self, university_code: str, writer: SnapshotWriter,
+                          deadline: float = None, on_end: Callable = None) -> Optional[StreamSession]:
+        """특정 대학교를 가져와 파싱하면서 정리된 행을 쓰기 스레드로 흘려보냅니다.
+
+        행 목록을 한꺼번에 만들지 않고 묶음 단위로 큐에 넣으므로, 이 대학교의 저장은
+        다음 대학교를 가져오는 동안 진행됩니다. 결과(status)는 writer가 커밋한 뒤 정해집니다.
+        on_end는 쓰기 스레드가 세션을 끝낼 때 같은 트랜잭션에서 호출됩니다 (StreamSession 참고).
+        """
+        config = self.university_configs.get(university_code)
+        if not config:
+            print(f"대학교 코드 '{university_code}' 설정을 찾을 수 없습니다.")
+            return None
+
+        name = config.get('name', university_code)
+        session = writer.open_session(university_code, name, on_end)
+        if not session:
+            return None
+
+        try:
+            check_deadline(deadline, '시작')
+            print(f"\n=== {name} 크롤링 시작 ===")
+
+            html_content = self.fetcher.fetch_bytes(
+                config['url'], deadline=deadline,
+                on_breaker_change=partial(self.store.log_breaker_change, university_code))
+            if not html_content:
+                check_deadline(deadline, '가져오기')
+                session.finish('FAILED', '웹페이지 로드 실패')
+                return session
+
+            check_deadline(deadline, '파싱')
+            competition_data = config['parser'](html_content, university_code)
+            normalize: Optional[Callable] = config.get('normalize')
+            if normalize:
+                competition_data = normalize(competition_data, university_code)
+
+            if not session.write(competition_data, deadline):
+                session.finish('COMPLETED', '수집된 데이터 없음')
+                print(f"{name}: 수집된 데이터가 없습니다.")
+                return session
+
+            session.finish('COMPLETED')
+            return session
+
+        except DeadlineExceeded as e:
+            session.finish('CANCELLED', str(e))
+            print(f"{name} 크롤링 취소: {e}")
+            return session
+
+        except CircuitOpenError as e:
+            session.finish('SKIPPED', str(e))
+            print(f"{name} 크롤링 생략: {e}")
+            return session
+
+        except Exception as e:
+            session.finish('FAILED', str(e))
+            print(f"{name} 크롤링 중 오류: {e}")
+            return session
+
+        except BaseException as e:
+            session.finish('ABORTED', str(e) or type(e).__name__)
+            raise
+
+    def reap_stale_sessions(self, stale_after_minutes=30) -> int:
+        """이전 프로세스가 RUNNING으로 남긴 세션을 ABORTED로 정리합니다."""
+        return self.store.reap_stale_sessions(stale_after_minutes)
+
+    def crawl_all_universities(self, deadline: float = None):
+        """모든 대학교의 경쟁률 데이터를 크롤링합니다.
+
+        가져오기/파싱은 이 스레드에서, 저장은 SnapshotWriter 스레드에서 진행해 대학교 사이에서 겹치며,
+        쓰기가 밀리면 쓰기 큐가 비워질 때까지 다음 요청을 미룹니다.
+        deadline(time.monotonic() 기준)을 넘기면 남은 대학교는 요청 없이 CANCELLED로 기록하고,
+        이미 끝난 대학교의 저장분은 그대로 유지합니다. 잘린 대학교 코드는 cut_off에 남습니다.
+        """
+        print("=== 다중 대학교 경쟁률 크롤링 시작 ===")
+        start_time = datetime.now()
+        self.cut_off = []
+
+        sessions = {}
+        with SnapshotWriter(self.store, self.writer_queue_size, self.writer_chunk_size,
+                            self.writer_group_size) as writer:
+            for index, university_code in enumerate(self.university_configs.keys()):
+                if index and self.request_interval:
+                    remaining = remaining_time(deadline)
+                    # 요청 간 간격 (기한을 넘겨 기다리지 않음)
+                    time.sleep(self.request_interval if remaining is None
+                               else max(0, min(self.request_interval, remaining)))
+                sessions[university_code] = self.stream_university(university_code, writer, deadline)
+
+        results = {}
+        quarantined = []
+        for university_code, session in sessions.items():
+            results[university_code] = session is not None and session.status == 'COMPLETED'
+            if session is not None and session.status == 'CANCELLED':
+                self.cut_off.append(university_code)
+            elif session is not None and session.status == 'QUARANTINED':
+                quarantined.append(university_code)
+
+        duration = (datetime.now() - start_time).total_seconds()
+
+        print("\n=== 크롤링 결과 요약 ===")
+        for university_code, success in results.items():
+            name = self.university_configs[university_code].get('name', university_code)
+            if success:
+                status = "✅ 성공"
+            elif university_code in self.cut_off:
+                status = "⏱ 시간 초과로 취소"
+            elif university_code in quarantined:
+                status = "🚧 검증 실패로 격리"
+            else:
+                status = "❌ 실패"
+            print(f"{university_code} ({name}): {status}")
+
+        if self.cut_off:
+            print(f"시간 예산 초과로 취소된 대학교: {', '.join(self.cut_off)}")
+
+        print(self.normalizer.report())
+        print(f"총 소요 시간: {duration:.1f}초")
+        print("=== 크롤링 완료 ===")
+        return results
@@ -0,0 +1,234 @@
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterator
+
+DASHBOARD_HTML = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>대학교 경쟁률 대시보드</title>
+<script src="plotly.min.js"></script>
+<style>
+  body { font-family: sans-serif; margin: 16px; }
+  #status { color: #666; font-size: 13px; }
+  .chart { width: 100%; height: 420px; }
+</style>
+</head>
+<body>
+<h2>대학교 경쟁률 대시보드</h2>
+<label>대학교 <select id="university"></select></label>
+<span id="status"></span>
+<div id="ratio" class="chart"></div>
+<div id="applicants" class="chart"></div>
+<script>
+// 대학교별 NDJSON 파일을 마지막으로 읽은 바이트 위치부터 이어서 가져옵니다.
+// 각 행: [snapshot_time, department, admission_type, recruitment_count, applicant_count]
+const state = {};
+let manifest = null;
+
+// 매니페스트가 공개한 end 바이트까지만 요청합니다. 파일에는 매니페스트보다 먼저 추가되므로
+// 그 뒤의 바이트는 아직 쓰는 중인 줄일 수 있습니다.
+async function fetchText(url, offset, end) {
+  const headers = { 'Range': 'bytes=' + offset + '-' + (end - 1) };
+  const res = await fetch(url, { headers: headers, cache: 'no-store' });
+  if (res.status === 416) return { partial: true, text: '' };
+  const partial = res.status === 206;
+  const bytes = await res.arrayBuffer();
+  // Range를 무시한 서버는 파일 전체를 보내므로 공개된 길이까지만 사용
+  return { partial: partial, text: new TextDecoder().decode(partial ? bytes : bytes.slice(0, end)) };
+}
+
+async function loadUniversity(code) {
+  const info = manifest.universities[code];
+  let s = state[code];
+  if (!s || info.bytes < s.offset) {
+    s = state[code] = { offset: 0, series: {} };
+  }
+  if (info.bytes === s.offset) return s;
+
+  const result = await fetchText('data/' + info.file, s.offset, info.bytes);
+  if (!result.partial) s.series = {};
+  for (const line of result.text.split('\\n')) {
+    if (!line) continue;
+    const [t, dept, adm, recruitment, applicants] = JSON.parse(line);
+    const key = dept + ' - ' + adm;
+    const series = s.series[key] || (s.series[key] = { x: [], ratio: [], applicants: [] });
+    series.x.push(t);
+    series.applicants.push(applicants);
+    series.ratio.push(recruitment > 0 ? applicants / recruitment : 0);
+  }
+  s.offset = info.bytes;
+  return s;
+}
+
+function render(code, s) {
+  const keys = Object.keys(s.series).sort();
+  const ratioTraces = keys.map(k => ({ x: s.series[k].x, y: s.series[k].ratio, name: k, mode: 'lines' }));
+  const applicantTraces = keys.map(k => ({ x: s.series[k].x, y: s.series[k].applicants, name: k, mode: 'lines' }));
+  Plotly.react('ratio', ratioTraces, { title: manifest.universities[code].name + ' 경쟁률 변화', yaxis: { title: '경쟁률' } });
+  Plotly.react('applicants', applicantTraces, { title: '지원자 수 변화', yaxis: { title: '지원자 수' } });
+}
+
+async function refresh() {
+  const res = await fetch('data/manifest.json', { cache: 'no-store' });
+  manifest = await res.json();
+  const select = document.getElementById('university');
+  if (!select.options.length) {
+    for (const code of Object.keys(manifest.universities).sort()) {
+      select.add(new Option(manifest.universities[code].name + ' (' + code + ')', code));
+    }
+    select.onchange = refresh;
+  }
+  const code = select.value;
+  if (code) render(code, await loadUniversity(code));
+  document.getElementById('status').textContent = ' 업데이트: ' + manifest.updated_at;
+}
+
+refresh();
+setInterval(refresh, 60000);
+</script>
+</body>
+</html>
+"""
+
+
+class IncrementalDashboardWriter:
+    """크롤링 세션마다 새 스냅샷만 추가하는 정적 대시보드 작성기입니다.
+
+    페이지 셸(index.html)과 plotly.js는 한 번만 기록하고, 데이터는 대학교별
+    NDJSON 파일(data/<코드>.ndjson)에 마지막으로 내보낸 스냅샷 ID 이후의 행만 추가합니다.
+    페이지는 Range 요청으로 새로 추가된 부분만 가져옵니다.
+    (file://에서는 fetch가 막히므로 `python3 -m http.server`로 제공해야 합니다.)
+    partition_dir을 주면 월별 파티션의 스냅샷도 PartitionRouter로 읽습니다.
+    """
+
+    def __init__(self, db_path='competition_ratio_enhanced.db', output_dir='dashboard', partition_dir=None):
+        self.db_path = db_path
+        self.output_dir = output_dir
+        # 월별 파티션 DB를 쓰는 경우 새 스냅샷이 있는 파티션만 연결
+        self.router = None
+        if partition_dir:
+            from partitioned_store import PartitionRouter
+            self.router = PartitionRouter(db_path, partition_dir)
+        self.data_dir = os.path.join(output_dir, 'data')
+        self.manifest_path = os.path.join(self.data_dir, 'manifest.json')
+
+    def write_shell(self):
+        """페이지 셸과 plotly.js가 없을 때만 기록합니다."""
+        os.makedirs(self.data_dir, exist_ok=True)
+
+        plotly_path = os.path.join(self.output_dir, 'plotly.min.js')
+        if not os.path.exists(plotly_path):
+            from plotly.offline import get_plotlyjs
+            with open(plotly_path, 'w', encoding='utf-8') as f:
+                f.write(get_plotlyjs())
+
+        index_path = os.path.join(self.output_dir, 'index.html')
+        if not os.path.exists(index_path):
+            with open(index_path, 'w', encoding='utf-8') as f:
+                f.write(DASHBOARD_HTML)
+
+    def load_manifest(self) -> Dict:
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {'last_snapshot_id': 0, 'universities': {}}
+
+    def save_manifest(self, manifest: Dict):
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, self.manifest_path)
+
+    def connections(self, last_id: int) -> Iterator[sqlite3.Connection]:
+        """last_id 이후 스냅샷을 읽을 연결을 ID 순서대로 반환합니다.
+
+        파티션의 스냅샷 ID는 생성 순서대로 이어지므로, 시퀀스가 last_id를 넘은 파티션만
+        한 달씩 연결합니다 (ATTACH 한도와 무관, 공유 DB의 이전 행은 첫 연결에서 읽힘).
+        """
+        if not self.router:
+            yield sqlite3.connect(self.db_path)
+            return
+
+        from partitioned_store import sequence_value
+        keys = []
+        for key in self.router.partitions.keys():
+            conn = sqlite3.connect(self.router.partitions.path(key))
+            if sequence_value(conn) > last_id:
+                keys.append(key)
+            conn.close()
+        if not keys:
+            yield sqlite3.connect(self.db_path)
+        for key in keys:
+            month = datetime.strptime(key, '%Y-%m')
+            yield self.router.connect(start=month, end=month)
+
+    def update(self) -> int:
+        """마지막 내보내기 이후의 스냅샷을 대학교별 파일에 추가하고 추가한 행 수를 반환합니다."""
+        self.write_shell()
+        manifest = self.load_manifest()
+        last_id = manifest['last_snapshot_id']
+
+        lines_by_university = {}
+        names = {}
+        added = 0
+        for conn in self.connections(last_id):
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT
+                    cs.id, u.code, u.name, cs.snapshot_time,
+                    d.name, at.name, cs.recruitment_count, cs.applicant_count
+                FROM competition_snapshots cs
+                JOIN universities u ON cs.university_id = u.id
+                JOIN departments d ON cs.department_id = d.id
+                JOIN admission_types at ON cs.admission_type_id = at.id
+                WHERE cs.id > ?
+                ORDER BY cs.id
+            ''', (last_id,))
+
+            for snapshot_id, code, name, snapshot_time, department, admission_type, recruitment, applicants in cursor:
+                lines_by_university.setdefault(code, []).append(json.dumps(
+                    [snapshot_time, department, admission_type, recruitment, applicants],
+                    ensure_ascii=False, separators=(',', ':')
+                ))
+                names[code] = name
+                last_id = snapshot_id
+                added += 1
+            conn.close()
+
+        # 데이터 파일을 먼저 추가한 뒤 manifest를 갱신해 페이지가 불완전한 상태를 보지 않게 함
+        for code, lines in lines_by_university.items():
+            file_name = f"{code}.ndjson"
+            path = os.path.join(self.data_dir, file_name)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+
+            entry = manifest['universities'].setdefault(code, {'name': names[code], 'file': file_name, 'rows': 0})
+            entry['rows'] += len(lines)
+            entry['bytes'] = os.path.getsize(path)
+
+        manifest['last_snapshot_id'] = last_id
+        manifest['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.save_manifest(manifest)
+
+        print(f"대시보드 데이터 업데이트: {added}개 스냅샷 추가 ({self.output_dir})")
+        return added
+
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='증분 대시보드 데이터 업데이트')
+    parser.add_argument('--db', default='competition_ratio_enhanced.db', help='데이터베이스 파일 경로')
+    parser.add_argument('--output-dir', default='dashboard', help='대시보드 출력 디렉토리')
+    parser.add_argument('--partition-dir', help='월별 스냅샷 파티션 디렉토리 (파티션 DB 사용 시)')
+    args = parser.parse_args()
+
+    IncrementalDashboardWriter(args.db, args.output_dir, args.partition_dir).update()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+from collections import deque
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# 패턴 종류 (0 이상은 정리 규칙 인덱스)
+TARGET = -1
+STRIP = -2
+REMOVE = -3
+
+
+def has_overlap(a: str, b: str) -> bool:
+    """두 토큰이 문자열에서 겹쳐 나타날 수 있는지 확인합니다 (포함 또는 접미사=접두사)."""
+    if a in b or b in a:
+        return True
+    for size in range(1, min(len(a), len(b))):
+        if a[-size:] == b[:size] or b[-size:] == a[:size]:
+            return True
+    return False
+
+
+class DepartmentMatcher:
+    """대상 학과 문자열과 학과명 정리 규칙을 하나의 Aho-Corasick 오토마톤으로 컴파일합니다.
+
+    원본 학과명을 한 번만 스캔해 대상 여부와 표준 학과명을 함께 구합니다.
+    결과는 `any(target in raw)` + 정리 후 규칙 순서대로 포함 여부를 확인하는 기존 방식과 같습니다.
+    제거 토큰이 있는 행이나 안전하지 않은 규칙 구성에서는 기존 정리 함수로 처리합니다.
+    """
+
+    def __init__(self, targets: Sequence[str], rules: Sequence[Tuple[str, str]],
+                 strip_tokens: Sequence[str], remove_tokens: Sequence[str],
+                 clean_name: Callable[[str], str], normalize: Callable[[str], str]):
+        self.rules = tuple(rules)
+        self.clean_name = clean_name
+        self.normalize = normalize
+
+        patterns = [(target, TARGET) for target in targets if target]
+        patterns += [(needle, index) for index, (needle, _) in enumerate(self.rules) if needle]
+        patterns += [(token, STRIP) for token in strip_tokens if token]
+        patterns += [(token, REMOVE) for token in remove_tokens if token]
+
+        self.fast_path = self.is_fast_path_safe(
+            [needle for needle, _ in self.rules],
+            [token for token in strip_tokens if token] + [token for token in remove_tokens if token]
+        )
+        self.build(patterns)
+
+    @staticmethod
+    def is_fast_path_safe(needles: List[str], tokens: List[str]) -> bool:
+        """원본 문자열의 매치 위치만으로 정리 후 규칙 일치를 판정할 수 있는지 확인합니다.
+
+        규칙과 토큰에 공백이 없고, 토큰끼리(자기 자신 포함) 겹칠 수 없어야
+        정규식 치환이 지우는 구간과 오토마톤이 찾은 토큰 구간이 일치합니다.
+        """
+        if any(not needle or any(ch.isspace() for ch in needle) for needle in needles):
+            return False
+        if any(any(ch.isspace() for ch in token) for token in tokens):
+            return False
+        for i, a in enumerate(tokens):
+            if any(a[-size:] == a[:size] for size in range(1, len(a))):
+                return False
+            if any(has_overlap(a, b) for b in tokens[i + 1:]):
+                return False
+        return True
+
+    def build(self, patterns: List[Tuple[str, int]]):
+        """goto/fail 함수를 미리 합성한 희소 DFA 전이표를 만듭니다."""
+        goto = [{}]
+        outputs = [[]]
+
+        for pattern, kind in patterns:
+            state = 0
+            for ch in pattern:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append((kind, len(pattern)))
+
+        fail = [0] * len(goto)
+        delta = [dict(transitions) for transitions in goto]
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            outputs[state].extend(outputs[fail[state]])
+
+            # 실패 상태의 전이를 물려받아 스캔 시 실패 링크를 따라가지 않도록 함
+            for ch, next_state in delta[fail[state]].items():
+                delta[state].setdefault(ch, next_state)
+
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0) if state else 0
+                queue.append(child)
+
+        self.delta = delta
+        self.outputs = [tuple(output) for output in outputs]
+
+    def match_department(self, department_raw: str, need_canonical=False) -> Tuple[bool, Optional[str]]:
+        """(대상 학과 여부, 표준 학과명)을 반환합니다.
+
+        표준 학과명은 대상 학과이거나 need_canonical=True일 때만 계산합니다.
+        """
+        delta = self.delta
+        outputs = self.outputs
+        state = 0
+        target_hit = False
+        removed = False
+        rule_hits = []
+        token_spans = []
+
+        for end, ch in enumerate(department_raw, 1):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                for kind, length in outputs[state]:
+                    if kind >= 0:
+                        rule_hits.append((kind, end - length, end))
+                    elif kind == TARGET:
+                        target_hit = True
+                    elif kind == STRIP:
+                        token_spans.append((end - length, end))
+                    else:
+                        removed = True
+
+        if not (target_hit or need_canonical):
+            return False, None
+
+        if removed or not self.fast_path:
+            return target_hit, self.normalize(department_raw)
+
+        best = None
+        for index, start, end in rule_hits:
+            if best is not None and index >= best:
+                continue
+            # 정리 과정에서 지워지는 토큰과 겹친 매치는 정리 후 문자열에 남지 않음
+            if any(start < token_end and token_start < end for token_start, token_end in token_spans):
+                continue
+            best = index
+
+        if best is not None:
+            return target_hit, self.rules[best][1]
+
+        return target_hit, self.clean_name(department_raw).strip()
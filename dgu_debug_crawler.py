@@ -2,6 +2,8 @@ import requests
 from bs4 import BeautifulSoup
 import re
 
+from competition_record import CompetitionRecord
+
 class DGUDebugCrawler:
     def __init__(self):
         self.session = requests.Session()
@@ -81,14 +83,9 @@ class DGUDebugCrawler:
                                 applicant = self.extract_number(cell_texts[3])
                                 ratio = applicant / recruitment if recruitment > 0 else 0.0
                                 
-                                found_data.append({
-                                    'college': college,
-                                    'department': department,
-                                    'admission_type': admission_type,
-                                    'recruitment_count': recruitment,
-                                    'applicant_count': applicant,
-                                    'competition_ratio': ratio
-                                })
+                                found_data.append(CompetitionRecord(
+                                    'DGU', college, department, admission_type, recruitment, applicant
+                                ))
                                 
                                 print(f"    📊 데이터 수집: {department} | {admission_type}")
                                 print(f"        모집: {recruitment}명, 지원: {applicant}명, 경쟁률: {ratio:.3f}:1")
@@ -109,14 +106,9 @@ class DGUDebugCrawler:
                                     applicant = self.extract_number(cell_texts[3])
                                     ratio = applicant / recruitment if recruitment > 0 else 0.0
                                     
-                                    found_data.append({
-                                        'college': college,
-                                        'department': department,
-                                        'admission_type': admission_type,
-                                        'recruitment_count': recruitment,
-                                        'applicant_count': applicant,
-                                        'competition_ratio': ratio
-                                    })
+                                    found_data.append(CompetitionRecord(
+                                        'DGU', college, department, admission_type, recruitment, applicant
+                                    ))
                                     
                                     print(f"    📊 데이터 수집: {department} | {admission_type}")
                                     print(f"        모집: {recruitment}명, 지원: {applicant}명, 경쟁률: {ratio:.3f}:1")
@@ -0,0 +1,77 @@
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets 알고리즘으로 유지할 점의 인덱스를 선택합니다.
+
+    x는 오름차순 정렬된 수치 배열이어야 합니다. 첫 점과 마지막 점은 항상 유지되며,
+    각 버킷에서 이전 선택점과 다음 버킷 평균점이 이루는 삼각형 넓이가 가장 큰 점을 고릅니다.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    every = (n - 2) / (threshold - 2)
+    a = 0
+
+    for i in range(threshold - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+
+        # 다음 버킷의 평균점 (마지막 버킷은 마지막 점)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) -
+            (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+
+    return indices
+
+
+def minmax_indices(x: np.ndarray, y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """x 범위를 픽셀 폭 버킷으로 나누고 버킷별 최소/최대점의 인덱스를 선택합니다."""
+    n = len(x)
+    if n_buckets * 2 >= n or n_buckets < 1:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    edges = np.linspace(x[0], x[-1], n_buckets + 1)
+    bounds = np.searchsorted(x, edges[1:-1], side='left')
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [n]))
+
+    selected = [0, n - 1]
+    for start, end in zip(starts, ends):
+        if end > start:
+            bucket = y[start:end]
+            selected.append(start + int(bucket.argmin()))
+            selected.append(start + int(bucket.argmax()))
+
+    return np.unique(selected)
+
+
+def downsample(x: np.ndarray, y: np.ndarray, max_points: int, method='lttb'):
+    """점 개수가 max_points를 넘으면 모양을 보존하며 줄인 (x, y)를 반환합니다."""
+    if not max_points or len(x) <= max_points:
+        return x, y
+
+    if method == 'minmax':
+        indices = minmax_indices(x, y, max_points // 2)
+    else:
+        indices = lttb_indices(x, y, max_points)
+
+    return x[indices], y[indices]
@@ -1,11 +1,23 @@
 import sqlite3
 from datetime import datetime
+from pathlib import Path
+
+from site_registry import load_registry
+
+def connect_read_only(db_path: str) -> sqlite3.Connection:
+    """조회 전용 연결을 엽니다. WAL 모드 DB에서는 크롤러가 쓰는 중에도 기다리지 않고 읽습니다."""
+    return sqlite3.connect(f'{Path(db_path).resolve().as_uri()}?mode=ro', uri=True)
 
 def create_enhanced_database():
     """다중 대학교 지원과 시간별 추적이 가능한 향상된 데이터베이스를 생성합니다."""
     conn = sqlite3.connect('competition_ratio_enhanced.db')
     cursor = conn.cursor()
     
+    # 스냅샷 보존 작업이 삭제한 공간을 조금씩 반환할 수 있도록 증분 VACUUM 사용 (테이블 생성 전에만 적용됨)
+    cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+    # 리포트/대시보드의 조회 전용 연결이 크롤러의 쓰기와 서로 막지 않도록 WAL 사용 (기존 DB도 다시 실행하면 전환)
+    cursor.execute('PRAGMA journal_mode = WAL')
+    
     # 대학교 정보 테이블
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS universities (
@@ -53,6 +65,34 @@ def create_enhanced_database():
     ''')
     
     # 경쟁률 데이터 테이블 (시간별 스냅샷)
+    create_snapshot_table(cursor)
+    
+    # 크롤링 세션 로그 테이블
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS crawl_sessions (
+            id TEXT PRIMARY KEY,
+            university_id INTEGER NOT NULL,
+            start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            end_time TIMESTAMP,
+            status TEXT DEFAULT 'RUNNING',
+            records_collected INTEGER DEFAULT 0,
+            error_message TEXT,
+            FOREIGN KEY (university_id) REFERENCES universities (id)
+        )
+    ''')
+    
+    create_alert_table(cursor)
+    create_forecast_tables(cursor)
+    create_quarantine_table(cursor)
+    create_work_queue_table(cursor)
+    create_leader_table(cursor)
+    
+    conn.commit()
+    conn.close()
+    print("향상된 데이터베이스가 성공적으로 생성되었습니다.")
+
+def create_snapshot_table(cursor):
+    """경쟁률 스냅샷 테이블과 인덱스를 생성합니다 (월별 파티션 파일도 같은 스키마 사용)."""
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS competition_snapshots (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -77,41 +117,140 @@ def create_enhanced_database():
         )
     ''')
     
-    # 크롤링 세션 로그 테이블
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS crawl_sessions (
-            id TEXT PRIMARY KEY,
-            university_id INTEGER NOT NULL,
-            start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            end_time TIMESTAMP,
-            status TEXT DEFAULT 'RUNNING',
-            records_collected INTEGER DEFAULT 0,
-            error_message TEXT,
-            FOREIGN KEY (university_id) REFERENCES universities (id)
-        )
-    ''')
-    
-    # 인덱스 생성
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_snapshots_time ON competition_snapshots(snapshot_time)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_snapshots_dept_time ON competition_snapshots(department_id, snapshot_time)')
     cursor.execute('CREATE INDEX IF NOT EXISTS idx_snapshots_session ON competition_snapshots(crawl_session_id)')
+
+def create_alert_table(cursor):
+    """경쟁률 급변/임계값 알림 테이블을 생성합니다."""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS competition_alerts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            university_code TEXT NOT NULL,
+            college TEXT,
+            department TEXT NOT NULL,
+            admission_type TEXT NOT NULL,
+            alert_type TEXT NOT NULL,
+            message TEXT,
+            applicant_count INTEGER,
+            competition_ratio REAL,
+            ewma_rate REAL,
+            z_score REAL,
+            threshold REAL,
+            snapshot_time TIMESTAMP,
+            crawl_session_id TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_alerts_time ON competition_alerts(snapshot_time)')
+
+def create_forecast_tables(cursor):
+    """마감 시점 경쟁률 예측 테이블과 예측 모델 누적 상태 테이블을 생성합니다."""
+    # 프로그램(대학교/학과/전형)당 한 행, 주기마다 갱신되는 최신 예측
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS competition_forecasts (
+            university_code TEXT NOT NULL,
+            department TEXT NOT NULL,
+            admission_type TEXT NOT NULL,
+            deadline TIMESTAMP NOT NULL,
+            forecast_time TIMESTAMP NOT NULL,
+            observations INTEGER NOT NULL,
+            recruitment_count INTEGER,
+            last_applicants INTEGER,
+            forecast_applicants REAL,
+            lower_applicants REAL,
+            upper_applicants REAL,
+            forecast_ratio REAL,
+            lower_ratio REAL,
+            upper_ratio REAL,
+            PRIMARY KEY (university_code, department, admission_type)
+        )
+    ''')
     
-    conn.commit()
-    conn.close()
-    print("향상된 데이터베이스가 성공적으로 생성되었습니다.")
+    # 최소제곱 적합의 누적 모멘트 (다음 주기는 새 스냅샷만 더함)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS forecast_state (
+            university_code TEXT NOT NULL,
+            department TEXT NOT NULL,
+            admission_type TEXT NOT NULL,
+            deadline TIMESTAMP NOT NULL,
+            last_time TIMESTAMP NOT NULL,
+            last_applicants INTEGER,
+            recruitment_count INTEGER,
+            t0 REAL, t1 REAL, t2 REAL, t3 REAL, t4 REAL,
+            y0 REAL, y1 REAL, y2 REAL, yy REAL,
+            PRIMARY KEY (university_code, department, admission_type)
+        )
+    ''')
+
+def create_quarantine_table(cursor):
+    """검증에서 의심스러운 세션의 스냅샷을 보관하는 격리 테이블을 생성합니다."""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS snapshot_quarantine (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            university_id INTEGER NOT NULL,
+            college_id INTEGER NOT NULL,
+            department_id INTEGER NOT NULL,
+            admission_type_id INTEGER NOT NULL,
+            recruitment_count INTEGER NOT NULL DEFAULT 0,
+            applicant_count INTEGER NOT NULL DEFAULT 0,
+            snapshot_time TIMESTAMP,
+            crawl_session_id TEXT,
+            reason TEXT,
+            quarantined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_quarantine_session ON snapshot_quarantine(crawl_session_id)')
+
+def create_work_queue_table(cursor):
+    """분산 크롤링 워커가 리스로 나눠 가지는 작업 테이블을 생성합니다 (대학교 × 주기당 한 행)."""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS crawl_work_items (
+            cycle TEXT NOT NULL,
+            university_code TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'PENDING',
+            worker_id TEXT,
+            lease_expires_at TIMESTAMP,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            session_id TEXT,
+            result_status TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            finished_at TIMESTAMP,
+            PRIMARY KEY (cycle, university_code)
+        )
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_work_items_status ON crawl_work_items(status, cycle)')
+
+def create_leader_table(cursor):
+    """스케줄러 리더 잠금 테이블을 생성합니다 (잠금 이름당 한 행, 시각은 UNIX 초)."""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS leader_locks (
+            name TEXT PRIMARY KEY,
+            holder TEXT,
+            fencing_token INTEGER NOT NULL DEFAULT 0,
+            lease_expires_at REAL NOT NULL DEFAULT 0,
+            acquired_at REAL,
+            last_write_at REAL
+        )
+    ''')
+
+def create_fence_table(cursor, schema='main'):
+    """스냅샷을 쓴 리더의 가장 큰 fencing token을 기록하는 테이블을 생성합니다 (월별 파티션 파일마다 하나)."""
+    cursor.execute(f'''
+        CREATE TABLE IF NOT EXISTS {schema}.leader_fences (
+            name TEXT PRIMARY KEY,
+            fencing_token INTEGER NOT NULL,
+            last_write_at REAL
+        )
+    ''')
 
 def initialize_base_data():
     """기본 대학교 및 전형 데이터를 초기화합니다."""
     conn = sqlite3.connect('competition_ratio_enhanced.db')
     cursor = conn.cursor()
     
-    # 대학교 정보 초기화
-    universities = [
-        ('가톨릭관동대학교', 'CKU', 'https://addon.jinhakapply.com/RatioV1/RatioH/Ratio10460911.html'),
-        ('대구대학교', 'DGU', 'https://addon.jinhakapply.com/RatioV1/RatioH/Ratio10440731.html'),
-        ('영남대학교', 'YNU', 'https://ratio.uwayapply.com/Sl5KOmJKZiUmOiZKLWZUZg=='),
-        ('계명대학교', 'KMU', 'https://ratio.uwayapply.com/Sl5KOk05SmYlJjomSi1mVGY=')
-    ]
+    # 대학교 정보 초기화 (site_adapters.json)
+    universities = [(adapter.name, adapter.code, adapter.url) for adapter in load_registry()]
     
     for name, code, url in universities:
         cursor.execute('''
@@ -151,35 +290,8 @@ def setup_target_departments():
     conn = sqlite3.connect('competition_ratio_enhanced.db')
     cursor = conn.cursor()
     
-    # 대학교별 타겟 학과 정보
-    target_departments = {
-        'CKU': {  # 가톨릭관동대학교
-            '소프트웨어융합대학': [
-                '컴퓨터소프트웨어학부',
-                'AI빅데이터공학과', 
-                '소프트웨어융합학과'
-            ]
-        },
-        'DGU': {  # 대구대학교
-            # 단과대학명은 크롤링 시 확인 필요
-            '공과대학': [
-                '컴퓨터정보공학부'
-            ]
-        },
-        'YNU': {  # 영남대학교
-            '디지털융합대학': [
-                # 크롤링 시 전체 학과 수집
-            ]
-        },
-        'KMU': {  # 계명대학교
-            # 단과대학명은 크롤링 시 확인 필요
-            '공과대학': [
-                '컴퓨터공학과',
-                '게임소프트웨어학과',
-                '모빌리티소프트웨어학과'
-            ]
-        }
-    }
+    # 대학교별 타겟 학과 정보 (site_adapters.json의 seed_colleges)
+    target_departments = {adapter.code: adapter.seed_colleges for adapter in load_registry()}
     
     # 각 대학교별로 단과대학과 학과 정보 설정
     for univ_code, colleges in target_departments.items():
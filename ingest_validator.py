@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+수집 시점 스냅샷 품질 검증
+사용법: python3 ingest_validator.py --list | --release SESSION_ID [--partition-dir partitions]
+
+파서는 읽지 못한 숫자를 0으로 바꾸므로, 사이트 구조가 바뀌면 한 주기 전체가 0이나 엉뚱한 학과로
+저장될 수 있습니다. IngestValidator는 세션의 스냅샷 전체를 직전 COMPLETED 세션과 한 번에 비교해
+  - 지원자 수가 줄어든 행
+  - 직전 세션에 있었지만 사라진 행
+  - 모집인원이 바뀐 행
+  - 지원자가 있다가 0이 된 행
+의 비율이 기준을 넘으면 세션을 의심스러운 것으로 보고, 스냅샷을 커밋 전에 snapshot_quarantine으로 옮깁니다.
+세션은 QUARANTINED로 기록되며, 확인 후 --release로 competition_snapshots에 되돌릴 수 있습니다.
+"""
+
+import sqlite3
+from typing import List, Optional
+
+import numpy as np
+
+from enhanced_database_setup import create_quarantine_table
+
+QUARANTINE_COLUMNS = ('university_id, college_id, department_id, admission_type_id, '
+                      'recruitment_count, applicant_count, snapshot_time, crawl_session_id')
+
+
+class IngestValidator:
+    """세션의 스냅샷 묶음을 직전 세션과 벡터 연산으로 비교하는 검증 단계입니다.
+
+    각 기준은 비교한 행 중 해당 행의 비율 상한이며, 직전 세션 행이 min_rows개보다 적으면 비교하지 않습니다.
+    """
+
+    def __init__(self, max_decreased=0.1, max_missing=0.1, max_recruitment_changed=0.1, max_zero_spike=0.05,
+                 min_rows=5):
+        self.max_decreased = max_decreased
+        self.max_missing = max_missing
+        self.max_recruitment_changed = max_recruitment_changed
+        self.max_zero_spike = max_zero_spike
+        self.min_rows = min_rows
+
+    def previous_session(self, conn: sqlite3.Connection, university_id: int, session_id: str) -> Optional[str]:
+        row = conn.execute('''
+            SELECT id FROM crawl_sessions
+            WHERE university_id = ? AND status = 'COMPLETED' AND records_collected > 0 AND id != ?
+            ORDER BY start_time DESC
+            LIMIT 1
+        ''', (university_id, session_id)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def load_batch(conn: sqlite3.Connection, table: str, session_id: str):
+        """세션의 (프로그램 키, 모집인원, 지원자 수) 배열을 반환합니다. 같은 프로그램이 여러 번 나오면 첫 행만 씁니다."""
+        rows = conn.execute(f'''
+            SELECT department_id, admission_type_id, recruitment_count, applicant_count
+            FROM {table}
+            WHERE crawl_session_id = ?
+        ''', (session_id,)).fetchall()
+        values = np.array(rows, dtype=np.int64).reshape(-1, 4)
+        # 학과 ID는 단과대학마다 따로 생기므로 (학과, 전형)이면 프로그램을 구분할 수 있음
+        keys = (values[:, 0] << 32) | values[:, 1]
+        keys, first = np.unique(keys, return_index=True)
+        return keys, values[first, 2], values[first, 3]
+
+    def check(self, previous, current) -> List[str]:
+        """두 묶음을 비교해 기준을 넘은 항목의 설명을 반환합니다 (문제가 없으면 빈 목록)."""
+        prev_keys, prev_recruitment, prev_applicants = previous
+        cur_keys, cur_recruitment, cur_applicants = current
+        if len(prev_keys) < self.min_rows:
+            return []
+
+        _, prev_index, cur_index = np.intersect1d(prev_keys, cur_keys, assume_unique=True, return_indices=True)
+        matched = len(prev_index)
+        before = prev_applicants[prev_index]
+        after = cur_applicants[cur_index]
+
+        counts = [
+            ('사라진 행', len(prev_keys) - matched, len(prev_keys), self.max_missing),
+            ('지원자 감소', np.count_nonzero(after < before), matched, self.max_decreased),
+            ('모집인원 변경', np.count_nonzero(cur_recruitment[cur_index] != prev_recruitment[prev_index]),
+             matched, self.max_recruitment_changed),
+            ('지원자 0으로 급변', np.count_nonzero((after == 0) & (before > 0)), matched, self.max_zero_spike),
+        ]
+        reasons = []
+        for label, count, total, limit in counts:
+            if total and count / total > limit:
+                reasons.append(f"{label} {count}/{total}개 ({count / total:.0%})")
+        return reasons
+
+    def validate(self, conn: sqlite3.Connection, table: str, session_id: str, university_id: int) -> List[str]:
+        """현재 트랜잭션에 기록된 세션의 스냅샷을 직전 COMPLETED 세션과 비교합니다."""
+        previous_id = self.previous_session(conn, university_id, session_id)
+        if previous_id is None:
+            return []
+        previous = self.load_batch(conn, table, previous_id)
+        if not len(previous[0]):
+            return []  # 직전 세션이 다른 파티션에 있거나 보존 작업으로 정리됨
+        return self.check(previous, self.load_batch(conn, table, session_id))
+
+    def quarantine(self, conn: sqlite3.Connection, table: str, session_id: str, reason: str) -> int:
+        """세션의 스냅샷을 격리 테이블로 옮깁니다 (커밋하지 않음). 옮긴 행 수를 반환합니다."""
+        create_quarantine_table(conn.cursor())
+        cursor = conn.execute(f'''
+            INSERT INTO snapshot_quarantine ({QUARANTINE_COLUMNS}, reason)
+            SELECT {QUARANTINE_COLUMNS}, ? FROM {table}
+            WHERE crawl_session_id = ?
+        ''', (reason, session_id))
+        conn.execute(f'DELETE FROM {table} WHERE crawl_session_id = ?', (session_id,))
+        return cursor.rowcount
+
+    def release(self, store, session_id: str) -> int:
+        """확인이 끝난 격리 세션의 스냅샷을 스냅샷 테이블로 옮기고 세션을 COMPLETED로 바꿉니다."""
+        conn = store.connection()
+        row = conn.execute('SELECT MIN(snapshot_time) FROM snapshot_quarantine WHERE crawl_session_id = ?',
+                           (session_id,)).fetchone()
+        if not row[0]:
+            print(f"격리된 세션 '{session_id}'를 찾을 수 없습니다.")
+            return 0
+
+        table = store.snapshot_table(conn, row[0])
+        try:
+            cursor = conn.execute(f'''
+                INSERT INTO {table} ({QUARANTINE_COLUMNS})
+                SELECT {QUARANTINE_COLUMNS} FROM snapshot_quarantine
+                WHERE crawl_session_id = ?
+                ORDER BY id
+            ''', (session_id,))
+            released = cursor.rowcount
+            conn.execute('DELETE FROM snapshot_quarantine WHERE crawl_session_id = ?', (session_id,))
+            conn.execute('''
+                UPDATE crawl_sessions
+                SET status = 'COMPLETED', records_collected = ?,
+                    error_message = '격리 해제: ' || COALESCE(error_message, '')
+                WHERE id = ?
+            ''', (released, session_id))
+            conn.commit()
+        except Exception:
+            store.rollback(conn)
+            raise
+        print(f"격리 해제: 세션 {session_id}의 {released}개 레코드를 스냅샷으로 옮겼습니다.")
+        return released
+
+
+def list_quarantined(db_path='competition_ratio_enhanced.db'):
+    """격리된 세션 목록을 출력합니다."""
+    conn = sqlite3.connect(db_path)
+    try:
+        create_quarantine_table(conn.cursor())
+        rows = conn.execute('''
+            SELECT q.crawl_session_id, u.code, MIN(q.snapshot_time), COUNT(*), q.reason
+            FROM snapshot_quarantine q
+            JOIN universities u ON q.university_id = u.id
+            GROUP BY q.crawl_session_id
+            ORDER BY MIN(q.snapshot_time) DESC
+        ''').fetchall()
+    finally:
+        conn.close()
+
+    if not rows:
+        print("격리된 세션이 없습니다.")
+        return
+    print("=== 격리된 크롤링 세션 ===")
+    for session_id, code, snapshot_time, count, reason in rows:
+        print(f"{snapshot_time} {code} {session_id}: {count}개 레코드 - {reason}")
+
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='격리된 스냅샷 세션 조회/해제')
+    parser.add_argument('--db', default='competition_ratio_enhanced.db', help='데이터베이스 파일 경로')
+    parser.add_argument('--list', action='store_true', help='격리된 세션 목록 출력')
+    parser.add_argument('--release', metavar='SESSION_ID', help='격리된 세션의 스냅샷을 스냅샷 테이블로 되돌림')
+    parser.add_argument('--partition-dir', help='월별 파티션 DB 디렉토리')
+    args = parser.parse_args()
+
+    if args.release:
+        if args.partition_dir:
+            from partitioned_store import PartitionedSnapshotStore
+            store = PartitionedSnapshotStore(args.db, partition_dir=args.partition_dir)
+        else:
+            from crawler_core import SnapshotStore
+            store = SnapshotStore(args.db)
+        IngestValidator().release(store, args.release)
+    else:
+        list_quarantined(args.db)
+
+
+if __name__ == "__main__":
+    main()
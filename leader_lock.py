@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+스케줄러 단일 리더 잠금
+사용법: python3 leader_lock.py [--db competition_ratio_enhanced.db]   # 현재 리더 조회
+
+배포가 겹쳐 scheduler.py --mode schedule이 두 개 뜨면 둘 다 주기마다 크롤링해 대상 사이트 부하와
+스냅샷이 두 배가 됩니다. LeaderLock은 leader_locks 테이블의 한 행으로 리더 하나만 크롤링하게 합니다.
+  - 잠금을 얻을 때마다 fencing_token이 1 늘어나고, 리더는 별도 스레드에서 lease_seconds보다 짧은 간격으로 리스를 연장합니다.
+  - 대기 중인 스케줄러는 1초마다 잠금을 시도하므로, 리더의 연장이 멈추면 리스가 끝나는 즉시 넘겨받습니다.
+  - 스냅샷을 커밋하기 전에 같은 트랜잭션에서 자신의 토큰이 아직 최신인지 확인(check)하므로,
+    멈췄다가 깨어난 이전 리더의 쓰기는 커밋되지 않습니다.
+  - 월별 파티션(--partition-dir)을 쓰면 스냅샷은 다른 파일에 저장되고, WAL 모드에서는 여러 파일에 걸친
+    커밋이 원자적이지 않습니다. 그래서 토큰을 스냅샷과 같은 파티션 파일의 leader_fences 행에도 기록하고,
+    그 파일에 더 큰 토큰이 이미 쓰였으면 거부합니다. 파티션 파일만 커밋되고 공유 DB 커밋이 빠지는 경우에도
+    파티션에는 그때 최신이던 토큰의 쓰기만 남습니다.
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from enhanced_database_setup import create_leader_table
+
+
+class StaleLeaderError(Exception):
+    """다른 프로세스가 리더 잠금을 넘겨받아 이 프로세스의 fencing token이 더 이상 유효하지 않을 때 발생합니다."""
+
+
+class LeaderLock:
+    """SQLite 행 하나로 구현한 리스 기반 리더 잠금입니다 (SnapshotStore.fence로 사용).
+
+    시각은 각 프로세스의 시계를 쓰므로 여러 서버에서 쓸 때는 시계가 동기화되어 있어야 합니다.
+    """
+
+    def __init__(self, db_path='competition_ratio_enhanced.db', name='scheduler', holder: str = None,
+                 lease_seconds=10, heartbeat_seconds: float = None):
+        self.db_path = db_path
+        self.name = name
+        self.holder = holder or f"{socket.gethostname()}:{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.heartbeat_seconds = heartbeat_seconds or max(0.5, lease_seconds / 4)
+        self.token = None  # 리더일 때만 값이 있음
+        self.expires_at = 0.0
+        self.observed_holder = None
+        self.stopped = threading.Event()
+        self.thread = None
+        conn = sqlite3.connect(db_path)
+        try:
+            create_leader_table(conn.cursor())
+            conn.commit()
+        finally:
+            conn.close()
+
+    @property
+    def is_leader(self) -> bool:
+        return self.token is not None
+
+    def connect(self) -> sqlite3.Connection:
+        # 트랜잭션은 직접 시작함 (BEGIN IMMEDIATE)
+        return sqlite3.connect(self.db_path, isolation_level=None)
+
+    def try_acquire(self) -> bool:
+        """잠금이 비었거나 리스가 끝났으면 새 토큰으로 리더가 되고 연장 스레드를 시작합니다."""
+        if self.is_leader:
+            return True
+        conn = self.connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            now = time.time()
+            row = conn.execute('SELECT holder, fencing_token, lease_expires_at FROM leader_locks WHERE name = ?',
+                               (self.name,)).fetchone()
+            if row and row[0] and row[0] != self.holder and row[2] > now:
+                conn.execute('COMMIT')
+                if row[0] != self.observed_holder:
+                    self.observed_holder = row[0]
+                    print(f"리더 대기 중: 현재 리더 {row[0]} (토큰 {row[1]}, 리스 {row[2] - now:.0f}초 남음)")
+                return False
+            token = (row[1] if row else 0) + 1
+            conn.execute('''
+                INSERT INTO leader_locks (name, holder, fencing_token, lease_expires_at, acquired_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    holder = excluded.holder,
+                    fencing_token = excluded.fencing_token,
+                    lease_expires_at = excluded.lease_expires_at,
+                    acquired_at = excluded.acquired_at
+            ''', (self.name, self.holder, token, now + self.lease_seconds, now))
+            conn.execute('COMMIT')
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+
+        self.token, self.expires_at = token, now + self.lease_seconds
+        self.observed_holder = None
+        previous = f" ({row[0]}에게서 넘겨받음)" if row and row[0] and row[0] != self.holder else ''
+        print(f"리더 잠금 획득: {self.holder}, 토큰 {token}{previous}")
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name='leader-heartbeat', daemon=True)
+        self.thread.start()
+        return True
+
+    def renew(self, conn: sqlite3.Connection) -> bool:
+        """리스를 연장합니다. 토큰이 바뀌었으면 False를 반환합니다."""
+        now = time.time()
+        cursor = conn.execute('''
+            UPDATE leader_locks SET lease_expires_at = ?
+            WHERE name = ? AND holder = ? AND fencing_token = ?
+        ''', (now + self.lease_seconds, self.name, self.holder, self.token))
+        if cursor.rowcount != 1:
+            return False
+        self.expires_at = now + self.lease_seconds
+        return True
+
+    def lose(self, reason: str):
+        if self.is_leader:
+            print(f"리더 자격 상실 (토큰 {self.token}): {reason}")
+        self.token = None
+
+    def run(self):
+        conn = self.connect()
+        try:
+            while not self.stopped.wait(self.heartbeat_seconds) and self.is_leader:
+                try:
+                    if not self.renew(conn):
+                        self.lose('다른 스케줄러가 잠금을 넘겨받음')
+                        return
+                except sqlite3.Error as e:
+                    print(f"리더 리스 연장 오류: {e}")
+                # 연장하지 못한 채 리스가 끝났으면 다른 스케줄러가 넘겨받았을 수 있으므로 스스로 물러남
+                if time.time() >= self.expires_at:
+                    self.lose('리스 만료')
+                    return
+        finally:
+            conn.close()
+
+    def check(self, conn: sqlite3.Connection, schema: str = None):
+        """호출자의 트랜잭션 안에서 토큰이 아직 최신인지 확인합니다 (스냅샷 커밋 직전에 호출).
+
+        잠금 행을 갱신하므로 이 트랜잭션이 커밋될 때까지 다른 스케줄러가 잠금을 넘겨받을 수 없습니다.
+        schema(스냅샷을 저장한 파티션)를 주면 그 파일의 펜스 행도 확인합니다.
+        """
+        token = self.token
+        if token is not None:
+            now = time.time()
+            cursor = conn.execute('UPDATE leader_locks SET last_write_at = ? WHERE name = ? AND fencing_token = ?',
+                                  (now, self.name, token))
+            if cursor.rowcount == 1 and (schema is None or self.check_partition(conn, schema, token, now)):
+                return
+        raise StaleLeaderError(f"리더 잠금 토큰 {token}이(가) 유효하지 않아 쓰기를 거부합니다")
+
+    def check_partition(self, conn: sqlite3.Connection, schema: str, token: int, now: float) -> bool:
+        """파티션 파일의 펜스 행을 토큰으로 올립니다. 더 큰 토큰이 이미 쓰였으면 False를 반환합니다."""
+        cursor = conn.execute(f'''
+            INSERT INTO {schema}.leader_fences (name, fencing_token, last_write_at) VALUES (?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                fencing_token = excluded.fencing_token,
+                last_write_at = excluded.last_write_at
+            WHERE excluded.fencing_token >= leader_fences.fencing_token
+        ''', (self.name, token, now))
+        return cursor.rowcount == 1
+
+    def release(self):
+        """연장을 멈추고 잠금을 내려놓아 대기 중인 스케줄러가 바로 넘겨받게 합니다."""
+        self.stopped.set()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join()
+        token, self.token = self.token, None
+        if token is None:
+            return
+        conn = self.connect()
+        try:
+            conn.execute('UPDATE leader_locks SET lease_expires_at = 0 WHERE name = ? AND fencing_token = ?',
+                         (self.name, token))
+        except sqlite3.Error as e:
+            print(f"리더 잠금 해제 오류: {e}")
+        finally:
+            conn.close()
+        print(f"리더 잠금 해제 (토큰 {token})")
+
+
+def current_leader(db_path='competition_ratio_enhanced.db', name='scheduler') -> Optional[tuple]:
+    """(리더, 토큰, 남은 리스 초, 마지막 스냅샷 커밋 시각)을 반환합니다 (잠금 행이 없으면 None)."""
+    conn = sqlite3.connect(db_path)
+    try:
+        create_leader_table(conn.cursor())
+        row = conn.execute('SELECT holder, fencing_token, lease_expires_at, last_write_at FROM leader_locks WHERE name = ?',
+                           (name,)).fetchone()
+    finally:
+        conn.close()
+    if not row:
+        return None
+    return row[0], row[1], row[2] - time.time(), row[3]
+
+
+def main():
+    """메인 함수"""
+    import argparse
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(description='스케줄러 리더 잠금 조회')
+    parser.add_argument('--db', default='competition_ratio_enhanced.db', help='데이터베이스 파일 경로')
+    parser.add_argument('--name', default='scheduler', help='잠금 이름')
+    args = parser.parse_args()
+
+    leader = current_leader(args.db, args.name)
+    if not leader:
+        print("리더 잠금 기록이 없습니다.")
+        return
+    holder, token, remaining, last_write = leader
+    state = f"리스 {remaining:.0f}초 남음" if remaining > 0 else "리스 만료 (리더 없음)"
+    print(f"리더: {holder}, 토큰 {token}, {state}")
+    if last_write:
+        print(f"마지막 스냅샷 커밋: {datetime.fromtimestamp(last_write).strftime('%Y-%m-%d %H:%M:%S')}")
+
+
+if __name__ == "__main__":
+    main()
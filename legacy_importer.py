@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+기존 competition_ratio.db(competition_data 테이블)를 향상된 스키마로 옮기는 도구
+사용법: python3 legacy_importer.py [--legacy competition_ratio.db] [--db competition_ratio_enhanced.db] [--university CKU]
+
+기존 단일 대학교 크롤러(crawler.py, fixed_crawler.py, advanced_crawler.py)가 쌓은 행을
+universities/colleges/departments/admission_types/competition_snapshots로 옮깁니다.
+  - 기존 행은 id 순서로 batch_size개씩 읽어 executemany로 넣고, 단과대학/학과/전형 ID는 메모리에서 찾습니다.
+  - 스냅샷 인덱스는 적재 중에는 지우고 끝난 뒤 한 번에 다시 만듭니다 (--keep-indexes로 유지).
+  - 배치마다 마지막으로 옮긴 id를 legacy_import_progress에 같은 트랜잭션으로 기록하므로,
+    중단된 뒤 다시 실행하면 이어서 옮깁니다.
+월별 파티션을 쓰는 경우 가져온 뒤 `python3 partitioned_store.py --migrate`로 파티션에 옮깁니다.
+"""
+
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Iterator, List, Tuple
+
+from enhanced_database_setup import create_snapshot_table
+
+SNAPSHOT_INDEXES = ('idx_snapshots_time', 'idx_snapshots_dept_time', 'idx_snapshots_session')
+
+
+def snapshot_time(crawl_date: str) -> str:
+    """기존 crawl_date(로컬 시각)를 스냅샷 시각(UTC, 'YYYY-MM-DD HH:MM:SS')으로 바꿉니다."""
+    try:
+        local_time = datetime.fromisoformat(crawl_date)
+    except (TypeError, ValueError):
+        return crawl_date
+    return local_time.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+class LegacyImporter:
+    """competition_data 행을 향상된 스키마의 스냅샷으로 옮깁니다.
+
+    기존 테이블에는 대학교 정보가 없으므로 모든 행을 university_code 대학교의 행으로 기록합니다.
+    """
+
+    def __init__(self, legacy_path='competition_ratio.db', db_path='competition_ratio_enhanced.db',
+                 university_code='CKU', batch_size=5000, defer_indexes=True):
+        self.legacy_path = legacy_path
+        self.db_path = db_path
+        self.university_code = university_code
+        self.batch_size = batch_size
+        self.defer_indexes = defer_indexes
+        self.colleges = {}
+        self.departments = {}
+        self.admission_types = {}
+
+    def create_progress_table(self, conn: sqlite3.Connection):
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS legacy_import_progress (
+                source TEXT PRIMARY KEY,
+                last_id INTEGER NOT NULL DEFAULT 0,
+                rows_imported INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        conn.commit()
+
+    def progress(self, conn: sqlite3.Connection) -> Tuple[int, int]:
+        """(마지막으로 옮긴 기존 id, 옮긴 행 수)를 반환합니다."""
+        row = conn.execute('SELECT last_id, rows_imported FROM legacy_import_progress WHERE source = ?',
+                           (self.legacy_path,)).fetchone()
+        return row if row else (0, 0)
+
+    def load_dimensions(self, conn: sqlite3.Connection, university_id: int):
+        """기존 단과대학/학과/전형 ID를 메모리에 올립니다."""
+        self.colleges = {name: college_id for college_id, name in conn.execute(
+            'SELECT id, name FROM colleges WHERE university_id = ?', (university_id,))}
+        self.departments = {(college_id, name): department_id for department_id, college_id, name in conn.execute('''
+            SELECT d.id, d.college_id, d.name FROM departments d
+            JOIN colleges c ON d.college_id = c.id
+            WHERE c.university_id = ?
+        ''', (university_id,))}
+        self.admission_types = {name: type_id for type_id, name in conn.execute('SELECT id, name FROM admission_types')}
+
+    def college_id(self, conn: sqlite3.Connection, university_id: int, name: str) -> int:
+        college_id = self.colleges.get(name)
+        if college_id is None:
+            college_id = self.colleges[name] = conn.execute(
+                'INSERT INTO colleges (university_id, name) VALUES (?, ?)', (university_id, name)).lastrowid
+        return college_id
+
+    def department_id(self, conn: sqlite3.Connection, college_id: int, name: str) -> int:
+        department_id = self.departments.get((college_id, name))
+        if department_id is None:
+            department_id = self.departments[(college_id, name)] = conn.execute(
+                'INSERT INTO departments (college_id, name, target_department) VALUES (?, ?, TRUE)',
+                (college_id, name)).lastrowid
+        return department_id
+
+    def admission_type_id(self, conn: sqlite3.Connection, name: str) -> int:
+        type_id = self.admission_types.get(name)
+        if type_id is None:
+            type_id = self.admission_types[name] = conn.execute(
+                'INSERT INTO admission_types (name, category) VALUES (?, ?)', (name, '미분류')).lastrowid
+        return type_id
+
+    def legacy_batches(self, last_id: int) -> Iterator[List[Tuple]]:
+        """last_id 이후의 기존 행을 id 순서로 batch_size개씩 반환합니다."""
+        legacy = sqlite3.connect(f'file:{self.legacy_path}?mode=ro', uri=True)
+        try:
+            cursor = legacy.execute('''
+                SELECT id, college, department, admission_type, recruitment_count, applicant_count, crawl_date
+                FROM competition_data
+                WHERE id > ?
+                ORDER BY id
+            ''', (last_id,))
+            while True:
+                rows = cursor.fetchmany(self.batch_size)
+                if not rows:
+                    break
+                yield rows
+        finally:
+            legacy.close()
+
+    def drop_indexes(self, conn: sqlite3.Connection):
+        for name in SNAPSHOT_INDEXES:
+            conn.execute(f'DROP INDEX IF EXISTS {name}')
+        conn.commit()
+
+    def rebuild_indexes(self, conn: sqlite3.Connection):
+        create_snapshot_table(conn.cursor())
+        conn.commit()
+
+    def run(self) -> int:
+        """남은 기존 행을 모두 옮기고 이번에 옮긴 행 수를 반환합니다."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            self.create_progress_table(conn)
+            row = conn.execute('SELECT id FROM universities WHERE code = ?', (self.university_code,)).fetchone()
+            if not row:
+                print(f"대학교 코드 '{self.university_code}'를 찾을 수 없습니다. enhanced_database_setup.py를 먼저 실행하세요.")
+                return 0
+            university_id = row[0]
+
+            last_id, total = self.progress(conn)
+            if last_id:
+                print(f"이전 실행에 이어서 가져옵니다 (기존 id {last_id}까지 {total}개 완료).")
+            self.load_dimensions(conn, university_id)
+
+            session_id = str(uuid.uuid4())
+            conn.execute('''
+                INSERT INTO crawl_sessions (id, university_id, status, error_message)
+                VALUES (?, ?, 'RUNNING', ?)
+            ''', (session_id, university_id, f'기존 DB 가져오기: {self.legacy_path}'))
+            conn.commit()
+
+            if self.defer_indexes:
+                self.drop_indexes(conn)
+
+            imported = 0
+            start = time.perf_counter()
+            try:
+                for rows in self.legacy_batches(last_id):
+                    imported += self.import_batch(conn, rows, university_id, session_id)
+                    elapsed = time.perf_counter() - start
+                    print(f"  기존 id {rows[-1][0]}까지: {imported:,}개 ({imported / elapsed:,.0f}행/초)")
+            except BaseException as e:
+                conn.rollback()
+                conn.execute('''
+                    UPDATE crawl_sessions
+                    SET end_time = CURRENT_TIMESTAMP, status = 'ABORTED', records_collected = ?, error_message = ?
+                    WHERE id = ?
+                ''', (imported, f'기존 DB 가져오기 중단: {str(e) or type(e).__name__}', session_id))
+                conn.commit()
+                print(f"가져오기 중단 ({imported:,}개 완료, 다시 실행하면 이어서 진행): {str(e) or type(e).__name__}")
+                raise
+            finally:
+                if self.defer_indexes:
+                    index_start = time.perf_counter()
+                    self.rebuild_indexes(conn)
+                    print(f"스냅샷 인덱스 재생성: {time.perf_counter() - index_start:.1f}초")
+
+            elapsed = time.perf_counter() - start
+            conn.execute('''
+                UPDATE crawl_sessions
+                SET end_time = CURRENT_TIMESTAMP, status = 'COMPLETED', records_collected = ?
+                WHERE id = ?
+            ''', (imported, session_id))
+            conn.commit()
+            rate = imported / elapsed if elapsed > 0 else 0.0
+            print(f"기존 DB 가져오기 완료: {imported:,}개, {elapsed:.1f}초 ({rate:,.0f}행/초)")
+            return imported
+        finally:
+            conn.close()
+
+    def import_batch(self, conn: sqlite3.Connection, rows: List[Tuple], university_id: int, session_id: str) -> int:
+        """기존 행 한 배치를 스냅샷으로 넣고 진행 상황과 함께 커밋합니다."""
+        snapshots = []
+        for _, college, department, admission_type, recruitment, applicants, crawl_date in rows:
+            college_id = self.college_id(conn, university_id, college)
+            snapshots.append((
+                university_id,
+                college_id,
+                self.department_id(conn, college_id, department),
+                self.admission_type_id(conn, admission_type),
+                recruitment or 0,
+                applicants or 0,
+                snapshot_time(crawl_date),
+                session_id
+            ))
+
+        try:
+            conn.executemany('''
+                INSERT INTO competition_snapshots
+                (university_id, college_id, department_id, admission_type_id,
+                 recruitment_count, applicant_count, snapshot_time, crawl_session_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', snapshots)
+            conn.execute('''
+                INSERT INTO legacy_import_progress (source, last_id, rows_imported)
+                VALUES (?, ?, ?)
+                ON CONFLICT(source) DO UPDATE SET
+                    last_id = excluded.last_id,
+                    rows_imported = rows_imported + excluded.rows_imported,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', (self.legacy_path, rows[-1][0], len(snapshots)))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            # 되돌린 트랜잭션에서 만든 ID가 남지 않도록 다시 읽음
+            self.load_dimensions(conn, university_id)
+            raise
+        return len(snapshots)
+
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='기존 competition_ratio.db를 향상된 스키마로 가져오기')
+    parser.add_argument('--legacy', default='competition_ratio.db', help='기존 데이터베이스 파일 경로')
+    parser.add_argument('--db', default='competition_ratio_enhanced.db', help='향상된 데이터베이스 파일 경로')
+    parser.add_argument('--university', default='CKU', help='기존 행을 기록할 대학교 코드')
+    parser.add_argument('--batch-size', type=int, default=5000, help='한 번에 옮길 행 수')
+    parser.add_argument('--keep-indexes', action='store_true', help='적재 중에도 스냅샷 인덱스 유지 (크롤링과 동시 실행 시)')
+    args = parser.parse_args()
+
+    LegacyImporter(args.legacy, args.db, args.university, args.batch_size,
+                   defer_indexes=not args.keep_indexes).run()
+
+
+if __name__ == "__main__":
+    main()
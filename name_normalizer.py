@@ -0,0 +1,116 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+NUMBER_PATTERN = re.compile(r'\d+')
+
+MISSING = object()
+
+
+def extract_number(text: str) -> int:
+    """텍스트에서 첫 번째 숫자를 추출합니다 (쉼표 무시, 없으면 0)."""
+    match = NUMBER_PATTERN.search(text.replace(',', ''))
+    return int(match.group()) if match else 0
+
+
+class LRUCache:
+    """크기가 제한된 LRU 캐시입니다. 적중/미스 횟수를 기록합니다.
+
+    크롤러 스레드들이 함께 쓰므로 조회/삽입/제거는 lock 안에서 처리합니다.
+    """
+
+    def __init__(self, maxsize=8192):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            value = self.data.get(key, MISSING)
+            if value is MISSING:
+                self.misses += 1
+                return default
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            if len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        with self.lock:
+            hits, misses, size = self.hits, self.misses, len(self.data)
+        lookups = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'size': size,
+            'maxsize': self.maxsize,
+            'hit_rate': hits / lookups if lookups else 0.0
+        }
+
+
+class NameNormalizer:
+    """학과명 정리와 숫자 추출 결과를 기억하는 정규화 계층입니다.
+
+    학과명과 인원 표기는 크롤링 주기 사이에 거의 바뀌지 않으므로
+    (대학교 코드, 원본 문자열) 키로 결과를 재사용해 정규식 작업을 건너뜁니다.
+    키가 같은 공간을 쓰므로 크롤러마다 별도 인스턴스를 두고 department()와
+    classify() 중 한 방식만 사용합니다.
+    """
+
+    def __init__(self, maxsize=8192):
+        self.departments = LRUCache(maxsize)
+        self.numbers = LRUCache(maxsize)
+
+    def department(self, university_code: Optional[str], raw_name: str,
+                   normalize: Callable[[str], str]) -> str:
+        """normalize(raw_name) 결과를 캐시에서 찾거나 계산합니다."""
+        key = (university_code, raw_name)
+        value = self.departments.get(key, MISSING)
+        if value is MISSING:
+            value = normalize(raw_name)
+            self.departments.put(key, value)
+        return value
+
+    def classify(self, adapter, department_raw: str) -> Tuple[bool, str]:
+        """사이트 어댑터의 (대상 학과 여부, 표준 학과명)을 캐시에서 찾거나 계산합니다."""
+        key = (adapter.code, department_raw)
+        cached = self.departments.get(key, MISSING)
+        # 설정 파일이 바뀌어 어댑터가 다시 로드되면 이전 규칙의 결과는 쓰지 않음
+        if cached is MISSING or cached[0] is not adapter:
+            cached = (adapter, adapter.classify_department(department_raw, need_canonical=True))
+            self.departments.put(key, cached)
+        return cached[1]
+
+    def number(self, text: str) -> int:
+        value = self.numbers.get(text, MISSING)
+        if value is MISSING:
+            value = extract_number(text)
+            self.numbers.put(text, value)
+        return value
+
+    def stats(self) -> Dict:
+        return {'departments': self.departments.stats(), 'numbers': self.numbers.stats()}
+
+    def report(self) -> str:
+        """캐시 적중률 요약 문자열을 반환합니다."""
+        parts = []
+        for label, cache in (('학과명', self.departments), ('숫자', self.numbers)):
+            stats = cache.stats()
+            parts.append(f"{label} {stats['hit_rate'] * 100:.1f}% "
+                         f"({stats['hits']}/{stats['hits'] + stats['misses']}, {stats['size']}개 보관)")
+        return "정규화 캐시 적중률: " + ", ".join(parts)
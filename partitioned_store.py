@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+월별 스냅샷 파티션 DB와 ATTACH 기반 조회 라우터
+사용법: python3 partitioned_store.py [--db competition_ratio_enhanced.db] [--partition-dir partitions] [--migrate]
+
+공유 DB에는 대학교/단과대학/학과/전형 테이블과 crawl_sessions를 그대로 두고,
+competition_snapshots는 partition_dir/snapshots-YYYY-MM.db 파일에 월별로 나눠 저장합니다.
+조회 시에는 요청 구간과 겹치는 파티션만 ATTACH하고 임시 뷰 competition_snapshots로 묶으므로
+기존 쿼리를 그대로 쓸 수 있고, 최근 데이터 조회는 오래된 파티션 파일을 열지 않습니다.
+"""
+
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from crawler_core import ConnectionPool, SnapshotStore
+from enhanced_database_setup import connect_read_only, create_fence_table, create_snapshot_table
+
+PARTITION_FILE_PATTERN = re.compile(r'^snapshots-(\d{4}-\d{2})\.db$')
+
+# 생성 컬럼(competition_ratio)을 제외한 스냅샷 컬럼
+SNAPSHOT_COLUMNS = ('id, university_id, college_id, department_id, admission_type_id, '
+                    'recruitment_count, applicant_count, snapshot_time, crawl_session_id')
+
+# SQLite 기본 ATTACH 한도 (SQLITE_MAX_ATTACHED)
+DEFAULT_MAX_ATTACHED = 10
+
+# 프로그램별 최신 값 조회에 연결할 최근 파티션 수 (월 경계 직후에도 직전 달의 최신 값을 포함)
+LATEST_PARTITIONS = 2
+
+
+def partition_key(snapshot_time: str) -> str:
+    """snapshot_time('YYYY-MM-DD HH:MM:SS')이 속한 파티션 키(YYYY-MM)를 반환합니다."""
+    return snapshot_time[:7]
+
+
+def schema_name(key: str) -> str:
+    """파티션을 ATTACH할 스키마 이름을 반환합니다."""
+    return 'p_' + key.replace('-', '_')
+
+
+def sequence_value(conn: sqlite3.Connection, schema='main') -> int:
+    """competition_snapshots의 AUTOINCREMENT 시퀀스 값을 반환합니다."""
+    try:
+        row = conn.execute(f"SELECT seq FROM {schema}.sqlite_sequence WHERE name = 'competition_snapshots'").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+
+class PartitionDirectory:
+    """월별 스냅샷 파티션 파일 모음입니다."""
+
+    def __init__(self, partition_dir='partitions'):
+        self.partition_dir = partition_dir
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.partition_dir, f"snapshots-{key}.db")
+
+    def keys(self) -> List[str]:
+        """존재하는 파티션 키를 오래된 순서로 반환합니다."""
+        if not os.path.isdir(self.partition_dir):
+            return []
+        keys = []
+        for file_name in os.listdir(self.partition_dir):
+            match = PARTITION_FILE_PATTERN.match(file_name)
+            if match:
+                keys.append(match.group(1))
+        return sorted(keys)
+
+    def create(self, key: str, shared_db_path: str) -> str:
+        """파티션 파일이 없으면 만들고 경로를 반환합니다.
+
+        스냅샷 ID가 파티션 사이에서도 계속 증가하도록(증분 내보내기가 ID 순서에 의존),
+        새 파티션의 시퀀스를 공유 DB와 기존 파티션의 시퀀스 중 큰 값에서 시작합니다.
+        """
+        path = self.path(key)
+        if os.path.exists(path):
+            return path
+
+        os.makedirs(self.partition_dir, exist_ok=True)
+        shared = sqlite3.connect(shared_db_path)
+        start_id = sequence_value(shared)
+        shared.close()
+        for existing in self.keys():
+            conn = sqlite3.connect(self.path(existing))
+            start_id = max(start_id, sequence_value(conn))
+            conn.close()
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        conn = sqlite3.connect(tmp_path)
+        cursor = conn.cursor()
+        create_snapshot_table(cursor)
+        create_fence_table(cursor)
+        cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('competition_snapshots', ?)", (start_id,))
+        conn.commit()
+        conn.close()
+
+        # 다른 프로세스가 먼저 만들었으면 그 파일을 사용
+        if os.path.exists(path):
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, path)
+            print(f"스냅샷 파티션 생성: {path} (ID {start_id + 1}부터)")
+        return path
+
+
+class PartitionRouter:
+    """조회 구간과 겹치는 파티션만 ATTACH한 읽기용 연결을 만듭니다.
+
+    연결에는 공유 DB의 competition_snapshots(이전 행)와 선택된 파티션을 UNION ALL로 묶은
+    임시 뷰 competition_snapshots가 있어 기존 조회 쿼리를 수정 없이 실행할 수 있습니다.
+
+    한 연결에 ATTACH할 수 있는 파티션 수에는 한도(기본 10개)가 있으므로 구간 없이 전체를 연결하지 않습니다.
+      - 프로그램별 최신 값: connect_latest()로 최근 파티션만 연결
+      - 전체 이력/긴 구간 집계: connect_each()로 파티션을 하나씩 연결해 결과를 합침
+    """
+
+    def __init__(self, db_path='competition_ratio_enhanced.db', partition_dir='partitions'):
+        self.db_path = db_path
+        self.partitions = PartitionDirectory(partition_dir)
+
+    def keys_for(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[str]:
+        """[start, end] 구간(UTC)과 겹치는 파티션 키를 반환합니다. 구간이 없으면 전체."""
+        keys = self.partitions.keys()
+        if start:
+            keys = [key for key in keys if key >= start.strftime('%Y-%m')]
+        if end:
+            keys = [key for key in keys if key <= end.strftime('%Y-%m')]
+        return keys
+
+    def window_keys(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                    hours_back: Optional[float] = None) -> List[str]:
+        """구간과 겹치는 파티션 키를 반환합니다. hours_back을 주면 start는 현재(UTC)로부터 hours_back시간 전이 됩니다."""
+        if hours_back is not None:
+            start = datetime.utcnow() - timedelta(hours=hours_back)
+        return self.keys_for(start, end)
+
+    def connect(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                hours_back: Optional[float] = None, read_only=False) -> sqlite3.Connection:
+        """구간과 겹치는 파티션을 ATTACH한 연결을 반환합니다.
+
+        hours_back을 주면 start는 현재(UTC)로부터 hours_back시간 전이 됩니다.
+        read_only면 공유 DB와 파티션을 모두 조회 전용으로 엽니다 (임시 뷰는 temp 스키마에 만들어짐).
+        """
+        return self.attach(self.window_keys(start, end, hours_back), read_only=read_only)
+
+    def connect_latest(self, partitions=LATEST_PARTITIONS, read_only=False) -> sqlite3.Connection:
+        """프로그램별 최신 값 조회용으로 가장 최근 partitions개 파티션만 연결합니다.
+
+        크롤링 주기마다 모든 대상 프로그램의 스냅샷이 새로 쌓이므로, 최근 두 달이면 최신 값이 모두 들어 있습니다.
+        """
+        keys = self.partitions.keys()
+        return self.attach(keys[-partitions:] if partitions else [], read_only=read_only)
+
+    def connect_each(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+                     hours_back: Optional[float] = None, read_only=False) -> Iterator[sqlite3.Connection]:
+        """구간의 파티션을 하나씩 연결한 연결을 오래된 순서로 반환합니다 (호출자가 닫음).
+
+        공유 DB의 이전 행은 첫 연결의 뷰에만 들어가므로, 연결별 결과를 합쳐도 같은 행이 두 번 세어지지 않습니다.
+        """
+        keys = self.window_keys(start, end, hours_back)
+        if not keys:
+            yield self.attach([], read_only=read_only)
+            return
+        for index, key in enumerate(keys):
+            yield self.attach([key], include_shared=index == 0, read_only=read_only)
+
+    def attach(self, keys: List[str], include_shared=True, read_only=False) -> sqlite3.Connection:
+        """keys의 파티션을 ATTACH하고 임시 뷰 competition_snapshots를 만든 연결을 반환합니다."""
+        conn = connect_read_only(self.db_path) if read_only else sqlite3.connect(self.db_path)
+        limit = conn.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED) if hasattr(conn, 'getlimit') else DEFAULT_MAX_ATTACHED
+        if len(keys) > limit:
+            conn.close()
+            raise ValueError(f"조회 구간의 파티션 {len(keys)}개가 ATTACH 한도({limit}개)를 넘습니다. 구간을 줄여주세요.")
+
+        # 공유 DB 행을 빼는 경우에도 뷰의 컬럼 구성은 같아야 하므로 빈 SELECT를 둠
+        selects = ['SELECT * FROM main.competition_snapshots' + ('' if include_shared else ' WHERE 0')]
+        for key in keys:
+            schema = schema_name(key)
+            path = self.partitions.path(key)
+            if read_only:
+                path = f'{Path(path).resolve().as_uri()}?mode=ro'
+            conn.execute(f'ATTACH DATABASE ? AS {schema}', (path,))
+            selects.append(f'SELECT * FROM {schema}.competition_snapshots')
+        conn.execute('CREATE TEMP VIEW competition_snapshots AS ' + ' UNION ALL '.join(selects))
+        return conn
+
+
+class PartitionedSnapshotStore(SnapshotStore):
+    """스냅샷을 월별 파티션 파일에 저장하는 영속화 단계입니다.
+
+    풀 연결에는 현재 달의 파티션만 ATTACH해 두며, 세션 기록과 스냅샷은 여전히 한 트랜잭션으로 커밋됩니다.
+    다만 WAL 모드에서는 여러 파일에 걸친 커밋이 원자적이지 않으므로, 리더 잠금의 토큰 확인은
+    스냅샷과 같은 파티션 파일의 leader_fences 행에도 기록합니다 (fence_schema 참고).
+    """
+
+    def __init__(self, db_path='competition_ratio_enhanced.db', listeners=None, pool: ConnectionPool = None,
+                 partition_dir='partitions'):
+        super().__init__(db_path, listeners, pool)
+        self.partitions = PartitionDirectory(partition_dir)
+
+    def snapshot_table(self, conn: sqlite3.Connection, snapshot_time: str) -> str:
+        key = partition_key(snapshot_time)
+        schema = schema_name(key)
+        attached = [row[1] for row in conn.execute('PRAGMA database_list')]
+        if schema not in attached:
+            # ATTACH/DETACH는 트랜잭션 밖에서만 가능 (저장 단계 시작 시점에 호출됨)
+            for name in attached:
+                if name.startswith('p_'):
+                    conn.execute(f'DETACH DATABASE {name}')
+            conn.execute(f'ATTACH DATABASE ? AS {schema}', (self.partitions.create(key, self.db_path),))
+            # 펜스 테이블이 생기기 전에 만든 파티션 파일용
+            create_fence_table(conn.cursor(), schema)
+        return f'{schema}.competition_snapshots'
+
+    def fence_schema(self, snapshot_time: Optional[str]) -> Optional[str]:
+        if not snapshot_time:
+            return None
+        return schema_name(partition_key(snapshot_time))
+
+
+def migrate_to_partitions(db_path='competition_ratio_enhanced.db', partition_dir='partitions') -> int:
+    """공유 DB의 competition_snapshots 행을 월별 파티션으로 옮기고 옮긴 행 수를 반환합니다.
+
+    한 달씩 복사와 삭제를 한 트랜잭션으로 처리하므로 중간에 중단돼도 다시 실행하면 이어집니다.
+    """
+    partitions = PartitionDirectory(partition_dir)
+    conn = sqlite3.connect(db_path)
+    months = [row[0] for row in conn.execute(
+        'SELECT DISTINCT substr(snapshot_time, 1, 7) FROM competition_snapshots ORDER BY 1')]
+
+    moved = 0
+    for key in months:
+        conn.execute('ATTACH DATABASE ? AS part', (partitions.create(key, db_path),))
+        cursor = conn.execute(f'''
+            INSERT INTO part.competition_snapshots ({SNAPSHOT_COLUMNS})
+            SELECT {SNAPSHOT_COLUMNS} FROM main.competition_snapshots
+            WHERE substr(snapshot_time, 1, 7) = ?
+        ''', (key,))
+        count = cursor.rowcount
+        conn.execute('DELETE FROM main.competition_snapshots WHERE substr(snapshot_time, 1, 7) = ?', (key,))
+        conn.commit()
+        conn.execute('DETACH DATABASE part')
+        moved += count
+        print(f"{key}: {count}개 스냅샷 이동")
+
+    conn.close()
+    print(f"총 {moved}개 스냅샷을 {len(months)}개 파티션으로 이동했습니다.")
+    return moved
+
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='월별 스냅샷 파티션 관리')
+    parser.add_argument('--db', default='competition_ratio_enhanced.db', help='공유 데이터베이스 파일 경로')
+    parser.add_argument('--partition-dir', default='partitions', help='파티션 파일 디렉토리')
+    parser.add_argument('--migrate', action='store_true', help='공유 DB의 스냅샷을 월별 파티션으로 이동')
+    args = parser.parse_args()
+
+    if args.migrate:
+        migrate_to_partitions(args.db, args.partition_dir)
+
+    partitions = PartitionDirectory(args.partition_dir)
+    for key in partitions.keys():
+        path = partitions.path(key)
+        conn = sqlite3.connect(path)
+        count = conn.execute('SELECT COUNT(*) FROM competition_snapshots').fetchone()[0]
+        conn.close()
+        print(f"{key}: {count}개 스냅샷, {os.path.getsize(path) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
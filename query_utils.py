@@ -2,64 +2,124 @@ import sqlite3
 import pandas as pd
 
 class CompetitionDataQuery:
+    """competition_data 조회 유틸리티입니다.
+
+    테이블은 한 번만 스캔해 행과 집계(전체 / 학과별 / 학과·전형별)를 함께 만들고 캐시합니다.
+    모든 get_*/print_* 메서드는 이 캐시를 재사용하며, 다른 연결이 데이터를 바꾸면(PRAGMA data_version)
+    다음 조회에서 다시 스캔합니다.
+    """
+
     def __init__(self, db_path='competition_ratio.db'):
         self.db_path = db_path
+        self.conn = None
+        self.cache = None
+        self.cache_version = None
+        self.scan_count = 0
     
-    def get_data_by_department(self, department=None):
-        """학과별로 데이터를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
+    def connection(self) -> sqlite3.Connection:
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.db_path)
+        return self.conn
+    
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        self.cache = None
+    
+    def aggregates(self, refresh=False) -> dict:
+        """한 번의 스캔으로 만든 행과 집계를 반환합니다.
+
+        반환값: {'rows': 전체 행, 'summary': 학과·전형별, 'department': 학과별, 'overall': 전체}
+        가장 세분화된 (학과, 전형) 집계에서 학과별/전체 집계를 말아 올리므로(grouping sets) 스캔은 한 번입니다.
+        """
+        conn = self.connection()
+        version = conn.execute('PRAGMA data_version').fetchone()[0]
+        if self.cache is not None and not refresh and version == self.cache_version:
+            return self.cache
         
-        if department:
-            query = """
-            SELECT * FROM competition_data 
-            WHERE department = ?
-            ORDER BY admission_type, crawl_date DESC
-            """
-            df = pd.read_sql_query(query, conn, params=[department])
-        else:
-            query = """
+        rows = pd.read_sql_query("""
             SELECT * FROM competition_data 
             ORDER BY department, admission_type, crawl_date DESC
-            """
-            df = pd.read_sql_query(query, conn)
+        """, conn)
+        self.scan_count += 1
         
-        conn.close()
-        return df
+        self.cache = {'rows': rows}
+        self.cache.update(self.rollup(rows))
+        self.cache_version = version
+        return self.cache
+    
+    @staticmethod
+    def rollup(rows: pd.DataFrame) -> dict:
+        """(학과, 전형) 부분 집계를 만든 뒤 학과별/전체 집계로 말아 올립니다 (SQL 집계와 같은 NULL 처리)."""
+        grouped = rows.groupby(['department', 'admission_type'], sort=True)
+        partial = pd.DataFrame({
+            'ratio_sum': grouped['competition_ratio'].sum(min_count=1),
+            'ratio_count': grouped['competition_ratio'].count(),
+            'max_ratio': grouped['competition_ratio'].max(),
+            'min_ratio': grouped['competition_ratio'].min(),
+            'total_recruitment': grouped['recruitment_count'].sum(min_count=1),
+            'total_applicants': grouped['applicant_count'].sum(min_count=1),
+            'record_count': grouped.size()
+        }).reset_index()
+        
+        def average(frame):
+            return (frame['ratio_sum'] / frame['ratio_count']).where(frame['ratio_count'] > 0)
+        
+        summary = partial[['department', 'admission_type']].copy()
+        summary['avg_ratio'] = average(partial)
+        for column in ['max_ratio', 'min_ratio', 'total_recruitment', 'total_applicants', 'record_count']:
+            summary[column] = partial[column]
+        
+        by_department = partial.groupby('department', sort=False)
+        department_partial = pd.DataFrame({
+            'ratio_sum': by_department['ratio_sum'].sum(min_count=1),
+            'ratio_count': by_department['ratio_count'].sum(),
+            'dept_total_recruitment': by_department['total_recruitment'].sum(min_count=1),
+            'dept_total_applicants': by_department['total_applicants'].sum(min_count=1),
+            'dept_max_ratio': by_department['max_ratio'].max(),
+            'dept_min_ratio': by_department['min_ratio'].min(),
+            'dept_admission_types': by_department.size(),
+            'dept_records': by_department['record_count'].sum()
+        }).reset_index()
+        department = department_partial[['department', 'dept_total_recruitment', 'dept_total_applicants']].copy()
+        department['dept_avg_ratio'] = average(department_partial)
+        for column in ['dept_max_ratio', 'dept_min_ratio', 'dept_admission_types', 'dept_records']:
+            department[column] = department_partial[column]
+        department = department.sort_values('dept_total_recruitment', ascending=False, kind='stable',
+                                            na_position='last').reset_index(drop=True)
+        
+        ratio_count = partial['ratio_count'].sum()
+        overall = pd.Series({
+            'grand_total_recruitment': partial['total_recruitment'].sum(min_count=1),
+            'grand_total_applicants': partial['total_applicants'].sum(min_count=1),
+            'grand_avg_ratio': partial['ratio_sum'].sum(min_count=1) / ratio_count if ratio_count else None,
+            'grand_max_ratio': partial['max_ratio'].max(),
+            'grand_min_ratio': partial['min_ratio'].min(),
+            'total_departments': partial['department'].nunique(),
+            'total_admission_types': partial['admission_type'].nunique(),
+            'total_records': int(partial['record_count'].sum())
+        })
+        return {'summary': summary, 'department': department, 'overall': overall}
+    
+    def get_data_by_department(self, department=None):
+        """학과별로 데이터를 조회합니다."""
+        df = self.aggregates()['rows']
+        if department:
+            df = df[df['department'] == department]
+            df = df.sort_values(['admission_type', 'crawl_date'], ascending=[True, False], kind='stable')
+        return df.reset_index(drop=True)
     
     def get_data_by_admission_type(self, admission_type):
         """전형별로 데이터를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
-        
-        query = """
-        SELECT * FROM competition_data 
-        WHERE admission_type = ?
-        ORDER BY department, crawl_date DESC
-        """
-        df = pd.read_sql_query(query, conn, params=[admission_type])
-        conn.close()
-        return df
+        df = self.aggregates()['rows']
+        df = df[df['admission_type'] == admission_type]
+        return df.sort_values(['department', 'crawl_date'], ascending=[True, False],
+                              kind='stable').reset_index(drop=True)
     
     def get_summary_stats(self):
         """요약 통계를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
-        
-        query = """
-        SELECT 
-            department,
-            admission_type,
-            AVG(competition_ratio) as avg_ratio,
-            MAX(competition_ratio) as max_ratio,
-            MIN(competition_ratio) as min_ratio,
-            SUM(recruitment_count) as total_recruitment,
-            SUM(applicant_count) as total_applicants,
-            COUNT(*) as record_count
-        FROM competition_data 
-        GROUP BY department, admission_type
-        ORDER BY department, admission_type
-        """
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        return df
+        return self.aggregates()['summary']
     
     def print_department_summary(self, department=None):
         """학과 요약 정보를 출력합니다."""
@@ -84,23 +144,8 @@ class CompetitionDataQuery:
 
     def get_overall_stats(self):
         """전체 통계를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
-        
-        query = """
-        SELECT 
-            SUM(recruitment_count) as grand_total_recruitment,
-            SUM(applicant_count) as grand_total_applicants,
-            AVG(competition_ratio) as grand_avg_ratio,
-            MAX(competition_ratio) as grand_max_ratio,
-            MIN(competition_ratio) as grand_min_ratio,
-            COUNT(DISTINCT department) as total_departments,
-            COUNT(DISTINCT admission_type) as total_admission_types,
-            COUNT(*) as total_records
-        FROM competition_data
-        """
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        return df.iloc[0] if not df.empty else None
+        aggregates = self.aggregates()
+        return aggregates['overall'] if not aggregates['rows'].empty else None
     
     def print_overall_summary(self):
         """전체 요약 정보를 출력합니다."""
@@ -124,25 +169,7 @@ class CompetitionDataQuery:
     
     def get_department_stats(self):
         """학과별 통계를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
-        
-        query = """
-        SELECT 
-            department,
-            SUM(recruitment_count) as dept_total_recruitment,
-            SUM(applicant_count) as dept_total_applicants,
-            AVG(competition_ratio) as dept_avg_ratio,
-            MAX(competition_ratio) as dept_max_ratio,
-            MIN(competition_ratio) as dept_min_ratio,
-            COUNT(DISTINCT admission_type) as dept_admission_types,
-            COUNT(*) as dept_records
-        FROM competition_data 
-        GROUP BY department
-        ORDER BY dept_total_recruitment DESC
-        """
-        df = pd.read_sql_query(query, conn)
-        conn.close()
-        return df
+        return self.aggregates()['department']
     
     def print_department_stats(self):
         """학과별 통계를 출력합니다."""
@@ -166,9 +193,24 @@ class CompetitionDataQuery:
             print(f"   데이터 건수: {int(row['dept_records'])}건")
             print("-" * 70)
         print("=" * 80)
+    
+    def print_summary_stats(self):
+        """학과별 전형별 상세 통계를 출력합니다."""
+        stats_df = self.get_summary_stats()
+        if stats_df.empty:
+            return
+        for _, row in stats_df.iterrows():
+            print(f"📋 {row['department']} | {row['admission_type']}")
+            print(f"   평균 경쟁률: {row['avg_ratio']:.3f}:1")
+            print(f"   최고 경쟁률: {row['max_ratio']:.3f}:1")
+            print(f"   최저 경쟁률: {row['min_ratio']:.3f}:1")
+            print(f"   총 모집인원: {int(row['total_recruitment'])}명")
+            print(f"   총 지원인원: {int(row['total_applicants'])}명")
+            print(f"   데이터 건수: {int(row['record_count'])}건")
+            print("-" * 50)
 
 def main():
-    """메인 함수 - 사용 예시"""
+    """메인 함수 - 사용 예시 (competition_data는 한 번만 스캔)"""
     query = CompetitionDataQuery()
     
     # 전체 통계 먼저 출력
@@ -184,17 +226,9 @@ def main():
     query.print_department_summary('컴퓨터소프트웨어학부')
     
     print("\n3. 학과별 전형별 상세 통계")
-    stats_df = query.get_summary_stats()
-    if not stats_df.empty:
-        for _, row in stats_df.iterrows():
-            print(f"📋 {row['department']} | {row['admission_type']}")
-            print(f"   평균 경쟁률: {row['avg_ratio']:.3f}:1")
-            print(f"   최고 경쟁률: {row['max_ratio']:.3f}:1")
-            print(f"   최저 경쟁률: {row['min_ratio']:.3f}:1")
-            print(f"   총 모집인원: {int(row['total_recruitment'])}명")
-            print(f"   총 지원인원: {int(row['total_applicants'])}명")
-            print(f"   데이터 건수: {int(row['record_count'])}건")
-            print("-" * 50)
+    query.print_summary_stats()
+    
+    query.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+마감 시점 경쟁률 일괄 예측
+사용법: python3 ratio_forecast.py --deadline "2025-09-12 18:00" [--history-hours 168] [--top 20]
+
+프로그램(대학교/학과/전형)별 지원자 수를 마감까지 남은 시간 τ(일, 마감 전은 음수)의 2차식
+    지원자(τ) = a + b·τ + c·τ²
+으로 적합하고, τ = 0에서의 값 a를 마감 시점 지원자 수로 예측합니다.
+  - 모든 프로그램의 정규방정식을 (P, 3, 3) 배열로 만들어 np.linalg.inv 한 번으로 풉니다.
+  - 적합에 필요한 모멘트(Στ^k, Σyτ^k, Σy²)를 forecast_state에 누적하므로, 다음 주기에는
+    이전 적합 상태에 새 스냅샷만 더합니다 (warm start).
+  - 결과와 오차 범위는 competition_forecasts에 프로그램당 한 행으로 저장해 대시보드가 바로 읽을 수 있습니다.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from enhanced_database_setup import create_forecast_tables
+
+KEY_COLUMNS = ['university_code', 'department', 'admission_type']
+MOMENT_COLUMNS = ['t0', 't1', 't2', 't3', 't4', 'y0', 'y1', 'y2', 'yy']
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+SECONDS_PER_DAY = 86400.0
+# 원서 접수 마감은 한국 시간으로 공지되므로 시간대 없는 --deadline은 KST로 해석 (호스트 TZ와 무관)
+KST = timezone(timedelta(hours=9), 'KST')
+
+
+def parse_deadline(text: str) -> datetime:
+    """마감 시각 'YYYY-MM-DD HH:MM'을 스냅샷과 같은 UTC 기준(naive)으로 바꿉니다.
+    
+    시간대가 없으면 KST로 보고, '+09:00'처럼 오프셋이 있으면 그 오프셋을 따릅니다.
+    """
+    deadline = datetime.fromisoformat(text)
+    if deadline.tzinfo is None:
+        deadline = deadline.replace(tzinfo=KST)
+    return deadline.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def solve_quadratic_fits(moments: np.ndarray, ridge: float):
+    """모멘트 배열(P, 9)로 모든 프로그램의 계수와 잔차 정보를 한 번에 계산합니다.
+
+    반환값: (계수 (P, 3), 잔차 제곱합 (P,), (XᵀX + λD)⁻¹ (P, 3, 3))
+    기울기/곡률에만 작은 ridge를 두어 관측이 1~2개인 프로그램은 현재 값 그대로(평탄) 예측됩니다.
+    """
+    t = moments[:, 0:5]
+    xty = moments[:, 5:8]
+    yy = moments[:, 8]
+
+    # XᵀX[i, j] = Σ τ^(i+j)
+    powers = np.add.outer(np.arange(3), np.arange(3))
+    xtx = t[:, powers]
+    system = xtx + np.diag([0.0, ridge, ridge])
+
+    inverse = np.linalg.inv(system)
+    coefficients = np.einsum('pij,pj->pi', inverse, xty)
+    sse = (yy - 2 * np.einsum('pi,pi->p', coefficients, xty)
+           + np.einsum('pi,pij,pj->p', coefficients, xtx, coefficients))
+    return coefficients, np.maximum(sse, 0.0), inverse
+
+
+class RatioForecaster:
+    """TrendAnalyzer 시계열로 모든 프로그램의 마감 시점 지원자/경쟁률을 일괄 예측합니다."""
+
+    def __init__(self, deadline: datetime, db_path='competition_ratio_enhanced.db', history_hours=168,
+                 ridge=1e-3, z=1.96, analyzer=None, partition_dir=None):
+        self.deadline = deadline
+        self.db_path = db_path
+        self.history_hours = history_hours
+        self.ridge = ridge
+        self.z = z
+        if analyzer is None:
+            from trend_analyzer import TrendAnalyzer
+            analyzer = TrendAnalyzer(db_path, partition_dir=partition_dir)
+        self.analyzer = analyzer
+
+    def load_state(self, conn: sqlite3.Connection) -> pd.DataFrame:
+        """현재 마감 시각의 누적 상태를 읽습니다. 마감 시각이 바뀐 상태는 τ 기준이 달라 버립니다."""
+        deadline = self.deadline.strftime(TIME_FORMAT)
+        conn.execute('DELETE FROM forecast_state WHERE deadline != ?', (deadline,))
+        conn.commit()
+        return pd.read_sql_query('SELECT * FROM forecast_state', conn)
+
+    def new_observations(self, state: pd.DataFrame, now: datetime) -> pd.DataFrame:
+        """상태에 아직 반영하지 않은 스냅샷을 조회합니다."""
+        if state.empty:
+            hours_back = self.history_hours
+        else:
+            oldest = pd.to_datetime(state['last_time']).min()
+            hours_back = (now - oldest).total_seconds() / 3600 + 1
+        df = self.analyzer.get_time_series_data(hours_back=hours_back)
+        if df.empty:
+            return df
+
+        df = df.rename(columns={'department_name': 'department'})
+        if not state.empty:
+            last_times = state[KEY_COLUMNS + ['last_time']].copy()
+            last_times['last_time'] = pd.to_datetime(last_times['last_time'])
+            df = df.merge(last_times, on=KEY_COLUMNS, how='left')
+            df = df[df['last_time'].isna() | (df['snapshot_time'] > df['last_time'])].drop(columns='last_time')
+        return df
+
+    def update(self, now: Optional[datetime] = None) -> pd.DataFrame:
+        """새 스냅샷을 반영해 예측을 갱신하고 competition_forecasts에 저장한 뒤 예측 표를 반환합니다."""
+        now = now or datetime.utcnow()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            create_forecast_tables(conn.cursor())
+            state = self.load_state(conn)
+            observations = self.new_observations(state, now)
+
+            if state.empty and observations.empty:
+                print("예측할 스냅샷이 없습니다.")
+                return pd.DataFrame()
+
+            state = self.accumulate(state, observations)
+            forecasts = self.forecast(state, now)
+            self.save(conn, state, forecasts)
+            print(f"경쟁률 예측 갱신: {len(forecasts)}개 프로그램 (새 스냅샷 {len(observations)}개, "
+                  f"마감 {self.deadline.strftime('%Y-%m-%d %H:%M')} UTC)")
+            return forecasts
+        finally:
+            conn.close()
+
+    def accumulate(self, state: pd.DataFrame, observations: pd.DataFrame) -> pd.DataFrame:
+        """새 스냅샷의 모멘트를 프로그램별로 더합니다 (np.bincount, 프로그램별 반복 없음)."""
+        if observations.empty:
+            return state
+
+        observations = observations.sort_values('snapshot_time', kind='stable')
+        keys = pd.MultiIndex.from_frame(observations[KEY_COLUMNS])
+        new_keys = keys.unique()
+        if not state.empty:
+            state_keys = pd.MultiIndex.from_frame(state[KEY_COLUMNS])
+            new_keys = new_keys.difference(state_keys)
+            all_keys = state_keys.append(new_keys)
+        else:
+            all_keys = new_keys
+
+        added = pd.DataFrame(new_keys.to_list(), columns=KEY_COLUMNS)
+        for column in MOMENT_COLUMNS:
+            added[column] = 0.0
+        state = pd.concat([state, added], ignore_index=True) if not state.empty else added
+        codes = all_keys.get_indexer(keys)
+        size = len(all_keys)
+
+        tau = ((observations['snapshot_time'] - pd.Timestamp(self.deadline)).dt.total_seconds()
+               / SECONDS_PER_DAY).to_numpy(dtype=np.float64)
+        y = observations['applicant_count'].to_numpy(dtype=np.float64)
+        for k in range(5):
+            state[f't{k}'] += np.bincount(codes, weights=tau ** k, minlength=size)
+        for k in range(3):
+            state[f'y{k}'] += np.bincount(codes, weights=y * tau ** k, minlength=size)
+        state['yy'] += np.bincount(codes, weights=y * y, minlength=size)
+
+        # 프로그램별 마지막 관측값
+        latest = observations.drop_duplicates(KEY_COLUMNS, keep='last')
+        positions = all_keys.get_indexer(pd.MultiIndex.from_frame(latest[KEY_COLUMNS]))
+        state.loc[positions, 'last_time'] = latest['snapshot_time'].dt.strftime(TIME_FORMAT).to_numpy()
+        state.loc[positions, 'last_applicants'] = latest['applicant_count'].to_numpy()
+        state.loc[positions, 'recruitment_count'] = latest['recruitment_count'].to_numpy()
+        state['deadline'] = self.deadline.strftime(TIME_FORMAT)
+        return state
+
+    def forecast(self, state: pd.DataFrame, now: datetime) -> pd.DataFrame:
+        """누적 모멘트로 마감 시점(τ = 0) 지원자 수와 오차 범위를 계산합니다."""
+        moments = state[MOMENT_COLUMNS].to_numpy(dtype=np.float64)
+        coefficients, sse, inverse = solve_quadratic_fits(moments, self.ridge)
+
+        count = moments[:, 0]
+        dof = count - 3
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sigma = np.sqrt(np.where(dof > 0, sse / dof, np.nan) * (1 + inverse[:, 0, 0]))
+
+        # 지원자 수는 줄지 않으므로 마지막 관측값 아래로는 예측하지 않음, 마감이 지났으면 마지막 값이 최종값
+        last = state['last_applicants'].to_numpy(dtype=np.float64)
+        point = np.maximum(coefficients[:, 0], last)
+        if now >= self.deadline:
+            point = last
+            sigma = np.zeros_like(sigma)
+        lower = np.maximum(point - self.z * sigma, last)
+        upper = np.maximum(point + self.z * sigma, point)
+
+        recruitment = state['recruitment_count'].to_numpy(dtype=np.float64)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scale = np.where(recruitment > 0, 1 / recruitment, 0.0)
+
+        forecasts = state[KEY_COLUMNS].copy()
+        forecasts['deadline'] = self.deadline.strftime(TIME_FORMAT)
+        forecasts['forecast_time'] = now.strftime(TIME_FORMAT)
+        forecasts['observations'] = count.astype(np.int64)
+        forecasts['recruitment_count'] = state['recruitment_count'].astype('Int64')
+        forecasts['last_applicants'] = state['last_applicants'].astype('Int64')
+        forecasts['forecast_applicants'] = point
+        forecasts['lower_applicants'] = lower
+        forecasts['upper_applicants'] = upper
+        forecasts['forecast_ratio'] = point * scale
+        forecasts['lower_ratio'] = lower * scale
+        forecasts['upper_ratio'] = upper * scale
+        return forecasts
+
+    def save(self, conn: sqlite3.Connection, state: pd.DataFrame, forecasts: pd.DataFrame):
+        """누적 상태와 예측을 한 트랜잭션으로 저장합니다 (프로그램당 한 행으로 교체)."""
+        state_columns = KEY_COLUMNS + ['deadline', 'last_time', 'last_applicants', 'recruitment_count'] + MOMENT_COLUMNS
+        conn.executemany(
+            f"INSERT OR REPLACE INTO forecast_state ({', '.join(state_columns)}) "
+            f"VALUES ({', '.join('?' * len(state_columns))})",
+            self.rows(state[state_columns])
+        )
+        conn.executemany(
+            f"INSERT OR REPLACE INTO competition_forecasts ({', '.join(forecasts.columns)}) "
+            f"VALUES ({', '.join('?' * len(forecasts.columns))})",
+            self.rows(forecasts)
+        )
+        conn.commit()
+
+    @staticmethod
+    def rows(df: pd.DataFrame):
+        """DataFrame 행을 sqlite3에 넣을 수 있는 파이썬 값(NaN/NA → None)으로 바꿉니다."""
+        return (tuple(None if pd.isna(value) else value.item() if hasattr(value, 'item') else value
+                      for value in row)
+                for row in df.itertuples(index=False, name=None))
+
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='마감 시점 경쟁률 일괄 예측')
+    parser.add_argument('--deadline', required=True, help='원서 접수 마감 시각 (시간대가 없으면 KST, 예: "2025-09-12 18:00" 또는 "2025-09-12 09:00+00:00")')
+    parser.add_argument('--db', default='competition_ratio_enhanced.db', help='데이터베이스 파일 경로')
+    parser.add_argument('--partition-dir', help='월별 파티션 DB 디렉토리')
+    parser.add_argument('--history-hours', type=int, default=168, help='처음 적합할 때 사용할 기간 (시간)')
+    parser.add_argument('--top', type=int, default=20, help='예측 경쟁률 상위 몇 개를 출력할지')
+    args = parser.parse_args()
+
+    forecaster = RatioForecaster(parse_deadline(args.deadline), args.db, args.history_hours,
+                                 partition_dir=args.partition_dir)
+    forecasts = forecaster.update()
+    if forecasts.empty:
+        return
+
+    print(f"\n=== 마감 시점 예측 경쟁률 상위 {args.top}개 ===")
+    for _, row in forecasts.nlargest(args.top, 'forecast_ratio').iterrows():
+        print(f"{row['university_code']} {row['department']} | {row['admission_type']}: "
+              f"{row['forecast_ratio']:.2f}:1 ({row['lower_ratio']:.2f} ~ {row['upper_ratio']:.2f}), "
+              f"지원자 {row['last_applicants']}명 → {row['forecast_applicants']:.0f}명")
+
+
+if __name__ == "__main__":
+    main()
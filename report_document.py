@@ -0,0 +1,124 @@
+"""
+리포트 문서 모델
+조회 결과를 섹션/표 단위의 메모리 문서로 만든 뒤 텍스트, Markdown, JSON 중 하나로 한 번에 출력합니다.
+출력은 문자열로 만들어 반환하므로 sys.stdout을 바꾸지 않고, 여러 리포트를 동시에 만들어도 섞이지 않습니다.
+"""
+
+import json
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from stream_table import render_table
+
+FORMATS = ('text', 'markdown', 'json')
+FORMAT_EXTENSIONS = {'.md': 'markdown', '.markdown': 'markdown', '.json': 'json'}
+
+
+def format_for_filename(filename: str) -> str:
+    """파일 확장자로 출력 형식을 고릅니다 (.md → markdown, .json → json, 그 외 text)."""
+    for extension, fmt in FORMAT_EXTENSIONS.items():
+        if filename.lower().endswith(extension):
+            return fmt
+    return 'text'
+
+
+class ReportTable:
+    """표 하나입니다. rows는 화면용 문자열, records는 JSON에 넣을 원본 값입니다."""
+
+    def __init__(self, headers: Sequence[str], rows: List[Sequence], style='simple', title: str = None,
+                 records: List[Dict] = None):
+        self.headers = list(headers)
+        self.rows = rows
+        self.style = style
+        self.title = title
+        self.records = records
+
+    def to_text(self) -> str:
+        return render_table(self.headers, self.rows, self.style, sample_size=len(self.rows))
+
+    def to_markdown(self) -> str:
+        # Markdown 표 칸 안에서는 줄바꿈을 쓸 수 없음
+        rows = [[str(cell).replace('\n', ' ') for cell in row] for row in self.rows]
+        return render_table(self.headers, rows, 'markdown', sample_size=len(rows))
+
+    def as_dict(self) -> Dict:
+        return {
+            'title': self.title,
+            'headers': self.headers,
+            'records': self.records if self.records is not None else [dict(zip(self.headers, row)) for row in self.rows]
+        }
+
+
+class ReportSection:
+    """제목, 구분선 너비, 표 목록 또는 데이터가 없을 때의 안내 문구로 이루어진 섹션입니다."""
+
+    def __init__(self, title: str, width=80, tables: List[ReportTable] = None, message: str = None):
+        self.title = title
+        self.width = width
+        self.tables = tables or []
+        self.message = message
+
+    def to_text(self) -> str:
+        lines = [self.title, '=' * self.width]
+        if self.message:
+            lines.append(self.message)
+        for table in self.tables:
+            if table.title:
+                lines += ['', table.title, '-' * 60]
+            lines.append(table.to_text())
+        return '\n'.join(lines) + '\n'
+
+    def to_markdown(self) -> str:
+        lines = [f'## {self.title}', '']
+        if self.message:
+            lines += [self.message, '']
+        for table in self.tables:
+            if table.title:
+                lines += [f'### {table.title}', '']
+            lines += [table.to_markdown(), '']
+        return '\n'.join(lines)
+
+    def as_dict(self) -> Dict:
+        return {
+            'title': self.title,
+            'message': self.message,
+            'tables': [table.as_dict() for table in self.tables]
+        }
+
+
+class ReportDocument:
+    """제목, (항목, 값) 메타 정보, 섹션 목록으로 이루어진 리포트입니다."""
+
+    def __init__(self, title: str, meta: List[Tuple[str, str]] = None, sections: List[ReportSection] = None,
+                 width=100):
+        self.title = title
+        self.meta = meta or []
+        self.sections = sections or []
+        self.width = width
+
+    def to_text(self) -> str:
+        lines = [self.title, '=' * self.width]
+        lines += [f'{label}: {value}' for label, value in self.meta]
+        lines.append('')
+        return '\n'.join(lines) + '\n' + '\n'.join(section.to_text() for section in self.sections)
+
+    def to_markdown(self) -> str:
+        lines = [f'# {self.title}', '']
+        lines += [f'- **{label}**: {value}' for label, value in self.meta]
+        lines.append('')
+        return '\n'.join(lines) + '\n' + '\n'.join(section.to_markdown() for section in self.sections)
+
+    def to_json(self) -> str:
+        document = {
+            'title': self.title,
+            'meta': dict(self.meta),
+            'sections': [section.as_dict() for section in self.sections]
+        }
+        return json.dumps(document, ensure_ascii=False, indent=2, default=str)
+
+    def render(self, fmt: Optional[str] = 'text') -> str:
+        """fmt('text', 'markdown', 'json') 형식의 문자열을 반환합니다."""
+        if fmt == 'markdown':
+            return self.to_markdown()
+        if fmt == 'json':
+            return self.to_json()
+        return self.to_text()
@@ -0,0 +1,128 @@
+import random
+import threading
+import time
+from typing import Callable, Iterator, Optional
+
+CLOSED = 'CLOSED'
+OPEN = 'OPEN'
+HALF_OPEN = 'HALF_OPEN'
+
+
+class CircuitOpenError(Exception):
+    """회로 차단기가 열려 있어 요청을 보내지 않았을 때 발생합니다."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host}: 회로 차단기 열림 ({retry_in:.0f}초 후 재시도)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class RetryPolicy:
+    """재시도 횟수와 decorrelated jitter 백오프 간격을 정합니다.
+
+    다음 대기 시간 = min(max_delay, uniform(base_delay, 이전 대기 시간 * 3))
+    """
+
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=10.0, rng: random.Random = None):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng or random.Random()
+
+    def delays(self) -> Iterator[float]:
+        """시도 사이의 대기 시간을 차례로 반환합니다 (max_attempts - 1개)."""
+        delay = self.base_delay
+        for _ in range(self.max_attempts - 1):
+            delay = min(self.max_delay, self.rng.uniform(self.base_delay, delay * 3))
+            yield delay
+
+
+class CircuitBreaker:
+    """호스트 하나의 회로 차단기입니다.
+
+    연속 실패가 failure_threshold에 이르면 OPEN이 되어 요청을 즉시 거절하고,
+    reset_timeout이 지나면 HALF_OPEN에서 단 하나의 시험 요청만 보냅니다.
+    시험 요청이 성공하면 CLOSED, 실패하면 다시 OPEN이 됩니다.
+    """
+
+    def __init__(self, host: str, failure_threshold=3, reset_timeout=300.0,
+                 on_state_change: Callable[[str, str, str, str], None] = None):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.on_state_change = on_state_change
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.lock = threading.Lock()
+
+    def transition(self, new_state: str, reason: str, on_change=None):
+        old_state = self.state
+        self.state = new_state
+        on_change = on_change or self.on_state_change
+        if on_change and old_state != new_state:
+            on_change(self.host, old_state, new_state, reason)
+
+    def before_request(self, on_change=None) -> bool:
+        """요청을 보내도 되는지 확인합니다. 시험 요청이면 True를 반환합니다.
+
+        보낼 수 없으면 CircuitOpenError를 발생시킵니다.
+        on_change는 이번 호출로 생긴 상태 변화를 받을 콜백입니다 (없으면 on_state_change).
+        """
+        with self.lock:
+            if self.state == CLOSED:
+                return False
+
+            elapsed = time.monotonic() - self.opened_at
+            if self.state == OPEN and elapsed >= self.reset_timeout:
+                self.transition(HALF_OPEN, f"{elapsed:.0f}초 경과, 시험 요청", on_change)
+
+            if self.state == HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return True
+
+            raise CircuitOpenError(self.host, max(0.0, self.reset_timeout - elapsed))
+
+    def record_success(self, on_change=None):
+        with self.lock:
+            self.failures = 0
+            self.probe_in_flight = False
+            if self.state != CLOSED:
+                self.transition(CLOSED, "시험 요청 성공", on_change)
+
+    def release_probe(self):
+        """결과 없이 끝난 시험 요청을 반납합니다 (상태는 그대로, 다음 요청이 다시 시험)."""
+        with self.lock:
+            self.probe_in_flight = False
+
+    def record_failure(self, error: str, on_change=None):
+        with self.lock:
+            self.failures += 1
+            probe = self.probe_in_flight
+            self.probe_in_flight = False
+            if probe or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                reason = "시험 요청 실패" if probe else f"연속 {self.failures}회 실패"
+                self.transition(OPEN, f"{reason}: {error}", on_change)
+
+
+class BreakerRegistry:
+    """호스트별 회로 차단기 모음입니다."""
+
+    def __init__(self, failure_threshold=3, reset_timeout=300.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers = {}
+        self.lock = threading.Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        with self.lock:
+            breaker = self.breakers.get(host)
+            if breaker is None:
+                breaker = self.breakers[host] = CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+            return breaker
+
+    def state(self, host: str) -> Optional[str]:
+        breaker = self.breakers.get(host)
+        return breaker.state if breaker else None
@@ -4,14 +4,82 @@ import threading
 import signal
 import sys
 from datetime import datetime, timedelta
-from multi_university_crawler import MultiUniversityCrawler
+from corrected_multi_crawler import CorrectedMultiUniversityCrawler
 from enhanced_database_setup import create_enhanced_database, initialize_base_data, setup_target_departments
+from ingest_validator import IngestValidator
+from site_registry import load_registry
+
+def make_store(partition_dir=None):
+    """파티션 디렉토리가 있으면 월별 파티션 저장소를, 없으면 기본 저장소(None)를 반환합니다."""
+    if not partition_dir:
+        return None
+    from partitioned_store import PartitionedSnapshotStore
+    return PartitionedSnapshotStore(partition_dir=partition_dir)
 
 class CrawlingScheduler:
-    def __init__(self, interval_minutes=10):
+    def __init__(self, interval_minutes=10, sse_port=None, alerts=False, alert_webhook=None,
+                 dashboard_dir=None, cycle_budget=0.8, retention_hours=None, partition_dir=None,
+                 forecast_deadline=None, validate=True, leader_lock=True, leader_lease_seconds=10):
         self.interval_minutes = interval_minutes
-        self.crawler = MultiUniversityCrawler()
+        # 한 주기가 쓸 수 있는 시간 (간격 대비 비율), 다음 주기와 겹치지 않도록 함
+        self.cycle_budget = cycle_budget
+        self.crawler = CorrectedMultiUniversityCrawler(store=make_store(partition_dir))
+        if validate:
+            # 직전 세션과 크게 어긋나는 묶음은 스냅샷 대신 격리 테이블에 저장
+            self.crawler.store.validator = IngestValidator()
+        self.crawler.reap_stale_sessions()
         self.running = True
+        self.scheduled = False
+        self.stream_server = None
+        
+        # 스케줄러가 여러 개 떠도 리더 하나만 크롤링 (스냅샷 커밋 시 fencing token 확인)
+        self.leader = None
+        if leader_lock:
+            from leader_lock import LeaderLock
+            self.leader = LeaderLock(self.crawler.db_path, lease_seconds=leader_lease_seconds)
+            self.crawler.store.fence = self.leader
+        
+        # 경쟁률 변경 이벤트 SSE 스트림 (선택)
+        if sse_port:
+            from change_events import ChangeEventBus
+            from change_stream_server import ChangeStreamServer
+            
+            event_bus = ChangeEventBus()
+            event_bus.seed_from_db(self.crawler.db_path, partition_dir)
+            self.crawler.listeners.append(event_bus)
+            self.stream_server = ChangeStreamServer(event_bus, port=sse_port)
+        
+        # 경쟁률 급변/임계값 알림 (선택)
+        if alerts or alert_webhook:
+            from alert_detector import StreamingChangeDetector, FileAlertSink, WebhookAlertSink
+            
+            sinks = [FileAlertSink()]
+            if alert_webhook:
+                sinks.append(WebhookAlertSink(alert_webhook))
+            detector = StreamingChangeDetector(self.crawler.db_path, sinks=sinks)
+            # 재시작 직후에도 알림이 바로 동작하도록 최근 스냅샷으로 EWMA 상태를 채움
+            detector.seed_from_db(partition_dir)
+            self.crawler.listeners.append(detector)
+        
+        # 크롤링 후 증분 대시보드 데이터 업데이트 (선택)
+        self.dashboard_writer = None
+        if dashboard_dir:
+            from dashboard_writer import IncrementalDashboardWriter
+            self.dashboard_writer = IncrementalDashboardWriter(self.crawler.db_path, dashboard_dir, partition_dir)
+        
+        # 스냅샷 보존/압축 (선택, 크롤링과 별도 스레드에서 배치 단위로 실행)
+        self.retention_hours = retention_hours
+        self.retention = None
+        if retention_hours:
+            from snapshot_retention import SnapshotRetention
+            self.retention = SnapshotRetention(self.crawler.db_path, partition_dir=partition_dir)
+        
+        # 크롤링 후 마감 시점 경쟁률 예측 갱신 (선택)
+        self.forecaster = None
+        if forecast_deadline:
+            from ratio_forecast import RatioForecaster, parse_deadline
+            self.forecaster = RatioForecaster(parse_deadline(forecast_deadline), self.crawler.db_path,
+                                              partition_dir=partition_dir)
         
         # 시그널 핸들러 설정 (Ctrl+C로 종료)
         signal.signal(signal.SIGINT, self.signal_handler)
@@ -27,49 +95,113 @@ class CrawlingScheduler:
         """크롤링 작업 실행"""
         if not self.running:
             return
+        if self.leader and not self.leader.is_leader:
+            return
         
         print(f"\\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 정기 크롤링 시작")
         
+        deadline = time.monotonic() + self.interval_minutes * 60 * self.cycle_budget
         try:
-            self.crawler.crawl_all_universities()
+            self.crawler.crawl_all_universities(deadline=deadline)
+            if self.dashboard_writer:
+                self.dashboard_writer.update()
+            if self.forecaster:
+                self.forecaster.update()
             print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 정기 크롤링 완료\\n")
         except Exception as e:
             print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 크롤링 중 오류 발생: {e}\\n")
     
+    def retention_job(self):
+        """스냅샷 보존 작업 실행 (백그라운드)"""
+        if self.running:
+            self.retention.run_in_background()
+    
     def setup_schedule(self):
         """스케줄 설정"""
         # 매 interval_minutes분마다 크롤링 실행
         schedule.every(self.interval_minutes).minutes.do(self.crawl_job)
         
+        # 매 retention_hours시간마다 스냅샷 보존 작업 실행
+        if self.retention:
+            schedule.every(self.retention_hours).hours.do(self.retention_job)
+        
         # 시작 시 즉시 한 번 실행
         print(f"초기 크롤링 실행...")
         self.crawl_job()
         
         next_run = datetime.now() + timedelta(minutes=self.interval_minutes)
         print(f"다음 크롤링 예정 시간: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"크롤링 간격: {self.interval_minutes}분")
+        print(f"크롤링 간격: {self.interval_minutes}분 (주기당 시간 예산 {self.interval_minutes * self.cycle_budget:.1f}분)")
         print("종료하려면 Ctrl+C를 누르세요.\\n")
     
+    def ensure_leadership(self):
+        """리더이면 True를 반환합니다. 리더 자격을 잃었으면 스케줄을 비우고 다시 잠금을 시도합니다."""
+        if not self.leader or self.leader.is_leader:
+            return True
+        if self.scheduled:
+            schedule.clear()
+            self.scheduled = False
+            print("리더가 아니므로 크롤링 스케줄을 멈추고 대기합니다.")
+        return self.leader.try_acquire()
+    
     def run(self):
-        """스케줄러 실행"""
+        """스케줄러 실행 (리더 잠금을 쓰면 리더가 될 때까지 대기)"""
         print("=== 대학교 경쟁률 자동 크롤링 스케줄러 시작 ===")
         
-        self.setup_schedule()
+        if self.stream_server:
+            self.stream_server.start()
         
         while self.running:
-            schedule.run_pending()
+            if self.ensure_leadership():
+                if not self.scheduled:
+                    self.setup_schedule()
+                    self.scheduled = True
+                schedule.run_pending()
             time.sleep(1)
     
     def stop(self):
         """스케줄러 중지"""
         self.running = False
+        if self.leader:
+            self.leader.release()
+        if self.stream_server:
+            self.stream_server.stop()
         print("스케줄러 중지됨")
 
+class WorkerCrawler:
+    """공유 작업 큐에서 리스를 잡아 크롤링하는 분산 워커 모드 (crawl_leases.CrawlWorker 사용)"""
+    
+    def __init__(self, interval_minutes=10, cycle_budget=0.8, partition_dir=None, validate=True,
+                 worker_id=None, lease_seconds=120):
+        from crawl_leases import CrawlWorker, LeaseQueue
+        
+        self.crawler = CorrectedMultiUniversityCrawler(store=make_store(partition_dir))
+        if validate:
+            self.crawler.store.validator = IngestValidator()
+        self.crawler.reap_stale_sessions()
+        queue = LeaseQueue(self.crawler.db_path, lease_seconds=lease_seconds)
+        self.worker = CrawlWorker(self.crawler, queue, worker_id, interval_minutes, cycle_budget)
+        
+        signal.signal(signal.SIGINT, self.signal_handler)
+        signal.signal(signal.SIGTERM, self.signal_handler)
+    
+    def signal_handler(self, signum, frame):
+        """시그널 처리 (진행 중인 작업의 리스는 내려놓고 종료)"""
+        print(f"\\n종료 신호 수신 (신호: {signum})")
+        self.worker.stop()
+        sys.exit(0)
+    
+    def run(self):
+        self.worker.run()
+
 class ManualCrawler:
     """수동 크롤링을 위한 클래스"""
     
-    def __init__(self):
-        self.crawler = MultiUniversityCrawler()
+    def __init__(self, partition_dir=None, validate=True):
+        self.crawler = CorrectedMultiUniversityCrawler(store=make_store(partition_dir))
+        if validate:
+            self.crawler.store.validator = IngestValidator()
+        self.crawler.reap_stale_sessions()
     
     def run_once(self):
         """단일 크롤링 실행"""
@@ -90,14 +222,40 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='대학교 경쟁률 크롤링 도구')
-    parser.add_argument('--mode', choices=['schedule', 'once', 'university'], 
+    parser.add_argument('--mode', choices=['schedule', 'once', 'university', 'worker'], 
                        default='schedule', help='실행 모드')
     parser.add_argument('--interval', type=int, default=10, 
                        help='스케줄링 간격 (분, 기본값: 10)')
-    parser.add_argument('--university', choices=['CKU', 'DGU', 'YNU', 'KMU'], 
+    parser.add_argument('--university', choices=load_registry().codes(), 
                        help='특정 대학교 코드 (university 모드에서 사용)')
     parser.add_argument('--init-db', action='store_true', 
                        help='데이터베이스 초기화')
+    parser.add_argument('--sse-port', type=int, 
+                       help='경쟁률 변경 이벤트 SSE 서버 포트 (schedule 모드에서 사용)')
+    parser.add_argument('--alerts', action='store_true', 
+                       help='경쟁률 급변/임계값 알림 활성화 (competition_alerts.jsonl)')
+    parser.add_argument('--alert-webhook', 
+                       help='알림을 POST할 웹훅 URL')
+    parser.add_argument('--dashboard-dir', 
+                       help='크롤링마다 증분 업데이트할 대시보드 디렉토리')
+    parser.add_argument('--cycle-budget', type=float, default=0.8, 
+                       help='주기당 시간 예산 (간격 대비 비율, 기본값: 0.8)')
+    parser.add_argument('--retention-hours', type=int, 
+                       help='스냅샷 보존/압축 작업 간격 (시간, schedule 모드에서 사용)')
+    parser.add_argument('--partition-dir', 
+                       help='스냅샷을 월별 파티션 DB로 저장할 디렉토리')
+    parser.add_argument('--forecast-deadline', 
+                       help='크롤링마다 마감 시점 경쟁률을 예측할 원서 접수 마감 시각 (시간대가 없으면 KST, 예: "2025-09-12 18:00")')
+    parser.add_argument('--no-validation', action='store_true', 
+                       help='직전 세션과 비교하는 수집 데이터 검증(격리) 끄기')
+    parser.add_argument('--no-leader-lock', action='store_true', 
+                       help='리더 잠금 없이 실행 (schedule 모드, 여러 스케줄러가 모두 크롤링함)')
+    parser.add_argument('--leader-lease', type=int, default=10, 
+                       help='리더 잠금 리스 시간 (초, 리더가 멈춘 뒤 대기 스케줄러가 넘겨받는 시간, 기본값: 10)')
+    parser.add_argument('--worker-id', 
+                       help='분산 워커 이름 (worker 모드, 기본값: 호스트명:PID)')
+    parser.add_argument('--lease-seconds', type=int, default=120, 
+                       help='작업 리스 유지 시간 (초, worker 모드, 기본값: 120)')
     
     args = parser.parse_args()
     
@@ -112,22 +270,36 @@ def main():
     
     if args.mode == 'schedule':
         # 스케줄 모드
-        scheduler = CrawlingScheduler(interval_minutes=args.interval)
+        scheduler = CrawlingScheduler(interval_minutes=args.interval, sse_port=args.sse_port,
+                                      alerts=args.alerts, alert_webhook=args.alert_webhook,
+                                      dashboard_dir=args.dashboard_dir, cycle_budget=args.cycle_budget,
+                                      retention_hours=args.retention_hours, partition_dir=args.partition_dir,
+                                      forecast_deadline=args.forecast_deadline,
+                                      validate=not args.no_validation,
+                                      leader_lock=not args.no_leader_lock,
+                                      leader_lease_seconds=args.leader_lease)
         scheduler.run()
         
     elif args.mode == 'once':
         # 단일 실행 모드
-        manual_crawler = ManualCrawler()
+        manual_crawler = ManualCrawler(args.partition_dir, validate=not args.no_validation)
         manual_crawler.run_once()
         
     elif args.mode == 'university':
         # 특정 대학교 모드
         if not args.university:
-            print("--university 옵션을 지정해주세요. (CKU, DGU, YNU, KMU 중 하나)")
+            print(f"--university 옵션을 지정해주세요. ({', '.join(load_registry().codes())} 중 하나)")
             return
         
-        manual_crawler = ManualCrawler()
+        manual_crawler = ManualCrawler(args.partition_dir, validate=not args.no_validation)
         manual_crawler.run_specific_university(args.university)
+        
+    elif args.mode == 'worker':
+        # 분산 워커 모드 (여러 프로세스/서버에서 같은 DB를 보고 실행)
+        worker = WorkerCrawler(interval_minutes=args.interval, cycle_budget=args.cycle_budget,
+                               partition_dir=args.partition_dir, validate=not args.no_validation,
+                               worker_id=args.worker_id, lease_seconds=args.lease_seconds)
+        worker.run()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -10,8 +10,26 @@ from datetime import datetime
 import argparse
 
 class SimpleViewer:
-    def __init__(self, db_path='competition_ratio_enhanced.db'):
+    def __init__(self, db_path='competition_ratio_enhanced.db', partition_dir=None):
         self.db_path = db_path
+        # 월별 파티션 DB를 쓰는 경우 조회에 필요한 파티션만 연결
+        self.router = None
+        if partition_dir:
+            from partitioned_store import PartitionRouter
+            self.router = PartitionRouter(db_path, partition_dir)
+    
+    def connect_latest(self):
+        """프로그램별 최신 값 조회용 연결을 엽니다. 파티션 DB면 최근 파티션만 연결합니다."""
+        if self.router:
+            return self.router.connect_latest(read_only=True)
+        return sqlite3.connect(self.db_path)
+    
+    def connect_each(self):
+        """전체 이력 조회용 연결을 차례로 엽니다. 파티션 DB면 파티션마다 하나씩 엽니다."""
+        if self.router:
+            yield from self.router.connect_each(read_only=True)
+        else:
+            yield sqlite3.connect(self.db_path)
     
     def check_database(self):
         """데이터베이스 연결 상태를 확인합니다."""
@@ -21,11 +39,15 @@ class SimpleViewer:
             cursor.execute("SELECT COUNT(*) FROM universities")
             university_count = cursor.fetchone()[0]
             
-            cursor.execute("SELECT COUNT(*) FROM competition_snapshots")
-            snapshot_count = cursor.fetchone()[0]
-            
             conn.close()
             
+            snapshot_count = 0
+            for conn in self.connect_each():
+                try:
+                    snapshot_count += conn.execute("SELECT COUNT(*) FROM competition_snapshots").fetchone()[0]
+                finally:
+                    conn.close()
+            
             print(f"📊 데이터베이스 상태: {university_count}개 대학교, {snapshot_count}개 스냅샷")
             return True
             
@@ -35,7 +57,7 @@ class SimpleViewer:
     
     def show_current_competition(self):
         """현재 경쟁률을 간단히 보여줍니다."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect_latest()
         
         query = """
         WITH latest_data AS (
@@ -104,9 +126,10 @@ class SimpleViewer:
                   f"경쟁률:{row['competition_ratio']:>6.2f}:1")
     
     def show_university_list(self):
-        """등록된 대학교 목록을 보여줍니다."""
-        conn = sqlite3.connect(self.db_path)
+        """등록된 대학교 목록을 보여줍니다.
         
+        파티션 DB면 파티션을 하나씩 조회한 뒤 대학교별로 합칩니다.
+        """
         query = """
         SELECT 
             u.name as university_name,
@@ -122,8 +145,20 @@ class SimpleViewer:
         ORDER BY u.name
         """
         
-        df = pd.read_sql_query(query, conn)
-        conn.close()
+        frames = []
+        for conn in self.connect_each():
+            try:
+                frames.append(pd.read_sql_query(query, conn))
+            finally:
+                conn.close()
+        df = frames[0]
+        if len(frames) > 1:
+            df = (pd.concat(frames, ignore_index=True)
+                  .groupby(['university_name', 'university_code'], sort=False, as_index=False)
+                  .agg(department_count=('department_count', 'max'),
+                       snapshot_count=('snapshot_count', 'sum'),
+                       latest_crawl=('latest_crawl', 'max'))
+                  .sort_values('university_name', ignore_index=True))
         
         print("\n🏛️  등록된 대학교")
         print("=" * 60)
@@ -138,7 +173,7 @@ class SimpleViewer:
     
     def show_top_competition(self, limit=5):
         """경쟁률 TOP 순위를 보여줍니다."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect_latest()
         
         query = """
         WITH latest_data AS (
@@ -258,6 +293,7 @@ def main():
     """메인 함수"""
     parser = argparse.ArgumentParser(description='간단한 대학교 경쟁률 조회')
     parser.add_argument('--db', default='competition_ratio_enhanced.db', help='데이터베이스 파일')
+    parser.add_argument('--partition-dir', help='월별 스냅샷 파티션 디렉토리 (파티션 DB 사용 시)')
     parser.add_argument('--top', type=int, default=5, help='TOP 순위 개수')
     parser.add_argument('--recent', type=int, default=5, help='최근 활동 개수')
     parser.add_argument('--summary', action='store_true', help='전체 요약 보기')
@@ -266,7 +302,7 @@ def main():
     
     args = parser.parse_args()
     
-    viewer = SimpleViewer(args.db)
+    viewer = SimpleViewer(args.db, args.partition_dir)
     
     if args.list:
         viewer.show_university_list()
@@ -0,0 +1,182 @@
+import json
+import os
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from department_matcher import DepartmentMatcher
+
+DEFAULT_REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'site_adapters.json')
+
+SITE_FAMILIES = ('jinhakapply', 'uwayapply')
+MATCH_MODES = ('college_and_department', 'college_or_department', 'college_else_department')
+
+# 패턴이 적으면 C로 구현된 부분 문자열 검사가 파이썬 오토마톤 스캔보다 빠름
+# (benchmarks/bench_department_matcher.py 참고)
+MATCHER_MIN_PATTERNS = 80
+
+
+class SiteAdapter:
+    """대학교 한 곳의 크롤링 설정과 컴파일된 대상 판별/학과명 정리 규칙입니다.
+
+    match_mode
+      - college_and_department: 대상 단과대학이면서 대상 학과인 행
+      - college_or_department: 대상 단과대학이거나 대상 학과인 행
+      - college_else_department: 단과대학이 지정되면 단과대학으로, 아니면 학과로 판별
+    """
+
+    def __init__(self, entry: Dict, defaults: Dict):
+        self.code = entry['code']
+        self.name = entry['name']
+        self.family = entry['family']
+        self.url = entry['url']
+        self.target_college = entry.get('target_college')
+        self.target_departments = tuple(entry.get('target_departments', []))
+        self.extra_targets = tuple(entry.get('extra_targets', []))
+        self.match_mode = entry.get('match_mode', 'college_else_department')
+        self.seed_colleges = entry.get('seed_colleges', {})
+
+        if self.family not in SITE_FAMILIES:
+            raise ValueError(f"{self.code}: 지원하지 않는 사이트 유형 '{self.family}'")
+        if self.match_mode not in MATCH_MODES:
+            raise ValueError(f"{self.code}: 지원하지 않는 match_mode '{self.match_mode}'")
+
+        # 규칙은 로드 시 한 번만 컴파일
+        self.department_targets = self.target_departments + self.extra_targets
+        self.normalize_rules = tuple((needle, canonical) for needle, canonical in entry.get('normalize', []))
+
+        strip_patterns = entry.get('strip_patterns', defaults.get('strip_patterns', []))
+        self.strip_pattern = re.compile('|'.join([re.escape(p) for p in strip_patterns] + [r'\s+']))
+        self.remove_tokens = tuple(entry.get('remove_tokens', defaults.get('remove_tokens', [])))
+
+        self.matcher = DepartmentMatcher(self.department_targets, self.normalize_rules,
+                                         strip_patterns, self.remove_tokens,
+                                         self.clean_name, self.normalize)
+        self.use_matcher = len(self.department_targets) + len(self.normalize_rules) >= MATCHER_MIN_PATTERNS
+
+    def classify_department(self, department_raw: str, need_canonical=False) -> Tuple[bool, Optional[str]]:
+        """(대상 학과 여부, 표준 학과명)을 반환합니다.
+
+        표준 학과명은 대상 학과이거나 need_canonical=True일 때만 계산합니다.
+        규칙이 많으면 컴파일된 오토마톤으로 학과 문자열을 한 번만 스캔합니다.
+        """
+        if self.use_matcher:
+            return self.matcher.match_department(department_raw, need_canonical)
+
+        is_target = self.is_target_department(department_raw)
+        return is_target, self.normalize(department_raw) if is_target or need_canonical else None
+
+    def match(self, college_name: str, department_raw: str, normalizer=None) -> Optional[str]:
+        """대상 행이면 표준 학과명을, 아니면 None을 반환합니다.
+
+        is_target()과 normalize()를 차례로 호출한 결과와 같습니다.
+        normalizer(NameNormalizer)를 주면 학과명 판별/정리 결과를 캐시에서 재사용합니다.
+        """
+        college_hit = bool(self.target_college) and self.target_college in college_name
+        college_decides = self.match_mode == 'college_else_department' and self.target_college
+
+        if (self.match_mode == 'college_and_department' or college_decides) and not college_hit:
+            return None
+
+        if normalizer is not None:
+            is_target_department, canonical = normalizer.classify(self, department_raw)
+        else:
+            need_canonical = college_hit and self.match_mode != 'college_and_department'
+            is_target_department, canonical = self.classify_department(department_raw, need_canonical)
+
+        if self.match_mode == 'college_or_department':
+            is_target = college_hit or is_target_department
+        elif college_decides:
+            is_target = True
+        else:
+            is_target = is_target_department
+
+        return canonical if is_target else None
+
+    def is_target_department(self, department_raw: str) -> bool:
+        return any(target in department_raw for target in self.department_targets)
+
+    def is_target(self, college_name: str, department_raw: str) -> bool:
+        """행이 수집 대상인지 판별합니다."""
+        college_hit = bool(self.target_college) and self.target_college in college_name
+
+        if self.match_mode == 'college_and_department':
+            return college_hit and self.is_target_department(department_raw)
+        if self.match_mode == 'college_or_department':
+            return college_hit or self.is_target_department(department_raw)
+        if self.target_college:
+            return college_hit
+        return self.is_target_department(department_raw)
+
+    def clean_name(self, department: str) -> str:
+        """불필요한 표기와 공백을 정리합니다."""
+        clean_dept = self.strip_pattern.sub(' ', department).strip()
+        for token in self.remove_tokens:
+            clean_dept = clean_dept.replace(token, '')
+        return clean_dept
+
+    def normalize(self, department: str) -> str:
+        """학과명을 표준 학과명으로 변환합니다."""
+        clean_dept = self.clean_name(department)
+
+        for needle, canonical in self.normalize_rules:
+            if needle in clean_dept:
+                return canonical
+
+        return clean_dept.strip()
+
+
+class SiteRegistry:
+    """코드별 SiteAdapter 모음입니다. 설정 파일 순서를 유지합니다."""
+
+    def __init__(self, adapters: List[SiteAdapter]):
+        self.adapters = {adapter.code: adapter for adapter in adapters}
+
+    def get(self, code: str) -> Optional[SiteAdapter]:
+        return self.adapters.get(code)
+
+    def codes(self) -> List[str]:
+        return list(self.adapters.keys())
+
+    def __iter__(self) -> Iterator[SiteAdapter]:
+        return iter(self.adapters.values())
+
+    def __len__(self):
+        return len(self.adapters)
+
+
+_registry_cache = {}
+
+
+def read_registry_file(path: str) -> Dict:
+    """JSON 또는 YAML 설정 파일을 읽습니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            if yaml is None:
+                raise ImportError("YAML 설정을 읽으려면 PyYAML이 필요합니다: pip install pyyaml")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+def build_registry(config: Dict) -> SiteRegistry:
+    """설정 딕셔너리에서 규칙을 컴파일한 레지스트리를 만듭니다."""
+    defaults = config.get('defaults', {})
+    return SiteRegistry([SiteAdapter(entry, defaults) for entry in config['universities']])
+
+
+def load_registry(path: str = None) -> SiteRegistry:
+    """사이트 어댑터 레지스트리를 로드합니다. 파일이 바뀌지 않았으면 캐시를 재사용합니다."""
+    path = os.path.abspath(path or os.environ.get('SITE_ADAPTERS_PATH', DEFAULT_REGISTRY_PATH))
+    mtime = os.path.getmtime(path)
+
+    cached = _registry_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    registry = build_registry(read_registry_file(path))
+    _registry_cache[path] = (mtime, registry)
+    return registry
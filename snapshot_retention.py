@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+경쟁률 스냅샷 보존/압축/보관 도구
+사용법: python3 snapshot_retention.py [--raw-days 7] [--hourly-days 90] [--archive-dir archive] [--dry-run]
+                                     [--partition-dir partitions]
+
+  - raw_days 이내: 모든 스냅샷 유지
+  - raw_days ~ hourly_days: 프로그램(대학교/학과/전형)별 시간당 마지막 스냅샷만 유지
+  - hourly_days 이후: 프로그램별 하루 마지막 스냅샷만 유지
+줄어든 원본 행은 archive_dir/snapshots-YYYY-MM.ndjson.gz에 옮긴 뒤 삭제합니다.
+각 구간의 마지막 값은 남으므로 최신 경쟁률 조회 결과는 바뀌지 않습니다.
+partition_dir을 주면 공유 DB에 남은 이전 행과 함께 월별 파티션 파일도 하나씩 ATTACH해 처리합니다.
+"""
+
+import gzip
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+# 구간별 버킷 (snapshot_time 'YYYY-MM-DD HH:MM:SS'의 앞부분)
+HOURLY_BUCKET = 'substr(snapshot_time, 1, 13)'
+DAILY_BUCKET = 'substr(snapshot_time, 1, 10)'
+
+# sqlite3 PRAGMA auto_vacuum 값
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+class RetentionPolicy:
+    """스냅샷 해상도를 나이에 따라 낮추는 보존 정책입니다."""
+
+    def __init__(self, raw_days=7, hourly_days=90):
+        if hourly_days < raw_days:
+            raise ValueError("hourly_days는 raw_days보다 작을 수 없습니다.")
+        self.raw_days = raw_days
+        self.hourly_days = hourly_days
+
+    def cutoffs(self, now: datetime):
+        """(시간별 구간 끝, 일별 구간 끝)을 반환합니다.
+
+        버킷이 두 구간에 걸쳐 나뉘지 않도록 각각 시/일 경계로 내림합니다.
+        """
+        hourly_end = (now - timedelta(days=self.raw_days)).replace(minute=0, second=0, microsecond=0)
+        daily_end = (now - timedelta(days=self.hourly_days)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return hourly_end.strftime('%Y-%m-%d %H:%M:%S'), daily_end.strftime('%Y-%m-%d %H:%M:%S')
+
+
+class SnapshotRetention:
+    """competition_snapshots를 보존 정책에 따라 압축하고 원본을 gzip 파일로 보관합니다.
+
+    삭제는 batch_size 행씩 나눠 커밋하므로 크롤러의 쓰기는 한 배치 이상 기다리지 않습니다.
+    보관 파일을 먼저 쓰고 삭제하므로, 중간에 중단되면 다음 실행에서 같은 행이 한 번 더 보관될 수 있습니다.
+    파티션은 파일별로 처리합니다 (시/일 버킷은 한 달 안에 있으므로 파티션 사이에 걸치지 않음).
+    """
+
+    def __init__(self, db_path='competition_ratio_enhanced.db', archive_dir='archive',
+                 policy: RetentionPolicy = None, batch_size=500, vacuum_pages=256, partition_dir=None):
+        self.db_path = db_path
+        self.archive_dir = archive_dir
+        self.partition_dir = partition_dir
+        self.policy = policy or RetentionPolicy()
+        self.batch_size = batch_size
+        self.vacuum_pages = vacuum_pages
+        self.lock = threading.Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def redundant_ids(self, cursor, bucket: str, start: str, end: str,
+                      table='main.competition_snapshots') -> List[int]:
+        """[start, end) 구간에서 버킷별 마지막 스냅샷이 아닌 행의 ID를 반환합니다."""
+        cursor.execute(f'''
+            SELECT id FROM (
+                SELECT
+                    id,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY university_id, department_id, admission_type_id, {bucket}
+                        ORDER BY snapshot_time DESC, id DESC
+                    ) AS rn
+                FROM {table}
+                WHERE snapshot_time >= ? AND snapshot_time < ?
+            )
+            WHERE rn > 1
+            ORDER BY id
+        ''', (start, end))
+        return [row[0] for row in cursor.fetchall()]
+
+    def archive_rows(self, cursor, ids: List[int], table='main.competition_snapshots') -> int:
+        """스냅샷 행을 월별 gzip NDJSON 파일에 추가합니다."""
+        placeholders = ','.join('?' * len(ids))
+        cursor.execute(f'''
+            SELECT
+                cs.id, u.code, c.name, d.name, at.name,
+                cs.recruitment_count, cs.applicant_count, cs.snapshot_time, cs.crawl_session_id
+            FROM {table} cs
+            JOIN universities u ON cs.university_id = u.id
+            JOIN colleges c ON cs.college_id = c.id
+            JOIN departments d ON cs.department_id = d.id
+            JOIN admission_types at ON cs.admission_type_id = at.id
+            WHERE cs.id IN ({placeholders})
+            ORDER BY cs.id
+        ''', ids)
+
+        lines_by_month = {}
+        for (snapshot_id, code, college, department, admission_type,
+             recruitment, applicants, snapshot_time, session_id) in cursor:
+            lines_by_month.setdefault(snapshot_time[:7], []).append(json.dumps({
+                'id': snapshot_id,
+                'university_code': code,
+                'college': college,
+                'department': department,
+                'admission_type': admission_type,
+                'recruitment_count': recruitment,
+                'applicant_count': applicants,
+                'snapshot_time': snapshot_time,
+                'crawl_session_id': session_id
+            }, ensure_ascii=False, separators=(',', ':')))
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        archived = 0
+        for month, lines in lines_by_month.items():
+            # gzip 멤버를 이어 붙이면 gzip.open으로 한 파일처럼 읽을 수 있음
+            path = os.path.join(self.archive_dir, f"snapshots-{month}.ndjson.gz")
+            with gzip.open(path, 'at', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+            archived += len(lines)
+        return archived
+
+    def compact_tier(self, conn: sqlite3.Connection, bucket: str, start: str, end: str,
+                     dry_run=False, table='main.competition_snapshots') -> int:
+        """한 구간을 버킷별 마지막 스냅샷만 남도록 줄이고 삭제한 행 수를 반환합니다."""
+        cursor = conn.cursor()
+        ids = self.redundant_ids(cursor, bucket, start, end, table)
+        if dry_run:
+            return len(ids)
+
+        removed = 0
+        for offset in range(0, len(ids), self.batch_size):
+            batch = ids[offset:offset + self.batch_size]
+            self.archive_rows(cursor, batch, table)
+            cursor.execute(f"DELETE FROM {table} WHERE id IN ({','.join('?' * len(batch))})", batch)
+            conn.commit()
+            removed += cursor.rowcount
+        return removed
+
+    def reclaim_space(self, conn: sqlite3.Connection, schema='main') -> int:
+        """증분 VACUUM(가능한 경우)과 PRAGMA optimize를 실행하고 반환한 페이지 수를 돌려줍니다."""
+        freed = 0
+        auto_vacuum = conn.execute(f'PRAGMA {schema}.auto_vacuum').fetchone()[0]
+        if auto_vacuum == AUTO_VACUUM_INCREMENTAL:
+            while True:
+                free_pages = conn.execute(f'PRAGMA {schema}.freelist_count').fetchone()[0]
+                if not free_pages:
+                    break
+                step = min(free_pages, self.vacuum_pages)
+                # execute()로는 한 단계(1페이지)만 진행되므로 executescript로 끝까지 실행 (자체 커밋)
+                conn.executescript(f'PRAGMA {schema}.incremental_vacuum({step})')
+                freed += step
+        conn.execute(f'PRAGMA {schema}.optimize')
+        return freed
+
+    def partition_keys(self, hourly_end: str) -> List[str]:
+        """압축할 구간(hourly_end 이전)과 겹치는 파티션 키를 반환합니다."""
+        if not self.partition_dir:
+            return []
+        from partitioned_store import PartitionDirectory
+        return [key for key in PartitionDirectory(self.partition_dir).keys() if key <= hourly_end[:7]]
+
+    def compact(self, conn: sqlite3.Connection, table: str, schema: str, hourly_end: str, daily_end: str,
+                dry_run: bool, stats: Dict[str, int]):
+        """스냅샷 테이블 하나에 보존 정책을 적용하고 stats에 더합니다."""
+        stats['daily'] += self.compact_tier(conn, DAILY_BUCKET, '', daily_end, dry_run, table)
+        stats['hourly'] += self.compact_tier(conn, HOURLY_BUCKET, daily_end, hourly_end, dry_run, table)
+        if not dry_run:
+            stats['freed_pages'] += self.reclaim_space(conn, schema)
+
+    def enable_incremental_vacuum(self):
+        """기존 DB를 auto_vacuum=INCREMENTAL로 전환합니다 (전체 VACUUM 1회, 크롤링 중에는 실행하지 말 것)."""
+        conn = self.connect()
+        conn.execute('PRAGMA auto_vacuum = INCREMENTAL')
+        conn.execute('VACUUM')
+        conn.close()
+        print("auto_vacuum=INCREMENTAL 전환 완료")
+
+    def run(self, now: datetime = None, dry_run=False) -> Dict[str, int]:
+        """보존 정책을 한 번 적용합니다. 이미 실행 중이면 건너뜁니다."""
+        if not self.lock.acquire(blocking=False):
+            print("스냅샷 보존 작업이 이미 실행 중입니다.")
+            return {}
+
+        try:
+            now = now or datetime.utcnow()
+            hourly_end, daily_end = self.policy.cutoffs(now)
+
+            stats = {'daily': 0, 'hourly': 0, 'freed_pages': 0}
+            conn = self.connect()
+            try:
+                self.compact(conn, 'main.competition_snapshots', 'main', hourly_end, daily_end, dry_run, stats)
+
+                # 파티션은 한 번에 하나씩 ATTACH (ATTACH 한도와 무관하게 처리)
+                keys = self.partition_keys(hourly_end)
+                if keys:
+                    from partitioned_store import PartitionDirectory, schema_name
+                    partitions = PartitionDirectory(self.partition_dir)
+                    for key in keys:
+                        schema = schema_name(key)
+                        conn.execute(f'ATTACH DATABASE ? AS {schema}', (partitions.path(key),))
+                        try:
+                            self.compact(conn, f'{schema}.competition_snapshots', schema,
+                                         hourly_end, daily_end, dry_run, stats)
+                        finally:
+                            conn.execute(f'DETACH DATABASE {schema}')
+            finally:
+                conn.close()
+
+            action = "삭제 예정" if dry_run else "보관 후 삭제"
+            scope = f", 파티션 {len(keys)}개" if self.partition_dir else ''
+            print(f"스냅샷 보존: 일별 구간 {stats['daily']}개, 시간별 구간 {stats['hourly']}개 {action}"
+                  f" (원본 유지 {self.policy.raw_days}일, 시간별 {self.policy.hourly_days}일{scope}), "
+                  f"반환 페이지 {stats['freed_pages']}개")
+            return stats
+        finally:
+            self.lock.release()
+
+    def run_in_background(self) -> threading.Thread:
+        """보존 작업을 백그라운드 스레드에서 실행합니다 (스케줄러용)."""
+        thread = threading.Thread(target=self.run, name='snapshot-retention', daemon=True)
+        thread.start()
+        return thread
+
+
+def main():
+    """메인 함수"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='경쟁률 스냅샷 보존/압축/보관')
+    parser.add_argument('--db', default='competition_ratio_enhanced.db', help='데이터베이스 파일 경로')
+    parser.add_argument('--archive-dir', default='archive', help='원본 스냅샷 보관 디렉토리')
+    parser.add_argument('--raw-days', type=int, default=7, help='모든 스냅샷을 유지할 기간 (일)')
+    parser.add_argument('--hourly-days', type=int, default=90, help='시간별 스냅샷을 유지할 기간 (일)')
+    parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상 행 수만 출력')
+    parser.add_argument('--partition-dir', help='월별 스냅샷 파티션 디렉토리 (파티션 DB 사용 시)')
+    parser.add_argument('--enable-incremental-vacuum', action='store_true',
+                        help='기존 DB를 증분 VACUUM 모드로 전환 (전체 VACUUM 1회)')
+    args = parser.parse_args()
+
+    retention = SnapshotRetention(args.db, args.archive_dir, RetentionPolicy(args.raw_days, args.hourly_days),
+                                  partition_dir=args.partition_dir)
+    if args.enable_incremental_vacuum:
+        retention.enable_incremental_vacuum()
+    retention.run(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
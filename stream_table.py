@@ -0,0 +1,160 @@
+"""
+고정 너비 터미널 표 출력
+열 너비를 머리글, 앞쪽 sample_size개 행, 호출자가 준 너비(예: SQL로 구한 최대 길이)로 정한 뒤
+행을 받는 대로 한 줄씩 출력합니다. 전체 행을 모아 측정하지 않으므로 첫 출력이 바로 나오고,
+표가 커져도 메모리 사용량이 표본 크기를 넘지 않습니다. 정한 너비보다 긴 칸은 '…'로 자릅니다.
+"""
+
+import io
+import os
+import shlex
+import subprocess
+import sys
+import unicodedata
+from contextlib import contextmanager
+from itertools import chain, islice
+from typing import Iterable, List, Optional, Sequence
+
+# (왼쪽, 채움, 열 구분, 오른쪽) 가로줄과 (왼쪽, 열 구분, 오른쪽) 칸 테두리. 채움 문자 가로줄은 칸 여백을 포함
+STYLES = {
+    'simple': {'top': None, 'header': ('', '-', '  ', ''), 'row': None, 'bottom': None,
+               'cell': ('', '  ', ''), 'padding': 0},
+    'grid': {'top': ('+', '-', '+', '+'), 'header': ('+', '=', '+', '+'), 'row': ('+', '-', '+', '+'),
+             'bottom': ('+', '-', '+', '+'), 'cell': ('| ', ' | ', ' |'), 'padding': 2},
+    'box': {'top': ('╒', '═', '╤', '╕'), 'header': ('╞', '═', '╪', '╡'), 'row': ('├', '─', '┼', '┤'),
+            'bottom': ('╘', '═', '╧', '╛'), 'cell': ('│ ', ' │ ', ' │'), 'padding': 2},
+    'markdown': {'top': None, 'header': ('|', '-', '|', '|'), 'row': None, 'bottom': None,
+                 'cell': ('| ', ' | ', ' |'), 'padding': 2},
+}
+
+
+def display_width(text: str) -> int:
+    """터미널에서 차지하는 칸 수 (한글/전각 문자와 이모지는 2칸, 결합 문자는 0칸)"""
+    width = 0
+    for char in text:
+        if unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+    return width
+
+
+def fit(text: str, width: int, align='left') -> str:
+    """text를 width칸에 맞춥니다. 넘치면 '…'로 자릅니다."""
+    text_width = display_width(text)
+    if text_width > width:
+        kept, used = [], 0
+        for char in text:
+            char_width = display_width(char)
+            if used + char_width > width - 1:
+                break
+            kept.append(char)
+            used += char_width
+        text, text_width = ''.join(kept) + '…', used + 1
+    padding = ' ' * (width - text_width)
+    return padding + text if align == 'right' else text + padding
+
+
+class StreamingTable:
+    """행 이터러블을 고정 너비 표로 출력합니다.
+
+    widths의 각 값은 열의 최소 너비이며(None이거나 생략된 열은 표본으로만 결정), 표본 행이 더 넓으면 늘어납니다.
+    """
+
+    def __init__(self, headers: Sequence[str], style='simple', widths: Sequence[Optional[int]] = None,
+                 aligns: Sequence[str] = None, sample_size=200, out=None, flush_every=100):
+        self.headers = [str(header) for header in headers]
+        self.style = STYLES[style]
+        self.widths = list(widths or [])
+        self.widths += [None] * (len(self.headers) - len(self.widths))
+        self.aligns = list(aligns) if aligns else ['left'] * len(self.headers)
+        self.sample_size = sample_size
+        self.out = out
+        self.flush_every = flush_every
+
+    def measure(self, sample: List[List[str]]) -> List[int]:
+        widths = []
+        for index, header in enumerate(self.headers):
+            width = max(display_width(line) for line in header.split('\n'))
+            if self.widths[index]:
+                width = max(width, self.widths[index])
+            for cells in sample:
+                width = max(width, max(display_width(line) for line in cells[index].split('\n')))
+            widths.append(width)
+        return widths
+
+    def rule(self, chars, widths: List[int]) -> str:
+        left, fill, middle, right = chars
+        padding = self.style['padding']
+        return left + middle.join(fill * (width + padding) for width in widths) + right
+
+    def lines(self, cells: List[str], widths: List[int], aligns: List[str]) -> List[str]:
+        """한 행을 출력 줄로 바꿉니다 (여러 줄 칸은 행 높이를 늘림)."""
+        left, middle, right = self.style['cell']
+        split = [cell.split('\n') for cell in cells]
+        height = max(len(parts) for parts in split)
+        return [
+            (left + middle.join(fit(parts[line] if line < len(parts) else '', width, align)
+                                for parts, width, align in zip(split, widths, aligns)) + right).rstrip()
+            for line in range(height)
+        ]
+
+    def write(self, rows: Iterable[Sequence]) -> int:
+        """행을 출력하고 출력한 행 수를 반환합니다."""
+        out = self.out or sys.stdout
+        rows = ([('' if cell is None else str(cell)) for cell in row] for row in rows)
+        sample = list(islice(rows, self.sample_size))
+        widths = self.measure(sample)
+        style = self.style
+
+        if style['top']:
+            out.write(self.rule(style['top'], widths) + '\n')
+        for line in self.lines(self.headers, widths, ['left'] * len(widths)):
+            out.write(line + '\n')
+        out.write(self.rule(style['header'], widths).rstrip() + '\n')
+        out.flush()
+
+        count = 0
+        for cells in chain(sample, rows):
+            if count and style['row']:
+                out.write(self.rule(style['row'], widths) + '\n')
+            for line in self.lines(cells, widths, self.aligns):
+                out.write(line + '\n')
+            count += 1
+            if count % self.flush_every == 0:
+                out.flush()
+        if style['bottom']:
+            out.write(self.rule(style['bottom'], widths) + '\n')
+        out.flush()
+        return count
+
+
+def render_table(headers: Sequence[str], rows: Iterable[Sequence], style='simple', **options) -> str:
+    """표를 문자열로 만듭니다 (마지막 줄바꿈 제외)."""
+    buffer = io.StringIO()
+    StreamingTable(headers, style, out=buffer, **options).write(rows)
+    return buffer.getvalue().rstrip('\n')
+
+
+@contextmanager
+def pager_output(command: str = None):
+    """출력을 페이저($PAGER, 없으면 less -RS)의 입력으로 보내는 파일 객체를 제공합니다.
+
+    페이저를 실행할 수 없으면 표준 출력을 쓰고, 사용자가 페이저를 먼저 닫으면 남은 출력을 버립니다.
+    """
+    command = command or os.environ.get('PAGER') or 'less -RS'
+    try:
+        process = subprocess.Popen(shlex.split(command), stdin=subprocess.PIPE, text=True, encoding='utf-8')
+    except OSError:
+        yield sys.stdout
+        return
+
+    try:
+        yield process.stdin
+    except BrokenPipeError:
+        pass
+    finally:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        process.wait()
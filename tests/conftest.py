@@ -0,0 +1,51 @@
+"""
+테스트 공통 설정
+사용법: python3 -m pytest -q tests
+
+각 테스트는 임시 디렉토리에서 실행되며, 모듈이 기본 경로(competition_ratio_enhanced.db)로 여는 DB도 그 안에 만들어집니다.
+"""
+
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from enhanced_database_setup import create_enhanced_database, initialize_base_data
+
+DB_PATH = 'competition_ratio_enhanced.db'
+
+
+@pytest.fixture
+def enhanced_db(tmp_path, monkeypatch):
+    """임시 디렉토리에 기본 데이터가 들어 있는 향상된 DB를 만들고 경로를 반환합니다."""
+    monkeypatch.chdir(tmp_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        create_enhanced_database()
+        initialize_base_data()
+    return DB_PATH
+
+
+def add_program(db_path, university_code, college, department, admission_type='교과전형'):
+    """대학교에 학과/전형을 추가하고 (university_id, college_id, department_id, admission_type_id)를 반환합니다."""
+    conn = sqlite3.connect(db_path)
+    try:
+        cursor = conn.cursor()
+        university_id = cursor.execute('SELECT id FROM universities WHERE code = ?', (university_code,)).fetchone()[0]
+        cursor.execute('INSERT OR IGNORE INTO colleges (university_id, name) VALUES (?, ?)', (university_id, college))
+        college_id = cursor.execute('SELECT id FROM colleges WHERE university_id = ? AND name = ?',
+                                    (university_id, college)).fetchone()[0]
+        cursor.execute('INSERT OR IGNORE INTO departments (college_id, name) VALUES (?, ?)', (college_id, department))
+        department_id = cursor.execute('SELECT id FROM departments WHERE college_id = ? AND name = ?',
+                                       (college_id, department)).fetchone()[0]
+        cursor.execute('INSERT OR IGNORE INTO admission_types (name) VALUES (?)', (admission_type,))
+        admission_type_id = cursor.execute('SELECT id FROM admission_types WHERE name = ?',
+                                           (admission_type,)).fetchone()[0]
+        conn.commit()
+        return university_id, college_id, department_id, admission_type_id
+    finally:
+        conn.close()
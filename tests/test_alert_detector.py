@@ -0,0 +1,75 @@
+"""경쟁률 급변 감지기의 시작 상태와 알림 저장 테스트"""
+
+import contextlib
+import io
+import sqlite3
+from datetime import datetime, timedelta
+
+from conftest import add_program
+
+START = datetime(2025, 9, 10, 9, 0)
+
+
+def insert_steady_history(db_path, ids, count=6):
+    """10분마다 지원자가 10명씩 늘어난 스냅샷 count개를 넣고 마지막 시각과 지원자 수를 반환합니다."""
+    rows = [ids + (100, 10 * index, (START + timedelta(minutes=10 * index)).strftime('%Y-%m-%d %H:%M:%S'), 's')
+            for index in range(count)]
+    conn = sqlite3.connect(db_path)
+    conn.executemany('''
+        INSERT INTO competition_snapshots
+        (university_id, college_id, department_id, admission_type_id,
+         recruitment_count, applicant_count, snapshot_time, crawl_session_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
+    conn.commit()
+    conn.close()
+    return START + timedelta(minutes=10 * (count - 1)), 10 * (count - 1)
+
+
+def spike_snapshot(last_time, last_applicants):
+    return {
+        'university_code': 'CKU', 'college': '소프트웨어융합대학', 'department': '컴퓨터소프트웨어학부',
+        'admission_type': '교과전형', 'recruitment_count': 100, 'applicant_count': last_applicants + 30,
+        'snapshot_time': (last_time + timedelta(minutes=10)).strftime('%Y-%m-%d %H:%M:%S'),
+        'crawl_session_id': 'next'
+    }
+
+
+def test_seeded_detector_alerts_on_first_cycle_after_restart(enhanced_db):
+    from alert_detector import StreamingChangeDetector
+
+    ids = add_program(enhanced_db, 'CKU', '소프트웨어융합대학', '컴퓨터소프트웨어학부')
+    last_time, last_applicants = insert_steady_history(enhanced_db, ids)
+
+    unseeded = StreamingChangeDetector(enhanced_db)
+    assert unseeded.observe(spike_snapshot(last_time, last_applicants)) == []
+
+    detector = StreamingChangeDetector(enhanced_db)
+    assert detector.seed_from_db() == 1
+    alerts = detector.observe(spike_snapshot(last_time, last_applicants))
+    assert [alert['alert_type'] for alert in alerts] == ['SPIKE']
+
+
+def test_alerts_are_saved_without_touching_writer_transaction(enhanced_db):
+    from alert_detector import StreamingChangeDetector
+
+    ids = add_program(enhanced_db, 'CKU', '소프트웨어융합대학', '컴퓨터소프트웨어학부')
+    last_time, last_applicants = insert_steady_history(enhanced_db, ids)
+    detector = StreamingChangeDetector(enhanced_db)
+    detector.seed_from_db()
+
+    # 쓰기 스레드의 연결에 아직 커밋하지 않은 작업이 있는 상태
+    writer = sqlite3.connect(enhanced_db)
+    writer.execute("CREATE TEMP TABLE pending (id INTEGER)")
+    writer.execute("INSERT INTO pending VALUES (1)")
+    assert writer.in_transaction
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        detector.on_snapshots([spike_snapshot(last_time, last_applicants)], writer)
+
+    assert writer.in_transaction
+    writer.rollback()
+    writer.close()
+    conn = sqlite3.connect(enhanced_db)
+    assert conn.execute("SELECT alert_type FROM competition_alerts").fetchall() == [('SPIKE',)]
+    conn.close()
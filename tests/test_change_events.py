@@ -0,0 +1,37 @@
+"""변경 이벤트 버스 기준값 테스트"""
+
+import contextlib
+import io
+import sqlite3
+
+from conftest import add_program
+
+
+def test_seed_from_partitions_suppresses_unchanged_programs(enhanced_db):
+    from change_events import ChangeEventBus
+    from partitioned_store import migrate_to_partitions
+
+    ids = add_program(enhanced_db, 'CKU', '소프트웨어융합대학', '컴퓨터소프트웨어학부')
+    conn = sqlite3.connect(enhanced_db)
+    conn.execute('''
+        INSERT INTO competition_snapshots
+        (university_id, college_id, department_id, admission_type_id,
+         recruitment_count, applicant_count, snapshot_time, crawl_session_id)
+        VALUES (?, ?, ?, ?, 10, 42, datetime('now'), 's')
+    ''', ids)
+    conn.commit()
+    conn.close()
+    with contextlib.redirect_stdout(io.StringIO()):
+        migrate_to_partitions(enhanced_db, 'partitions')
+
+    bus = ChangeEventBus()
+    assert bus.seed_from_db(enhanced_db, 'partitions') == 1
+
+    snapshot = {'university_code': 'CKU', 'college': '소프트웨어융합대학', 'department': '컴퓨터소프트웨어학부',
+                'admission_type': '교과전형', 'recruitment_count': 10, 'applicant_count': 42,
+                'snapshot_time': '2026-01-01 00:00:00'}
+    with bus.subscribe() as subscription:
+        bus.on_snapshots([snapshot])
+        assert subscription.get(timeout=0) is None
+        bus.on_snapshots([dict(snapshot, applicant_count=43)])
+        assert subscription.get(timeout=0) is not None
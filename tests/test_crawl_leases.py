@@ -0,0 +1,65 @@
+"""리스 기반 워커의 주기 결정 테스트"""
+
+import sqlite3
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import crawl_leases
+from crawl_leases import CrawlWorker, LeaseQueue
+from crawler_core import SnapshotStore
+
+INTERVAL_MINUTES = 10
+
+
+def skewed_clock(offset: timedelta):
+    """utcnow()가 실제 시각보다 offset만큼 어긋난 datetime 대체 클래스를 만듭니다."""
+
+    class SkewedDatetime(datetime):
+        @classmethod
+        def utcnow(cls):
+            return datetime.utcnow() + offset
+
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.now(tz) + offset
+
+    return SkewedDatetime
+
+
+def make_worker(db_path, worker_id):
+    crawler = SimpleNamespace(db_path=db_path, store=SnapshotStore(db_path),
+                              university_configs={'CKU': {}, 'KNU': {}},
+                              writer_queue_size=8, writer_chunk_size=200, writer_group_size=8)
+    worker = CrawlWorker(crawler, LeaseQueue(db_path), worker_id=worker_id, interval_minutes=INTERVAL_MINUTES)
+    worker.running = False  # 주기 등록만 확인 (작업은 가져가지 않음)
+    return worker
+
+
+def test_skewed_worker_clocks_share_one_cycle(enhanced_db, monkeypatch):
+    # 두 워커의 시계가 주기 경계를 사이에 두고 1초 전/후를 가리키도록 어긋나게 함
+    now = datetime.utcnow()
+    interval = INTERVAL_MINUTES * 60
+    seconds = int((now - datetime(1970, 1, 1)).total_seconds())
+    boundary = datetime(1970, 1, 1) + timedelta(seconds=(seconds // interval + 1) * interval)
+    clocks = {'early': boundary - timedelta(seconds=1) - now, 'late': boundary + timedelta(seconds=1) - now}
+
+    for worker_id, offset in clocks.items():
+        monkeypatch.setattr(crawl_leases, 'datetime', skewed_clock(offset))
+        make_worker(enhanced_db, worker_id).run_cycle()
+
+    conn = sqlite3.connect(enhanced_db)
+    rows = conn.execute('SELECT cycle, status, COUNT(*) FROM crawl_work_items GROUP BY cycle, status').fetchall()
+    db_cycle = conn.execute(
+        "SELECT strftime('%Y-%m-%d %H:%M', CAST(strftime('%s', 'now') AS INTEGER) / ? * ?, 'unixepoch')",
+        (interval, interval)).fetchone()[0]
+    conn.close()
+    # 두 번째 워커가 첫 워커의 주기를 EXPIRED로 만들지 않고 같은 작업을 봄
+    assert rows == [(db_cycle, 'PENDING', 2)]
+
+
+def test_enqueue_cycle_reports_elapsed_db_time(enhanced_db):
+    cycle, elapsed = LeaseQueue(enhanced_db).enqueue_cycle(['CKU'], INTERVAL_MINUTES)
+    start = datetime.strptime(cycle, '%Y-%m-%d %H:%M')
+    assert start.minute % INTERVAL_MINUTES == 0
+    assert 0 <= elapsed < INTERVAL_MINUTES * 60
+    assert abs((datetime.utcnow() - start).total_seconds() - elapsed) < 5
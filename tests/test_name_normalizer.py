@@ -0,0 +1,66 @@
+"""이름 정규화 캐시의 동시 접근 테스트"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from name_normalizer import LRUCache, NameNormalizer
+
+THREADS = 8
+ROUNDS = 2000
+
+
+class YieldingDict(OrderedDict):
+    """조회 직후 다른 스레드로 전환해 get()과 put()의 제거가 겹치도록 합니다."""
+
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        time.sleep(0)
+        return value
+
+
+def run_threads(target, count=THREADS):
+    errors = []
+
+    def wrapped(*args):
+        try:
+            target(*args)
+        except Exception as e:  # 스레드 안 예외를 테스트로 전달
+            errors.append(e)
+
+    threads = [threading.Thread(target=wrapped, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def test_lru_cache_concurrent_get_put():
+    cache = LRUCache(maxsize=4)
+    cache.data = YieldingDict()
+
+    def worker(offset):
+        for index in range(ROUNDS):
+            key = (offset + index) % 8
+            if cache.get(key) is None:
+                cache.put(key, key * 2)
+
+    assert run_threads(worker) == []
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == THREADS * ROUNDS
+    assert stats['size'] <= 4
+    assert all(value == key * 2 for key, value in cache.data.items())
+
+
+def test_shared_normalizer_across_threads():
+    normalizer = NameNormalizer(maxsize=4)
+    normalizer.departments.data = YieldingDict()
+
+    def worker(offset):
+        for index in range(ROUNDS):
+            name = f' 학과{(offset + index) % 8} '
+            assert normalizer.department('CKU', name, str.strip) == name.strip()
+
+    assert run_threads(worker) == []
+    assert normalizer.departments.stats()['size'] <= 4
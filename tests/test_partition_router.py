@@ -0,0 +1,127 @@
+"""월별 파티션이 ATTACH 한도(10개)보다 많을 때의 조회 테스트"""
+
+import contextlib
+import io
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from conftest import add_program
+
+DAYS = 400  # 약 14개월 → 파티션 14개
+
+
+@pytest.fixture
+def partitioned_db(enhanced_db):
+    """두 프로그램의 하루 한 번 스냅샷을 DAYS일 동안 쌓고 월별 파티션으로 옮깁니다."""
+    from partitioned_store import migrate_to_partitions
+
+    programs = [add_program(enhanced_db, 'CKU', '소프트웨어융합대학', '컴퓨터소프트웨어학부'),
+                add_program(enhanced_db, 'CKU', '소프트웨어융합대학', 'AI빅데이터공학과')]
+    now = datetime.utcnow().replace(microsecond=0)
+    rows = []
+    for day in range(DAYS, -1, -1):
+        snapshot_time = (now - timedelta(days=day, minutes=5)).strftime('%Y-%m-%d %H:%M:%S')
+        for index, ids in enumerate(programs):
+            rows.append(ids + (10, (DAYS - day) + index, snapshot_time, 's'))
+    conn = sqlite3.connect(enhanced_db)
+    conn.executemany('''
+        INSERT INTO competition_snapshots
+        (university_id, college_id, department_id, admission_type_id,
+         recruitment_count, applicant_count, snapshot_time, crawl_session_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
+    conn.commit()
+    conn.close()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        migrate_to_partitions(enhanced_db, 'partitions')
+    return enhanced_db, len(rows)
+
+
+def test_more_partitions_than_attach_limit(partitioned_db):
+    from partitioned_store import DEFAULT_MAX_ATTACHED, PartitionRouter
+
+    db_path, _ = partitioned_db
+    router = PartitionRouter(db_path, 'partitions')
+    assert len(router.partitions.keys()) > DEFAULT_MAX_ATTACHED
+    # 전체를 한 연결에 붙이는 것은 여전히 한도에 걸림 (아래 조회들은 이 경로를 쓰지 않아야 함)
+    with pytest.raises(ValueError):
+        router.connect()
+
+
+def test_connect_each_counts_every_row_once(partitioned_db):
+    from partitioned_store import PartitionRouter
+
+    db_path, total = partitioned_db
+    counted = 0
+    for conn in PartitionRouter(db_path, 'partitions').connect_each():
+        counted += conn.execute('SELECT COUNT(*) FROM competition_snapshots').fetchone()[0]
+        conn.close()
+    assert counted == total
+
+
+def test_trend_analyzer_latest_and_long_window(partitioned_db):
+    from trend_analyzer import TrendAnalyzer
+
+    db_path, total = partitioned_db
+    analyzer = TrendAnalyzer(db_path, partition_dir='partitions')
+
+    latest = analyzer.get_latest_stats()
+    assert sorted(latest['applicant_count']) == [DAYS, DAYS + 1]
+
+    series = analyzer.get_time_series_data(hours_back=(DAYS + 2) * 24)
+    assert len(series) == total
+    assert series['snapshot_time'].is_monotonic_increasing
+
+
+def test_comprehensive_viewer_without_window(partitioned_db):
+    from comprehensive_viewer import ComprehensiveDataViewer
+
+    db_path, total = partitioned_db
+    out = io.StringIO()
+    viewer = ComprehensiveDataViewer(db_path, partition_dir='partitions', out=out)
+
+    overview = viewer.get_all_universities_overview()
+    cku = overview[overview['university_code'] == 'CKU'].iloc[0]
+    assert cku['total_snapshots'] == total
+    assert len(overview) == len(overview['university_code'].unique())
+
+    summary = viewer.get_university_summary_stats()
+    assert summary[summary['university_code'] == 'CKU'].iloc[0]['total_applicants'] == 2 * DAYS + 1
+    assert len(viewer.get_top_competitive_programs()) == 2
+
+    viewer.print_comprehensive_report(hours_back=24)
+    assert f"{total:,}개" in out.getvalue()
+
+
+def test_chart_versions_and_forecast_over_all_partitions(partitioned_db):
+    from chart_renderer import HeadlessChartRenderer
+    from ratio_forecast import RatioForecaster
+
+    db_path, total = partitioned_db
+    renderer = HeadlessChartRenderer(db_path, 'charts', partition_dir='partitions')
+    jobs = renderer.build_jobs(hours_back=(DAYS + 2) * 24)
+    assert renderer.get_university_codes((DAYS + 2) * 24) == ['CKU']
+    assert renderer.get_data_versions(jobs)[jobs[0]['path']].startswith(f"{total}:")
+
+    deadline = datetime.utcnow() + timedelta(days=3)
+    forecaster = RatioForecaster(deadline, db_path, history_hours=(DAYS + 2) * 24, partition_dir='partitions')
+    with contextlib.redirect_stdout(io.StringIO()):
+        forecasts = forecaster.update()
+    assert len(forecasts) == 2
+
+
+def test_simple_viewer_summary_over_all_partitions(partitioned_db):
+    from simple_viewer import SimpleViewer
+
+    db_path, total = partitioned_db
+    viewer = SimpleViewer(db_path, partition_dir='partitions')
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        viewer.show_quick_summary()
+    text = out.getvalue()
+    assert f"{total}개 스냅샷" in text
+    assert f"스냅샷:{total:>3}개" in text
+    assert f"지원:{DAYS + 1:>3}명" in text
@@ -0,0 +1,27 @@
+"""마감 시각 해석 테스트"""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from ratio_forecast import parse_deadline
+
+
+@pytest.fixture(params=['UTC', 'America/New_York', 'Asia/Seoul'])
+def host_tz(request, monkeypatch):
+    """호스트 시간대를 바꾼 채로 실행합니다."""
+    monkeypatch.setenv('TZ', request.param)
+    time.tzset()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_naive_deadline_is_kst_regardless_of_host_tz(host_tz):
+    assert parse_deadline('2025-09-12 18:00') == datetime(2025, 9, 12, 9, 0)
+
+
+def test_explicit_offset_is_respected(host_tz):
+    assert parse_deadline('2025-09-12 18:00+00:00') == datetime(2025, 9, 12, 18, 0)
+    assert parse_deadline('2025-09-12 18:00+09:00') == datetime(2025, 9, 12, 9, 0)
@@ -1,4 +1,5 @@
 import sqlite3
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
@@ -9,19 +10,54 @@ from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
 import os
 
+from downsampling import downsample
+
 # 한글 폰트 설정
 plt.rcParams['font.family'] = ['DejaVu Sans', 'NanumGothic', 'Malgun Gothic', 'sans-serif']
 plt.rcParams['axes.unicode_minus'] = False
 
 class TrendAnalyzer:
-    def __init__(self, db_path='competition_ratio_enhanced.db'):
+    def __init__(self, db_path='competition_ratio_enhanced.db', max_points=500, downsample_method='lttb',
+                 partition_dir=None):
         self.db_path = db_path
+        # 월별 파티션 DB를 쓰는 경우 조회 구간과 겹치는 파티션만 연결
+        self.router = None
+        if partition_dir:
+            from partitioned_store import PartitionRouter
+            self.router = PartitionRouter(db_path, partition_dir)
+        # 시리즈별 최대 렌더링 점 개수 (None이면 원본 그대로)
+        self.max_points = max_points
+        self.downsample_method = downsample_method
+    
+    def connect_latest(self):
+        """프로그램별 최신 값 조회용 연결을 엽니다. 파티션 DB면 최근 파티션만 연결합니다."""
+        if self.router:
+            return self.router.connect_latest()
+        return sqlite3.connect(self.db_path)
+    
+    def read_window(self, query, params=(), hours_back=None):
+        """구간 조회 결과를 DataFrame으로 읽습니다.
+        
+        파티션 DB면 구간의 파티션을 하나씩 연결해 읽고 이어 붙이므로, 긴 구간도 ATTACH 한도에 걸리지 않습니다.
+        """
+        if not self.router:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                return pd.read_sql_query(query, conn, params=params)
+            finally:
+                conn.close()
+        
+        frames = []
+        for conn in self.router.connect_each(hours_back=hours_back):
+            try:
+                frames.append(pd.read_sql_query(query, conn, params=params))
+            finally:
+                conn.close()
+        return pd.concat(frames, ignore_index=True)
         
     def get_time_series_data(self, university_code=None, department_name=None, 
                            admission_type=None, hours_back=24):
         """시간별 경쟁률 변화 데이터를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
-        
         # 기본 쿼리
         query = """
         SELECT 
@@ -56,17 +92,19 @@ class TrendAnalyzer:
             
         query += " ORDER BY cs.snapshot_time ASC"
         
-        df = pd.read_sql_query(query, conn, params=params)
-        conn.close()
+        df = self.read_window(query, params, hours_back)
         
         if not df.empty:
             df['snapshot_time'] = pd.to_datetime(df['snapshot_time'])
+            if self.router:
+                # 파티션별 결과를 이어 붙였으므로 전체를 다시 시간순으로 정렬
+                df = df.sort_values('snapshot_time', kind='stable', ignore_index=True)
         
         return df
     
     def get_latest_stats(self):
         """최신 통계를 조회합니다."""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect_latest()
         
         query = """
         WITH latest_snapshots AS (
@@ -103,9 +141,22 @@ class TrendAnalyzer:
         
         return df
     
+    def downsample_series(self, group, value_column, max_points=None):
+        """시계열을 모양을 보존하며 다운샘플링합니다.
+        
+        시간은 epoch 밀리초(int64), 값은 float64 배열로 반환합니다.
+        """
+        if max_points is None:
+            max_points = self.max_points
+        
+        times = group['snapshot_time'].values.astype('datetime64[ms]').astype(np.int64)
+        values = group[value_column].to_numpy(dtype=np.float64)
+        
+        return downsample(times, values, max_points, method=self.downsample_method)
+    
     def plot_competition_trend(self, university_code=None, department_name=None, 
-                              hours_back=24, save_path=None):
-        """경쟁률 추세를 시각화합니다."""
+                              hours_back=24, save_path=None, show=True):
+        """경쟁률 추세를 시각화합니다. show=False이면 저장 후 figure를 닫습니다."""
         df = self.get_time_series_data(university_code, department_name, hours_back=hours_back)
         
         if df.empty:
@@ -115,13 +166,14 @@ class TrendAnalyzer:
         # 그룹별로 데이터 분리
         groups = df.groupby(['university_code', 'department_name', 'admission_type'])
         
-        plt.figure(figsize=(15, 8))
+        fig = plt.figure(figsize=(15, 8))
         
         colors = plt.cm.Set3(range(len(groups)))
         
         for i, ((univ, dept, adm_type), group) in enumerate(groups):
             label = f"{univ}-{dept}-{adm_type}"
-            plt.plot(group['snapshot_time'], group['competition_ratio'], 
+            times, ratios = self.downsample_series(group, 'competition_ratio')
+            plt.plot(times.astype('datetime64[ms]'), ratios, 
                     marker='o', label=label, color=colors[i], linewidth=2, markersize=4)
         
         plt.title(f'경쟁률 변화 추이 (최근 {hours_back}시간)', fontsize=16, fontweight='bold')
@@ -138,15 +190,18 @@ class TrendAnalyzer:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
             print(f"그래프가 {save_path}에 저장되었습니다.")
         
-        plt.show()
-        return plt.gcf()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
+        return fig
     
     def plot_applicant_trend(self, university_code=None, department_name=None, 
-                           hours_back=24, save_path=None):
-        """지원자 수 변화 추세를 시각화합니다."""
+                           hours_back=24, save_path=None, show=True):
+        """지원자 수 변화 추세를 시각화합니다. show=False이면 저장 후 figure를 닫습니다."""
         df = self.get_time_series_data(university_code, department_name, hours_back=hours_back)
         
         if df.empty:
@@ -162,7 +217,8 @@ class TrendAnalyzer:
         # 지원자 수 추이
         for i, ((univ, dept, adm_type), group) in enumerate(groups):
             label = f"{univ}-{dept}-{adm_type}"
-            ax1.plot(group['snapshot_time'], group['applicant_count'], 
+            times, applicants = self.downsample_series(group, 'applicant_count')
+            ax1.plot(times.astype('datetime64[ms]'), applicants, 
                     marker='o', label=label, color=colors[i], linewidth=2, markersize=4)
         
         ax1.set_title(f'지원자 수 변화 추이 (최근 {hours_back}시간)', fontsize=14, fontweight='bold')
@@ -172,7 +228,8 @@ class TrendAnalyzer:
         
         # 경쟁률 추이
         for i, ((univ, dept, adm_type), group) in enumerate(groups):
-            ax2.plot(group['snapshot_time'], group['competition_ratio'], 
+            times, ratios = self.downsample_series(group, 'competition_ratio')
+            ax2.plot(times.astype('datetime64[ms]'), ratios, 
                     marker='s', color=colors[i], linewidth=2, markersize=4)
         
         ax2.set_title('경쟁률 변화 추이', fontsize=14, fontweight='bold')
@@ -189,13 +246,16 @@ class TrendAnalyzer:
         plt.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
             print(f"그래프가 {save_path}에 저장되었습니다.")
         
-        plt.show()
+        if show:
+            plt.show()
+        else:
+            plt.close(fig)
         return fig
     
-    def create_interactive_dashboard(self, hours_back=24, save_html=None):
+    def create_interactive_dashboard(self, hours_back=24, save_html=None, show=True):
         """인터랙티브 대시보드를 생성합니다."""
         df = self.get_time_series_data(hours_back=hours_back)
         
@@ -215,12 +275,14 @@ class TrendAnalyzer:
         colors = px.colors.qualitative.Set3
         
         # 1. 경쟁률 변화 추이
+        # numpy 배열(epoch 밀리초 + float32)로 전달하면 HTML에 base64 이진 배열로 기록됩니다.
         groups = df.groupby(['university_code', 'department_name', 'admission_type'])
         for i, ((univ, dept, adm_type), group) in enumerate(groups):
+            times, ratios = self.downsample_series(group, 'competition_ratio')
             fig.add_trace(
                 go.Scatter(
-                    x=group['snapshot_time'],
-                    y=group['competition_ratio'],
+                    x=times.astype(np.float64),
+                    y=ratios.astype(np.float32),
                     mode='lines+markers',
                     name=f"{univ}-{dept}",
                     line=dict(color=colors[i % len(colors)]),
@@ -231,10 +293,11 @@ class TrendAnalyzer:
         
         # 2. 지원자 수 변화
         for i, ((univ, dept, adm_type), group) in enumerate(groups):
+            times, applicants = self.downsample_series(group, 'applicant_count')
             fig.add_trace(
                 go.Scatter(
-                    x=group['snapshot_time'],
-                    y=group['applicant_count'],
+                    x=times.astype(np.float64),
+                    y=applicants.astype(np.int32),
                     mode='lines+markers',
                     name=f"{univ}-{dept}",
                     line=dict(color=colors[i % len(colors)]),
@@ -280,8 +343,8 @@ class TrendAnalyzer:
         )
         
         # x축, y축 레이블 추가
-        fig.update_xaxes(title_text="시간", row=1, col=1)
-        fig.update_xaxes(title_text="시간", row=1, col=2)
+        fig.update_xaxes(title_text="시간", type='date', row=1, col=1)
+        fig.update_xaxes(title_text="시간", type='date', row=1, col=2)
         fig.update_xaxes(title_text="학과", row=2, col=1)
         
         fig.update_yaxes(title_text="경쟁률", row=1, col=1)
@@ -292,7 +355,8 @@ class TrendAnalyzer:
             fig.write_html(save_html)
             print(f"인터랙티브 대시보드가 {save_html}에 저장되었습니다.")
         
-        fig.show()
+        if show:
+            fig.show()
         return fig
     
     def generate_trend_report(self, hours_back=24, save_path=None):
@@ -368,24 +432,47 @@ class TrendAnalyzer:
 
 def main():
     """메인 함수 - 사용 예시"""
-    analyzer = TrendAnalyzer()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='대학교 경쟁률 추세 분석')
+    parser.add_argument('--hours', type=int, default=24, help='분석 기간 (시간)')
+    parser.add_argument('--headless', action='store_true', 
+                       help='화면 출력 없이 차트를 병렬 렌더링 (서버용)')
+    parser.add_argument('--workers', type=int, help='headless 모드 워커 프로세스 수')
+    parser.add_argument('--output-dir', default='.', help='headless 모드 출력 디렉토리')
+    parser.add_argument('--force', action='store_true', help='데이터 변경이 없어도 다시 렌더링')
+    parser.add_argument('--partition-dir', help='월별 스냅샷 파티션 디렉토리 (파티션 DB 사용 시)')
+    args = parser.parse_args()
+    
+    analyzer = TrendAnalyzer(partition_dir=args.partition_dir)
     
     print("=== 대학교 경쟁률 추세 분석 ===")
     
+    if args.headless:
+        from chart_renderer import HeadlessChartRenderer
+        
+        os.makedirs(args.output_dir, exist_ok=True)
+        analyzer.generate_trend_report(hours_back=args.hours, 
+                                       save_path=os.path.join(args.output_dir, "trend_report.txt"))
+        renderer = HeadlessChartRenderer(analyzer.db_path, args.output_dir, args.workers,
+                                         partition_dir=args.partition_dir)
+        renderer.render(hours_back=args.hours, force=args.force)
+        return
+    
     # 1. 추세 분석 리포트 생성
-    analyzer.generate_trend_report(hours_back=24, save_path="trend_report.txt")
+    analyzer.generate_trend_report(hours_back=args.hours, save_path="trend_report.txt")
     
     # 2. 경쟁률 추세 그래프
     print("\\n경쟁률 추세 그래프 생성 중...")
-    analyzer.plot_competition_trend(hours_back=24, save_path="competition_trend.png")
+    analyzer.plot_competition_trend(hours_back=args.hours, save_path="competition_trend.png")
     
     # 3. 지원자 수 추세 그래프
     print("지원자 수 추세 그래프 생성 중...")
-    analyzer.plot_applicant_trend(hours_back=24, save_path="applicant_trend.png")
+    analyzer.plot_applicant_trend(hours_back=args.hours, save_path="applicant_trend.png")
     
     # 4. 인터랙티브 대시보드
     print("인터랙티브 대시보드 생성 중...")
-    analyzer.create_interactive_dashboard(hours_back=24, save_html="dashboard.html")
+    analyzer.create_interactive_dashboard(hours_back=args.hours, save_html="dashboard.html")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file